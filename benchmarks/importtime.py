@@ -0,0 +1,112 @@
+"""
+Measures the import time of scicheck and the modules that each import loads
+----------
+Usage: python -m benchmarks.importtime [--repeat N]
+
+Each import statement is run in fresh interpreters under `python -X importtime`,
+and the best time spent importing the modules that the statement loads (beyond
+those loaded by interpreter startup) is reported. Times depend on the machine, so
+the regression check is on the modules each import loads: an import fails its
+budget if it loads any module from its forbidden list (for example, if
+`import scicheck` loads a submodule, or a scalar checker module loads numpy or
+typing). Exits with status 1 if any import fails its budget.
+
+Bytecode is compiled before measuring, so that times do not include compilation.
+"""
+
+import argparse
+import compileall
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parents[1]
+
+# Modules that are slow to import, and are only needed by some checkers
+HEAVY = ["numpy", "typing", "asyncio", "concurrent.futures", "inspect"]
+SUBMODULES = [
+    "scicheck.numeric",
+    "scicheck.path",
+    "scicheck.ndarray",
+    "scicheck.type",
+    "scicheck.errors",
+    "scicheck.validator",
+    "scicheck.batch",
+]
+
+# (import statement, forbidden modules)
+CASES = [
+    ("import scicheck", [*HEAVY, "pathlib", *SUBMODULES]),
+    ("import scicheck.errors", [*HEAVY, "pathlib"]),
+    ("import scicheck.type", [*HEAVY, "pathlib"]),
+    ("import scicheck.numeric", [*HEAVY, "pathlib", "scicheck.path"]),
+    ("import scicheck.path", HEAVY),
+    ("import scicheck.ndarray", [*HEAVY, "pathlib"]),
+    ("from scicheck import compile", HEAVY),
+    ("from scicheck import Schema", HEAVY),
+    ("from scicheck import stream", HEAVY),
+]
+
+
+def run(statement: str, *options: str) -> subprocess.CompletedProcess:
+    "Runs Python code in a fresh interpreter that can import scicheck"
+    environment = os.environ | {"PYTHONPATH": str(ROOT)}
+    return subprocess.run(
+        [sys.executable, *options, "-c", statement],
+        capture_output=True,
+        text=True,
+        env=environment,
+        check=True,
+    )
+
+
+def _top_level(stderr: str) -> dict[str, int]:
+    "Parses importtime output. Returns the cumulative time of each top-level import"
+
+    # Lines are "import time: self | cumulative | name", and nested imports are
+    # indented. Modules imported by scicheck's __getattr__ appear at top level
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  ") and cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def import_time(statement: str, startup: set[str]) -> float:
+    """Returns the time spent importing the modules loaded by a statement, but not
+    by interpreter startup, in milliseconds"""
+    times = _top_level(run(statement, "-X", "importtime").stderr)
+    return sum(time for name, time in times.items() if name not in startup) / 1000
+
+
+def loaded(statement: str) -> set[str]:
+    "Returns the modules loaded by an import statement"
+    code = f"{statement}\nimport sys, json\nprint(json.dumps(list(sys.modules)))"
+    return set(json.loads(run(code).stdout))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    compileall.compile_dir(ROOT / "scicheck", quiet=1)
+    startup = set(_top_level(run("pass", "-X", "importtime").stderr))
+    failed = False
+    print(f"{'statement':<32} {'ms':>8}  forbidden modules loaded")
+    for statement, forbidden in CASES:
+        ms = min(import_time(statement, startup) for _ in range(args.repeat))
+        violations = sorted(set(forbidden) & loaded(statement))
+        failed = failed or bool(violations)
+        flag = f"  REGRESSION: {', '.join(violations)}" if violations else ""
+        print(f"{statement:<32} {ms:>8.2f}{flag}")
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Counts the filesystem metadata calls made by each scicheck.path checker
+----------
+Usage: python -m benchmarks.path_syscalls
+
+Each checker is run under wrappers that count calls to the os functions that
+issue metadata syscalls. The reported calls include resolution: with the default
+resolve=True, Path.resolve makes one lstat per path component before the check,
+so a check costs a single stat only with resolve=False. The calls made by
+resolution are also reported separately, and the budget of each checker is its
+resolution cost plus the calls of the check itself. Exits with status 1 if any
+checker exceeds its budget.
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from scicheck import path
+from scicheck.errors import PathError
+
+# The os functions that issue metadata syscalls
+COUNTED = ("stat", "lstat", "readlink", "scandir", "listdir", "access")
+
+
+@contextmanager
+def counting():
+    "Counts calls to metadata functions in the os module"
+
+    counts = {"calls": 0}
+    originals = {name: getattr(os, name) for name in COUNTED}
+
+    def wrap(function):
+        def counted(*args, **kwargs):
+            counts["calls"] += 1
+            return function(*args, **kwargs)
+
+        return counted
+
+    for name, function in originals.items():
+        setattr(os, name, wrap(function))
+    try:
+        yield counts
+    finally:
+        for name, function in originals.items():
+            setattr(os, name, function)
+
+
+def count(checker, input, **kwargs) -> tuple[int, int]:
+    """Returns the number of metadata calls a checker makes, and the number of those
+    made by resolving the path"""
+
+    with counting() as resolving:
+        Path(input).resolve()
+    with counting() as checking:
+        try:
+            checker(input, **kwargs)
+        except PathError:
+            pass
+    resolved = resolving["calls"] if kwargs.get("resolve", True) else 0
+    return checking["calls"], resolved
+
+
+def cases(root: Path):
+    "Returns (label, checker, input, kwargs, budget) for each benchmarked case"
+
+    file = root / "file.txt"
+    folder = root / "folder"
+    empty = root / "empty"
+    missing = root / "missing"
+    return [
+        ("existing_file (file)", path.existing_file, file, {}, 1),
+        ("existing_file (missing)", path.existing_file, missing, {}, 1),
+        ("existing_file (folder)", path.existing_file, folder, {}, 1),
+        ("existing_folder (folder)", path.existing_folder, folder, {}, 1),
+        ("existing_folder (missing)", path.existing_folder, missing, {}, 1),
+        ("new_file (missing)", path.new_file, missing, {}, 1),
+        ("new_file (file)", path.new_file, file, {}, 1),
+        ("new_file (file, exist_ok)", path.new_file, file, {"exist_ok": True}, 1),
+        ("new_folder (missing)", path.new_folder, missing, {}, 1),
+        ("new_folder (empty, exist_ok)", path.new_folder, empty, {"exist_ok": True}, 2),
+        ("new_folder (full, exist_ok)", path.new_folder, folder, {"exist_ok": True}, 2),
+        ("existing_file (unresolved)", path.existing_file, file, {"resolve": False}, 1),
+    ]
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as root:
+        root = Path(root)
+        (root / "file.txt").touch()
+        (root / "folder").mkdir()
+        (root / "folder" / "child.txt").touch()
+        (root / "empty").mkdir()
+
+        failed = False
+        print(f"{'checker':<32} {'calls':>5} {'resolve':>7} {'budget':>6}")
+        for label, checker, input, kwargs, budget in cases(root):
+            calls, resolved = count(checker, input, **kwargs)
+            budget += resolved
+            flag = "" if calls <= budget else "  REGRESSION"
+            failed = failed or calls > budget
+            print(f"{label:<32} {calls:>5} {resolved:>7} {budget:>6}{flag}")
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,419 @@
+"""
+Microbenchmarks and regression checks for the public scicheck checkers
+----------
+Usage:
+    python -m benchmarks.suite run [--filter TEXT] [--rounds N]
+    python -m benchmarks.suite save [--baseline FILE] [--filter TEXT] [--rounds N]
+    python -m benchmarks.suite compare [--baseline FILE] [--threshold RATIO]
+        [--floor REF] [--rounds N]
+
+`run` prints the time per call of every case, in nanoseconds and relative to a
+fixed reference workload. `save` writes the timings to the
+baseline file (benchmarks/baseline.json by default), which is committed so that
+overhead can be tracked across versions. `compare` reruns the cases and exits
+with status 1 if the relative time of any case is slower than its baseline by
+more than the threshold (0.3, i.e. 30%, by default), and by more than the noise
+floor (0.25 times the reference workload, by default). The floor keeps the
+jitter of the fastest cases, which is large relative to their time but small
+in absolute terms, from failing the check.
+
+Each case is timed in several rounds (3 by default), and its median relative
+time is reported, so that a single disturbed round does not move the result.
+Cases that regress are timed again before `compare` fails, and only fail if
+they regress in both runs.
+
+Each public checker in scicheck.numeric, scicheck.type, and scicheck.path is timed
+on its success and failure paths, and, where they apply, in strict and coercing
+mode and on a batch of inputs. Async checkers are run to completion in an event
+loop that is shared by their cases. Relative times are less sensitive to the
+machine than absolute times, but baselines should still be regenerated with `save`
+when changing machines.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import timeit
+from contextlib import closing
+from pathlib import Path
+
+from scicheck import ndarray, numeric, path, type
+from scicheck.batch import stream
+from scicheck.schema import Schema
+from scicheck.errors import ScicheckError
+
+BASELINE = Path(__file__).parent / "baseline.json"
+BATCH = 1000
+REPEAT = 15
+MINIMUM = 0.01
+ROUNDS = 3
+FLOOR = 0.25
+
+
+#####
+# Case builders
+#####
+
+
+def succeed(checker, input, **options):
+    "Times a checker on an input that passes validation"
+    return lambda: checker(input, **options)
+
+
+def fail(checker, input, **options):
+    "Times a checker on an input that fails validation, including the except"
+
+    def run():
+        try:
+            checker(input, **options)
+        except ScicheckError:
+            pass
+
+    return run
+
+
+def batch(checker, input, **options):
+    "Times a checker on a batch of copies of an input"
+    inputs = [input] * BATCH
+    return lambda: [checker(input, **options) for input in inputs]
+
+
+def awaited(checker, loop):
+    "Wraps an async checker, so that each call runs it to completion in a loop"
+    return lambda input, **options: loop.run_until_complete(checker(input, **options))
+
+
+#####
+# Cases
+#####
+
+
+def scalar_cases() -> dict:
+    "Returns the cases for the scalar checkers in scicheck.numeric and scicheck.type"
+
+    nan = float("nan")
+    cases = {}
+    numeric_cases = {
+        # checker: (valid, coercible, invalid, options for coercion)
+        "numeric": (numeric.numeric, 2.5, "2.5", "abc", {}),
+        "complex": (numeric.complex, 1j, 2.5, "abc", {"numeric_only": False}),
+        "float": (numeric.float, 2.5, 2, "abc", {"numeric_only": False}),
+        "integer": (numeric.integer, 2, 2.0, 2.5, {}),
+        "real": (numeric.real, 2.5, 2 + 0j, nan, {}),
+        "try_numeric": (numeric.try_numeric, 2.5, "2.5", "abc", {}),
+        "try_complex": (numeric.try_complex, 1j, 2.5, "abc", {"numeric_only": False}),
+        "try_float": (numeric.try_float, 2.5, 2, "abc", {"numeric_only": False}),
+        "try_integer": (numeric.try_integer, 2, 2.0, 2.5, {}),
+        "try_real": (numeric.try_real, 2.5, 2 + 0j, nan, {}),
+    }
+    for label, (checker, valid, coercible, invalid, options) in numeric_cases.items():
+        name = f"numeric.{label}"
+        cases[f"{name}[strict,success]"] = succeed(checker, valid, strict=True)
+        cases[f"{name}[strict,failure]"] = fail(checker, coercible, strict=True)
+        cases[f"{name}[coerce,success]"] = succeed(checker, coercible, **options)
+        cases[f"{name}[coerce,failure]"] = fail(checker, invalid, **options)
+        cases[f"{name}[coerce,batch]"] = batch(checker, coercible, **options)
+
+    comparison_cases = {
+        # checker: (valid, invalid, options)
+        "in_range": (numeric.in_range, 0.5, 1.5, {"min": 0, "max": 1}),
+        "positive": (numeric.positive, 0.5, -0.5, {}),
+        "less": (numeric.less, 0.5, 1.5, {"X": 1}),
+        "less_equal": (numeric.less_equal, 1, 1.5, {"X": 1}),
+        "greater": (numeric.greater, 1.5, 0.5, {"X": 1}),
+        "greater_equal": (numeric.greater_equal, 1, 0.5, {"X": 1}),
+        "negative": (numeric.negative, -0.5, 0.5, {}),
+    }
+    for label, (checker, valid, invalid, options) in comparison_cases.items():
+        cases[f"numeric.{label}[success]"] = succeed(checker, valid, **options)
+        cases[f"numeric.{label}[failure]"] = fail(checker, invalid, **options)
+        cases[f"numeric.{label}[batch]"] = batch(checker, valid, **options)
+
+    cases["type.type[success]"] = succeed(type.type, 1, types=(int, str))
+    cases["type.type[failure]"] = fail(type.type, 1.0, types=(int, str))
+    cases["type.type[batch]"] = batch(type.type, 1, types=(int, str))
+    cases["type.string[strict,success]"] = succeed(type.string, "a")
+    cases["type.string[strict,failure]"] = fail(type.string, 1)
+    cases["type.string[coerce,success]"] = succeed(type.string, 1, strict=False)
+    cases["type.string[coerce,batch]"] = batch(type.string, 1, strict=False)
+
+    schema = Schema({"dt": numeric.real, "tol": numeric.float, "label": type.string})
+    valid = {"dt": 1, "tol": 1e-6, "label": "run"}
+    invalid = {"dt": 1, "tol": "abc", "label": "run"}
+    cases["schema.Schema[success]"] = succeed(schema, valid)
+    cases["schema.Schema[failure]"] = fail(schema, invalid)
+    cases["schema.Schema[collect]"] = succeed(schema.validate, invalid, collect=True)
+    cases["schema.Schema[batch]"] = batch(schema, valid)
+
+    lines = ["2.5"] * BATCH
+    cases["batch.stream[items]"] = lambda: list(
+        stream(lines, numeric.float, numeric_only=False)
+    )
+    cases["batch.stream[chunks]"] = lambda: list(
+        stream(lines, numeric.float, chunk_size=100, numeric_only=False)
+    )
+    return cases
+
+
+def array_cases(root: Path) -> dict:
+    """Returns the cases for the array checkers, using files in a temporary folder.
+    Skipped when numpy is missing"""
+
+    try:
+        import numpy as np
+    except ImportError:
+        return {}
+
+    valid = np.linspace(0, 1, 1_000_000)
+    invalid = valid.copy()
+    invalid[-1] = np.nan
+    listed = valid[:BATCH].tolist()
+
+    cases = {}
+    for label in ["real_array", "float_array"]:
+        checker = getattr(numeric, label)
+        name = f"numeric.{label}"
+        cases[f"{name}[strict,success]"] = succeed(checker, valid, strict=True)
+        cases[f"{name}[strict,failure]"] = fail(checker, listed, strict=True)
+        cases[f"{name}[coerce,success]"] = succeed(checker, listed)
+        cases[f"{name}[coerce,failure]"] = fail(checker, invalid)
+
+    indexes = np.arange(1_000_000, dtype=float)
+    fractional = indexes + 0.5
+    integers = np.arange(1_000_000)
+    large = integers * 1000
+    checker = numeric.integer_array
+    name = "numeric.integer_array"
+    cases[f"{name}[strict,success]"] = succeed(checker, integers, strict=True)
+    cases[f"{name}[strict,failure]"] = fail(checker, indexes, strict=True)
+    cases[f"{name}[floats]"] = succeed(checker, indexes)
+    cases[f"{name}[failure]"] = fail(checker, fractional)
+    cases[f"{name}[dtype]"] = succeed(checker, integers, dtype="int32")
+    cases[f"{name}[dtype,failure]"] = fail(checker, large, dtype="int16")
+
+    numerals = [str(value) for value in listed]
+    checker = numeric.numeric_array
+    name = "numeric.numeric_array"
+    cases[f"{name}[strict,success]"] = succeed(checker, valid, strict=True)
+    cases[f"{name}[strict,failure]"] = fail(checker, listed, strict=True)
+    cases[f"{name}[strings]"] = succeed(checker, numerals)
+    cases[f"{name}[failure]"] = fail(checker, [*numerals, "x"])
+
+    file = root / "valid.npy"
+    corrupt = root / "invalid.npy"
+    np.save(file, valid)
+    np.save(corrupt, invalid)
+    checker = numeric.real_file
+    cases["numeric.real_file[success]"] = succeed(checker, file, min=0, max=1)
+    cases["numeric.real_file[failure]"] = fail(checker, corrupt)
+
+    checker = numeric.in_range
+    cases["numeric.in_range[array,success]"] = succeed(checker, valid, min=0, max=1)
+    cases["numeric.in_range[array,failure]"] = fail(checker, valid, min=0, max=0.5)
+    cases["numeric.positive[array,success]"] = succeed(numeric.positive, valid + 1)
+    cases["numeric.positive[array,failure]"] = fail(numeric.positive, valid)
+    cases["numeric.negative[array,success]"] = succeed(numeric.negative, valid - 2)
+    for label in ["less", "less_equal", "greater", "greater_equal"]:
+        checker = getattr(numeric, label)
+        X = 2 if label.startswith("less") else -1
+        cases[f"numeric.{label}[array,success]"] = succeed(checker, valid, X=X)
+        cases[f"numeric.{label}[array,failure]"] = fail(checker, valid, X=0.5)
+
+    options = dict(dtype="float64", ndim=1, contiguous=True)
+    cases["ndarray.array[success]"] = succeed(ndarray.array, valid, **options)
+    cases["ndarray.array[copy,failure]"] = fail(ndarray.array, valid[::2], **options)
+    return cases
+
+
+def path_cases(root: Path, loop: asyncio.AbstractEventLoop) -> dict:
+    """Returns the cases for scicheck.path, using files in a temporary folder. Async
+    checkers run in the event loop"""
+
+    file = root / "file.txt"
+    folder = root / "folder"
+    missing = root / "missing"
+    files = [root / f"file{k}.txt" for k in range(BATCH)]
+    for item in [file, *files]:
+        item.touch()
+    folder.mkdir()
+    (folder / "child.txt").touch()
+    contains = ["child.txt"]
+    missing_contents = ["child.txt", "missing.txt"]
+
+    cases = {
+        "path.path[strict,success]": succeed(path.path, file, strict=True),
+        "path.path[strict,failure]": fail(path.path, str(file), strict=True),
+        "path.path[coerce,success]": succeed(path.path, str(file)),
+        "path.path[coerce,failure]": fail(path.path, 5),
+        "path.path[unresolved]": succeed(path.path, str(file), resolve=False),
+        "path.try_path[coerce,success]": succeed(path.try_path, str(file)),
+        "path.try_path[coerce,failure]": succeed(path.try_path, 5),
+        "path.existing_file[success]": succeed(path.existing_file, file),
+        "path.existing_file[failure]": fail(path.existing_file, missing),
+        "path.existing_file[strict,success]": succeed(
+            path.existing_file, file, strict=True
+        ),
+        "path.existing_file[batch]": batch(path.existing_file, file),
+        "path.existing_folder[success]": succeed(path.existing_folder, folder),
+        "path.existing_folder[failure]": fail(path.existing_folder, file),
+        "path.existing_folder[contains]": succeed(
+            path.existing_folder, folder, contains=contains
+        ),
+        "path.existing_folder[contains,failure]": fail(
+            path.existing_folder, folder, contains=missing_contents
+        ),
+        "path.existing_folder[patterns]": succeed(
+            path.existing_folder, folder, patterns=["*.txt"]
+        ),
+        "path.new_file[success]": succeed(path.new_file, missing),
+        "path.new_file[failure]": fail(path.new_file, file),
+        "path.new_folder[success]": succeed(path.new_folder, missing),
+        "path.new_folder[failure]": fail(path.new_folder, folder, exist_ok=True),
+        "path.existing_files[batch]": succeed(path.existing_files, files),
+        "path.existing_files[failure]": fail(path.existing_files, [*files, missing]),
+        "path.existing_folders[batch]": succeed(path.existing_folders, [folder] * 10),
+    }
+
+    checkers = {
+        # checker: (valid, invalid)
+        "existing_file_async": (path.existing_file_async, file, missing),
+        "existing_folder_async": (path.existing_folder_async, folder, file),
+        "new_folder_async": (path.new_folder_async, missing, folder),
+        "existing_files_async": (path.existing_files_async, files, [*files, missing]),
+        "existing_folders_async": (path.existing_folders_async, [folder] * 10, [file]),
+    }
+    for label, (checker, valid, invalid) in checkers.items():
+        checker = awaited(checker, loop)
+        cases[f"path.{label}[success]"] = succeed(checker, valid)
+        cases[f"path.{label}[failure]"] = fail(checker, invalid)
+    return cases
+
+
+#####
+# Timing
+#####
+
+
+def reference():
+    "A fixed pure-Python workload used to normalize for the speed of the machine"
+    return sum(range(100))
+
+
+def _calibrate(function) -> tuple[timeit.Timer, int]:
+    "Returns a timer for a function, and a number of calls that takes MINIMUM seconds"
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < MINIMUM:
+        number *= 2
+    return timer, number
+
+
+def measure(function) -> tuple[float, float]:
+    """Returns the best time per call of a function and of the reference workload,
+    in nanoseconds. Their repeats are interleaved, so that both are timed under the
+    same machine load"""
+
+    timers = [_calibrate(function), _calibrate(reference)]
+    best = [float("inf")] * 2
+    for _ in range(REPEAT):
+        for k, (timer, number) in enumerate(timers):
+            best[k] = min(best[k], timer.timeit(number) / number)
+    return best[0] * 1e9, best[1] * 1e9
+
+
+def run(
+    filter: str | None, rounds: int = ROUNDS, names: list[str] | None = None
+) -> dict[str, dict[str, float]]:
+    """Times every case whose name contains the filter text (or every named case),
+    and reports the round with the median relative time. Timing each case against
+    the reference workload makes relative times robust to changes in machine speed
+    during and between runs"""
+
+    with (
+        tempfile.TemporaryDirectory() as root,
+        closing(asyncio.new_event_loop()) as loop,
+    ):
+        root = Path(root)
+        cases = scalar_cases() | array_cases(root) | path_cases(root, loop)
+        timings = {}
+        for name, function in cases.items():
+            if names is not None and name not in names:
+                continue
+            elif filter is None or filter in name:
+                times = []
+                for _ in range(rounds):
+                    ns, ref = measure(function)
+                    times.append((ns / ref, ns))
+                relative, ns = sorted(times)[len(times) // 2]
+                timings[name] = {"ns": round(ns, 1), "relative": round(relative, 3)}
+                line = f"{name:<48} {ns:>14,.0f} ns {relative:>12,.2f} x ref"
+                print(line, flush=True)
+    return timings
+
+
+def compare(
+    timings: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+    floor: float = FLOOR,
+) -> list[str]:
+    """Prints the change in the relative time of each case against the baseline.
+    Returns the names of the cases that regressed by more than the threshold, and
+    whose relative time increased by more than the noise floor"""
+
+    regressions = []
+    print(f"\n{'case':<48} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, current in timings.items():
+        current = current["relative"]
+        if name not in baseline:
+            print(f"{name:<48} {'(new)':>10} {current:>10,.2f}")
+            continue
+        before = baseline[name]["relative"]
+        change = current / before - 1
+        flag = ""
+        if change > threshold and current - before > floor:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<48} {before:>10,.2f} {current:>10,.2f} {change:>+8.0%}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("command", choices=["run", "save", "compare"])
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.3)
+    parser.add_argument("--floor", type=float, default=FLOOR)
+    parser.add_argument("--filter", default=None)
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    args = parser.parse_args(argv)
+
+    timings = run(args.filter, args.rounds)
+    if args.command == "save":
+        baseline = {}
+        if args.baseline.exists() and args.filter is not None:
+            baseline = json.loads(args.baseline.read_text())
+        baseline.update(timings)
+        text = json.dumps(dict(sorted(baseline.items())), indent=2)
+        args.baseline.write_text(text + "\n")
+    elif args.command == "compare":
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(timings, baseline, args.threshold, args.floor)
+
+        # Load spikes can outlast a round, so regressions are only reported if
+        # they persist when the regressed cases are timed again
+        if regressions:
+            print(f"\nRetiming {len(regressions)} case(s) that regressed\n")
+            timings = run(None, args.rounds, regressions)
+            regressions = compare(timings, baseline, args.threshold, args.floor)
+        if regressions:
+            count = len(regressions)
+            print(f"\n{count} case(s) regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
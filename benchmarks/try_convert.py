@@ -0,0 +1,53 @@
+"""
+Compares the failure path of the try_* functions with the raising checkers
+----------
+Usage: python -m benchmarks.try_convert
+
+Times each raising checker (wrapped in try/except) and its try_* counterpart on
+an input that fails validation, and prints the speedup of the non-raising path.
+"""
+
+import timeit
+
+from scicheck import numeric, path
+from scicheck.errors import ScicheckError
+
+NUMBER = 100_000
+
+# (label, raising checker, non-raising checker, failing input, options)
+CASES = [
+    ("numeric", numeric.numeric, numeric.try_numeric, "abc", {}),
+    ("complex", numeric.complex, numeric.try_complex, "abc", {"numeric_only": False}),
+    ("float", numeric.float, numeric.try_float, "abc", {"numeric_only": False}),
+    ("float (strict)", numeric.float, numeric.try_float, 1, {"strict": True}),
+    ("integer", numeric.integer, numeric.try_integer, "1.5", {"numeric_only": False}),
+    ("integer (float)", numeric.integer, numeric.try_integer, 1.5, {}),
+    ("real", numeric.real, numeric.try_real, "abc", {"numeric_only": False}),
+    ("real (nan)", numeric.real, numeric.try_real, float("nan"), {}),
+    ("path", path.path, path.try_path, 5, {"resolve": False}),
+]
+
+
+def raising(checker, input, options):
+    "Returns a function that runs a raising checker and swallows its error"
+
+    def run():
+        try:
+            checker(input, **options)
+        except ScicheckError:
+            pass
+
+    return run
+
+
+def main():
+    print(f"{'checker':<18} {'raising (us)':>12} {'try_* (us)':>12} {'speedup':>8}")
+    for label, checker, try_checker, input, options in CASES:
+        slow = timeit.timeit(raising(checker, input, options), number=NUMBER)
+        fast = timeit.timeit(lambda: try_checker(input, **options), number=NUMBER)
+        slow, fast = slow / NUMBER * 1e6, fast / NUMBER * 1e6
+        print(f"{label:<18} {slow:>12.3f} {fast:>12.3f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Compares the per-call overhead of @validate with hand-written checks
+----------
+Usage: python -m benchmarks.validate
+
+Times a function that validates its inputs with explicit scicheck calls, the
+same function decorated with @validate (via a spec and via annotations), and
+the function without any validation.
+"""
+
+import timeit
+from typing import Annotated
+
+from scicheck import numeric
+from scicheck.validator import validate
+
+NUMBER = 200_000
+REPEAT = 15
+
+
+def unchecked(x, dt, n):
+    return x * dt * n
+
+
+def handwritten(x, dt, n):
+    x = numeric.real(x, "x")
+    dt = numeric.float(dt, "dt")
+    n = numeric.integer(n, "n")
+    return x * dt * n
+
+
+@validate(x=numeric.real, dt=numeric.float, n=numeric.integer)
+def spec(x, dt, n):
+    return x * dt * n
+
+
+@validate
+def annotated(
+    x: Annotated[float, numeric.real],
+    dt: Annotated[float, numeric.float],
+    n: Annotated[int, numeric.integer],
+):
+    return x * dt * n
+
+
+def time(function, *args, **kwargs) -> float:
+    "Returns the best time per call in nanoseconds"
+    timer = timeit.Timer(lambda: function(*args, **kwargs))
+    return min(timer.repeat(repeat=REPEAT, number=NUMBER)) / NUMBER * 1e9
+
+
+def main():
+    print(f"{'function':<14} {'positional (ns)':>16} {'keyword (ns)':>14}")
+    for function in [unchecked, handwritten, spec, annotated]:
+        positional = time(function, 2, 0.5, 3)
+        keyword = time(function, x=2, dt=0.5, n=3)
+        print(f"{function.__name__:<14} {positional:>16,.0f} {keyword:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Input validation for scientific codes
+----------
+Submodules:
+    numeric: Checks numeric scalars and arrays
+    type: Checks types and strings
+    path: Checks file and folder paths
+    ndarray: Checks the dtype, shape, and layout of numpy arrays without copying
+    errors: The errors raised by scicheck
+    validator: Compiles reusable validators and the @validate decorator
+    schema: Validates records field by field
+    batch: Validates streams and large batches
+    report: Compact reports of bulk validation failures
+    cache: Opt-in caching of path resolution and validation
+    policy: Sampled or trusted checking for hot loops
+    instrument: Opt-in call counts, failure counts, and timings for the checkers
+
+Submodules, and the functions exported here, are imported on first access, so
+`import scicheck` is cheap, and each program only pays for the checkers it uses.
+"""
+
+from importlib import import_module
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from scicheck import (
+        batch,
+        cache,
+        errors,
+        instrument,
+        ndarray,
+        numeric,
+        path,
+        policy,
+        report,
+        schema,
+        type,
+        validator,
+    )
+    from scicheck.batch import parallel, stream
+    from scicheck.ndarray import array
+    from scicheck.report import ValidationReport
+    from scicheck.schema import Schema
+    from scicheck.validator import compile, validate
+
+# Lazily imported submodules, and the submodule of each exported function
+_MODULES = (
+    "batch",
+    "cache",
+    "errors",
+    "instrument",
+    "ndarray",
+    "numeric",
+    "path",
+    "policy",
+    "report",
+    "schema",
+    "type",
+    "validator",
+)
+_EXPORTS = {
+    "array": "ndarray",
+    "compile": "validator",
+    "validate": "validator",
+    "Schema": "schema",
+    "stream": "batch",
+    "parallel": "batch",
+    "ValidationReport": "report",
+}
+
+__all__ = [*_MODULES, *_EXPORTS]
+
+
+def __getattr__(name: str):
+    "Imports submodules and exported functions on first access"
+
+    if name in _MODULES:
+        value = import_module(f"scicheck.{name}")
+    elif name in _EXPORTS:
+        module = import_module(f"scicheck.{_EXPORTS[name]}")
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module 'scicheck' has no attribute {name!r}")
+
+    # Later accesses find the value directly, without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
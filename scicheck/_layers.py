@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from importlib import import_module
+from types import FunctionType
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from types import ModuleType
+    from typing import Callable, Optional
+
+# The checker modules whose functions can be wrapped
+MODULES = ("numeric", "path", "type")
+
+# The layers that wrap checkers, from innermost to outermost. Instrumentation is
+# inside policies, so that skipped checks are not recorded
+_ORDER = ("instrument", "policy")
+
+# Maps (module, checker) to the original function of each wrapped checker, and
+# each layer to the wrapper factory of each checker that it wraps
+_originals: dict[tuple[str, str], FunctionType] = {}
+_wrappers: dict[str, dict[tuple[str, str], Callable]] = {layer: {} for layer in _ORDER}
+
+
+def checkers(module: ModuleType) -> dict[str, FunctionType]:
+    """Returns the original functions of the public checkers defined by a module.
+    Async checkers run the blocking checkers in threads, so are not included"""
+
+    output = {}
+    for name, value in vars(module).items():
+        if name.startswith("_") or not isinstance(value, FunctionType):
+            continue
+        value = _originals.get((module.__name__, name), value)
+        if value.__module__ == module.__name__ and not value.__code__.co_flags & 0x80:
+            output[name] = value  # 0x80 is CO_COROUTINE
+    return output
+
+
+def wrap(
+    layer: str,
+    module_name: str,
+    name: str,
+    wrapper: Optional[Callable[[FunctionType], Callable]],
+) -> None:
+    """
+    Sets (or removes, when wrapper is None) a layer's wrapper of a checker
+    ----------
+    Each layer's wrapper factory is called on the output of the layer inside it,
+    starting from the original function, and the result is bound in the module.
+    Rebuilding the whole stack means that layers can be added and removed in any
+    order without capturing each other's wrappers.
+    """
+
+    module = import_module(f"scicheck.{module_name}")
+    key = (module.__name__, name)
+    original = _originals.get(key) or getattr(module, name)
+    if wrapper is None:
+        _wrappers[layer].pop(key, None)
+    else:
+        _wrappers[layer][key] = wrapper
+
+    function = original
+    for each in _ORDER:
+        factory = _wrappers[each].get(key)
+        if factory is not None:
+            function = factory(function)
+
+    if function is original:
+        _originals.pop(key, None)
+    else:
+        _originals[key] = original
+    setattr(module, name, function)
@@ -16,9 +16,6 @@ def strlist(strings: list[str]) -> str:
         head = ", ".join(strings[:-1])
         return ", or ".join([head, strings[-1]])
 
-def message(name: str, info: str) -> str:
-    return f"{name} {info}"
-
 
 #####
 # Type
@@ -40,6 +37,30 @@ def not_type(name: str, description: str, types: tuple[type] = None) -> str:
     return f"{name} must be {description}"
 
 
+#####
+# Array
+#####
+
+def _shape(shape):
+    dimensions = ["any" if length is None else str(length) for length in shape]
+    if len(dimensions) == 1:
+        return f"({dimensions[0]},)"
+    return f"({', '.join(dimensions)})"
+
+def wrong_ndim(name, ndim, actual):
+    return f"{name} must have {ndim} dimensions, but it has {actual}"
+
+def wrong_shape(name, shape, actual):
+    return f"{name} must have shape {_shape(shape)}, but it has shape {_shape(actual)}"
+
+def copy_required(name, description):
+    description = _description(description)
+    return (
+        f"{name} can only be converted to {description} by copying it, but "
+        "copy='never'"
+    )
+
+
 #####
 # Path
 #####
@@ -63,8 +84,36 @@ def exists(name, path):
 def not_empty(name, path):
     message = f"{name} is a folder, but the folder is not empty"
     return _path(path, message)
+
+def missing_content(name, item, path):
+    message = f"{name} must contain {item!r}, but it does not exist"
+    return _path(path, message)
+
+def wrong_content(name, item, type, path):
+    message = f"{name} must contain {item!r} as a {type}"
+    return _path(path, message)
+
+def unmatched_pattern(name, pattern, path):
+    message = f"{name} must contain an entry matching {pattern!r}"
+    return _path(path, message)
+
+def too_few_files(name, minimum, path):
+    message = f"{name} must contain at least {minimum} files"
+    return _path(path, message)
     
 
+#####
+# Schema
+#####
+
+def missing_field(name, field):
+    return f"{name} is missing the required field {field!r}"
+
+def unknown_fields(name, fields):
+    fields = strlist([repr(field) for field in fields])
+    return f"{name} has unsupported fields: {fields}"
+
+
 #####
 # Numeric
 #####
@@ -72,8 +121,53 @@ def not_empty(name, path):
 def not_integer(input, name):
     return f"{name} ({input}) is not an integer"
 
+def element_not_integer(name, index, value):
+    return (
+        f"{name} cannot be converted to an array of integers, because element "
+        f"{index} ({value}) is not an integer"
+    )
+
+def element_out_of_range(name, index, value, dtype):
+    return (
+        f"{name} cannot be converted to an array of {dtype}, because element "
+        f"{index} ({value}) is outside the range of {dtype}"
+    )
+
 def cannot_convert_complex(input, name, description):
     return f"{name} {input} is complex-valued, so cannot be converted to {description}"
 
 def cannot_be(name, description):
-    return f"{name} cannot be {description}"
\ No newline at end of file
+    return f"{name} cannot be {description}"
+
+def cannot_contain(name, description, index):
+    return f"{name} cannot contain {description} elements, but element {index} is {description}"
+
+def not_compared(name, description, bound, value):
+    return f"{name} must be {description} {bound}, but it is {value}"
+
+def element_not_compared(name, description, bound, index, value):
+    return f"{name} must be {description} {bound}, but element {index} is {value}"
+
+def not_numeral(name, index, value, description):
+    return (
+        f"{name} cannot be converted to {description}, because element {index} "
+        f"({value!r}) is not a number"
+    )
+
+def file_element(name, description, index, offset):
+    return (
+        f"{name} cannot contain {description} elements, but element {index} "
+        f"(byte offset {offset}) is {description}"
+    )
+
+def file_bound(name, description, bound, index, offset, value):
+    return (
+        f"{name} must be {description} {bound}, but element {index} "
+        f"(byte offset {offset}) is {value}"
+    )
+
+def complex_element(name, index, value, description):
+    return (
+        f"{name} cannot be converted to {description}, because element {index} "
+        f"({value}) is complex-valued"
+    )
\ No newline at end of file
@@ -0,0 +1,437 @@
+
+from __future__ import annotations
+
+import os
+from functools import partial
+from itertools import islice
+from types import FunctionType
+
+from scicheck.errors import ScicheckError
+from scicheck.report import ValidationReport
+from scicheck.schema import Schema
+from scicheck.validator import compile
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable, Iterator, Literal, Optional
+
+    OnError = Literal["raise", "skip", "collect", "report"]
+    Errors = dict[int, ScicheckError] | ValidationReport
+
+_ON_ERROR = ("raise", "skip", "collect", "report")
+_NO_OPTIONS = "checker options are only supported for scicheck checker functions"
+
+
+#####
+# Utilities
+#####
+
+
+def _check_options(chunk_size: Optional[int], on_error: str):
+    "Checks the options shared by the batch validators"
+    if on_error not in _ON_ERROR:
+        allowed = ", ".join(repr(option) for option in _ON_ERROR)
+        raise ValueError(f"on_error must be one of {allowed}, but it is {on_error!r}")
+    if chunk_size is not None and (
+        not isinstance(chunk_size, int) or chunk_size < 1
+    ):
+        raise ValueError(f"chunk_size must be a positive int, but it is {chunk_size!r}")
+
+
+def _compile(
+    checker: Callable, name: str, options: dict[str, Any]
+) -> tuple[Callable[[Any], Any], Callable]:
+    """Returns the compiled single-input validator for a checker, and a function
+    that rebuilds the error for an invalid item with the item's index"""
+
+    # The compiled validator is shared by every item, so item names are only
+    # formatted on the failure path, by rerunning the checker on the invalid item
+    # with the name "{name}[{index}]"
+    if isinstance(checker, Schema):
+        if options:
+            raise TypeError(_NO_OPTIONS)
+
+        def relabel(input: Any, index: int, error: ScicheckError) -> ScicheckError:
+            label = f"{name}[{index}]"
+            schema = Schema(
+                checker.fields,
+                label,
+                optional=checker.optional,
+                allow_extra=checker.allow_extra,
+                _prefix=f"{label}.",
+            )
+            return _rerun(schema, input, error)
+
+        return checker, relabel
+
+    elif isinstance(checker, FunctionType) and not hasattr(checker, "fallback"):
+
+        def relabel(input: Any, index: int, error: ScicheckError) -> ScicheckError:
+            return _rerun(
+                partial(checker, name=f"{name}[{index}]", **options), input, error
+            )
+
+        return compile(checker, name, **options), relabel
+
+    # Validators from `compile` and other callables have their names bound, so
+    # their errors are tagged with the index instead
+    if options:
+        raise TypeError(_NO_OPTIONS)
+
+    def relabel(input: Any, index: int, error: ScicheckError) -> ScicheckError:
+        error.index = index
+        return error
+
+    return checker, relabel
+
+
+def _rerun(check: Callable, input: Any, error: ScicheckError) -> ScicheckError:
+    "Returns the error from rerunning a check on an invalid input"
+    try:
+        check(input)
+    except ScicheckError as relabelled:
+        return relabelled
+    return error
+
+
+def _field_value(record: Any, field: str) -> Any:
+    "Returns the value of a (possibly nested) field of a record, if it has one"
+    try:
+        for key in field.split("."):
+            record = record[key]
+        return record
+    except Exception:
+        return None
+
+
+def _recorder(
+    on_error: str, checker: Callable, name: str, relabel: Callable, errors: Any
+) -> Callable:
+    """Returns the function that handles each invalid item. It is called outside
+    of except blocks, so that raised errors are not chained to caught errors"""
+
+    if on_error == "raise":
+        def record(input: Any, index: int, error: ScicheckError):
+            raise relabel(input, index, error)
+
+    elif on_error == "skip":
+        def record(input: Any, index: int, error: ScicheckError):
+            pass
+
+    elif on_error == "collect":
+        def record(input: Any, index: int, error: ScicheckError):
+            errors[index] = relabel(input, index, error)
+
+    # Reports record every failed field of an invalid record
+    elif isinstance(checker, Schema):
+        def record(input: Any, index: int, error: ScicheckError):
+            failures = {}
+            checker._collect(input, failures)
+            for field, error in failures.items():
+                errors.add(index, field, error, _field_value(input, field))
+
+    # Reports rebuild item names from the index, so errors are not relabelled
+    else:
+        def record(input: Any, index: int, error: ScicheckError):
+            errors.add(index, name, error, input, indexed=True)
+
+    return record
+
+
+def _errors(on_error: str) -> Errors:
+    "Returns an empty container for the errors of a batch"
+    return ValidationReport() if on_error == "report" else {}
+
+
+def _chunks(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    "Splits an iterable into lists of at most size items, without materializing it"
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+#####
+# Streams
+#####
+
+
+class Stream:
+    """
+    An iterator over the validated items of a stream
+    ----------
+    Iterates over the validated values (or chunks of values) of a stream. When the
+    stream collects errors, `errors` maps the index of each invalid item to its
+    error. When the stream reports errors, `errors` is a ValidationReport. Either
+    grows as the stream is consumed.
+    """
+
+    __slots__ = ("errors", "_iterator")
+
+    def __init__(self, iterator: Iterator[Any], errors: Errors):
+        self.errors = errors
+        self._iterator = iterator
+
+    # Loops iterate over the generator directly, avoiding a Python-level __next__
+    def __iter__(self) -> Iterator[Any]:
+        return self._iterator
+
+    def __next__(self) -> Any:
+        return next(self._iterator)
+
+
+def _items(iterable, check, record, start=0) -> Iterator[Any]:
+    "Validates and yields items one at a time"
+
+    for index, input in enumerate(iterable, start):
+        try:
+            value = check(input)
+        except ScicheckError as caught:
+            error = caught
+        else:
+            yield value
+            continue
+        record(input, index, error)
+
+
+def _chunk(chunk, start, check, record) -> list[Any]:
+    "Validates a list of items, whose first item is at index start"
+
+    # Valid chunks are checked in a single comprehension. A chunk with an
+    # invalid item is rechecked item by item, to locate and handle its errors
+    try:
+        return [check(input) for input in chunk]
+    except ScicheckError:
+        pass
+    return list(_items(chunk, check, record, start))
+
+
+def _chunked(iterable, size, check, record) -> Iterator[list]:
+    "Validates and yields lists of at most size items"
+
+    start = 0
+    for chunk in _chunks(iterable, size):
+        yield _chunk(chunk, start, check, record)
+        start += len(chunk)
+
+
+def stream(
+    iterable: Iterable[Any],
+    checker: Callable,
+    name: str = "input",
+    *,
+    chunk_size: Optional[int] = None,
+    on_error: OnError = "raise",
+    **options: Any,
+) -> Stream:
+    """
+    Lazily validates the items of an iterable
+    ----------
+    stream(iterable, checker)
+    stream(iterable, checker, name, **options)
+    Returns an iterator that validates each item of an iterable as it is consumed,
+    so the input is never materialized. The checker may be a scicheck checker
+    function (such as `scicheck.numeric.float`), which is compiled once with the
+    options, a validator from `scicheck.validator.compile`, or a
+    `scicheck.schema.Schema`. Error messages name each item as "{name}[{index}]",
+    where index is the position of the item in the iterable, and the fields of a
+    Schema as "{name}[{index}].{field}". Validators from `compile` have their
+    names bound, so their errors are instead given an `index` attribute.
+
+    stream(..., *, chunk_size)
+    Yields lists of at most chunk_size validated values, rather than single values.
+    Chunks without invalid items are validated in a single comprehension.
+
+    stream(..., *, on_error='raise')
+    stream(..., *, on_error='skip')
+    stream(..., *, on_error='collect')
+    stream(..., *, on_error='report')
+    Sets what happens to invalid items. "raise" (default) raises the error from
+    the iterator. "skip" drops invalid items, so chunks may be shorter than
+    chunk_size. "collect" also drops invalid items, and records their errors in
+    the `errors` dict of the returned Stream, keyed by item index. "report" drops
+    invalid items, and records their failures in a compact
+    `scicheck.report.ValidationReport` as the `errors` of the Stream, which builds
+    exceptions only on request. Reports record every invalid field of a record
+    validated by a Schema.
+    ----------
+    Inputs:
+        iterable: The items being validated
+        checker: The checker used to validate each item
+        name: A name for the stream of items
+        chunk_size: The number of values in each yielded list
+        on_error: "raise", "skip", "collect", or "report"
+        **options: Options for a scicheck checker function
+
+    Outputs:
+        Stream: An iterator over the validated values or chunks
+
+    Raises:
+        ScicheckError: The error for the first invalid item, when on_error="raise"
+    """
+
+    _check_options(chunk_size, on_error)
+    check, relabel = _compile(checker, name, options)
+    errors = _errors(on_error)
+    record = _recorder(on_error, checker, name, relabel, errors)
+    if chunk_size is None:
+        iterator = _items(iterable, check, record)
+    else:
+        iterator = _chunked(iterable, chunk_size, check, record)
+    return Stream(iterator, errors)
+
+
+#####
+# Parallel
+#####
+
+# Chunks smaller than this cost more to send to a worker than to validate
+_MINIMUM_CHUNK = 1024
+
+# The number of chunks per worker when chunks are sized automatically, which
+# balances the load when some chunks are slower than others
+_CHUNKS_PER_WORKER = 4
+
+
+def _work(checker, name, options, on_error, start, chunk):
+    "Validates a chunk in a worker process. Returns the values and errors"
+    check, relabel = _compile(checker, name, options)
+    errors = _errors(on_error)
+    record = _recorder(on_error, checker, name, relabel, errors)
+    values = _chunk(chunk, start, check, record)
+    return values, errors
+
+
+def parallel(
+    inputs: Iterable[Any],
+    checker: Callable,
+    name: str = "input",
+    *,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    on_error: OnError = "raise",
+    **options: Any,
+) -> list[Any] | tuple[list[Any], Errors]:
+    """
+    Validates a large batch of inputs in a pool of worker processes
+    ----------
+    parallel(inputs, checker)
+    parallel(inputs, checker, name, **options)
+    Splits the inputs into chunks, validates the chunks in a ProcessPoolExecutor,
+    and returns the validated values in input order. The checker and options are
+    sent to the workers, and compiled once per chunk, so the checker must be
+    picklable: scicheck checker functions, module-level functions, and
+    `scicheck.schema.Schema` objects are supported. Functions are called like the
+    scicheck checkers, as function(input, name=..., **options), so module-level
+    functions must accept a name keyword. Validators from
+    `scicheck.validator.compile` are closures, so pass their checker function and
+    options instead.
+
+    Error messages name each item as "{name}[{index}]", where index is the
+    position of the item in the full batch, and the fields of a Schema as
+    "{name}[{index}].{field}". Errors from other picklable callables are given an
+    `index` attribute instead.
+
+    Batches that fit in a single chunk are validated in the calling process, since
+    starting workers would cost more than the validation.
+
+    parallel(..., *, workers)
+    parallel(..., *, chunk_size)
+    Sets the number of worker processes (default: the number of CPUs), and the
+    number of inputs per chunk. By default, chunks are sized so that each worker
+    receives about 4 chunks, and hold at least 1024 inputs.
+
+    parallel(..., *, on_error='raise')
+    parallel(..., *, on_error='skip')
+    parallel(..., *, on_error='collect')
+    parallel(..., *, on_error='report')
+    "raise" (default) raises the error for the first invalid input, in input
+    order, with its original error class. "skip" drops invalid inputs. "collect"
+    returns a (values, errors) tuple, where errors maps the index of each invalid
+    input to its error. "report" returns a (values, report) tuple, where report
+    is a compact ValidationReport, which is much cheaper to send back from the
+    workers than exception objects. Results are deterministic, regardless of the
+    order in which the workers finish.
+    ----------
+    Inputs:
+        inputs: The inputs being validated
+        checker: The picklable checker used to validate each input
+        name: A name for the batch of inputs
+        workers: The number of worker processes
+        chunk_size: The number of inputs sent to a worker at a time
+        on_error: "raise", "skip", "collect", or "report"
+        **options: Options for a scicheck checker function
+
+    Outputs:
+        list: The validated values
+        dict[int, ScicheckError] | ValidationReport: The errors for invalid
+            inputs, when collecting or reporting
+
+    Raises:
+        ScicheckError: The error for the first invalid input, when on_error="raise"
+    """
+
+    _check_options(chunk_size, on_error)
+    if hasattr(checker, "fallback"):
+        raise TypeError(
+            "Compiled validators cannot be sent to worker processes. Pass the "
+            "checker function and its options instead"
+        )
+
+    # Size the chunks
+    if not isinstance(inputs, (list, tuple)):
+        inputs = list(inputs)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = -(-len(inputs) // (workers * _CHUNKS_PER_WORKER))
+        chunk_size = max(chunk_size, _MINIMUM_CHUNK)
+    starts = range(0, len(inputs), chunk_size)
+
+    # Small batches are validated in this process
+    if workers == 1 or len(starts) <= 1:
+        results = [_work(checker, name, options, on_error, 0, inputs)]
+    else:
+        results = _map(
+            inputs, starts, chunk_size, workers, checker, name, options, on_error
+        )
+
+    # Executor.map returns chunks in input order, and errors are keyed by index
+    values = []
+    errors = _errors(on_error)
+    for chunk_values, chunk_errors in results:
+        values += chunk_values
+        if on_error == "report":
+            errors.extend(chunk_errors)
+        else:
+            errors.update(chunk_errors)
+    if on_error in ("collect", "report"):
+        return values, errors
+    return values
+
+
+def _map(inputs, starts, chunk_size, workers, checker, name, options, on_error):
+    "Validates the chunks in worker processes, and returns their results in order"
+
+    # Imported on first use, since concurrent.futures is slow to import
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = (inputs[start : start + chunk_size] for start in starts)
+    count = len(starts)
+    executor = ProcessPoolExecutor(max_workers=min(workers, count))
+    try:
+        return list(
+            executor.map(
+                _work,
+                [checker] * count,
+                [name] * count,
+                [options] * count,
+                [on_error] * count,
+                starts,
+                chunks,
+            )
+        )
+
+    # The first error in input order is raised once the chunks before it finish.
+    # Chunks that have not started are cancelled
+    finally:
+        executor.shutdown(cancel_futures=True)
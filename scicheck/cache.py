@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+
+from scicheck import path as path_module
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Hashable, Iterator, Optional
+
+
+class PathCache:
+    """
+    A bounded cache of validated paths
+    ----------
+    PathCache()
+    PathCache(maxsize)
+    PathCache(maxsize, ttl)
+    Maps (checker kind, input, working directory, options) keys to the paths
+    returned by successful path checks. The working directory is None for
+    absolute inputs. The least recently used entry is evicted when the cache holds
+    more than maxsize entries, and entries expire ttl seconds after they were
+    stored. Failed checks are never cached, so paths that are created later are
+    found by the next check.
+    ----------
+    Inputs:
+        maxsize: The maximum number of cached paths
+        ttl: The number of seconds that entries stay valid, or None for no limit
+
+    Outputs:
+        PathCache: An empty cache
+    """
+
+    __slots__ = ("maxsize", "ttl", "hits", "misses", "evictions", "_entries", "_lock")
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 1:
+            raise ValueError(f"maxsize must be a positive int, but it is {maxsize!r}")
+        if ttl is not None and not ttl > 0:
+            raise ValueError(f"ttl must be a positive number or None, but it is {ttl!r}")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[Path, float | None]] = OrderedDict()
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"PathCache({len(self)}/{self.maxsize} paths)"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Path | None:
+        "Returns the cached path for a key, or None if it is missing or expired"
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                path, expires = entry
+                if expires is None or monotonic() < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return path
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, path: Path) -> None:
+        "Caches the path for a key, evicting the least recently used entry if full"
+        expires = None if self.ttl is None else monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (path, expires)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, input: Any = None) -> int:
+        """
+        Removes cached paths
+        ----------
+        cache.invalidate()
+        Removes every cached path.
+
+        cache.invalidate(input)
+        Removes the entries for a path, for every checker kind. Relative inputs
+        are relative to the current working directory. Matches entries whose
+        validated path, or input within its working directory, is the path once
+        symlinks are resolved.
+        ----------
+        Inputs:
+            input: The path to remove, as a str or pathlib.Path
+
+        Outputs:
+            int: The number of removed entries
+        """
+
+        with self._lock:
+            if input is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            # Both sides are made absolute within their working directory, and
+            # resolve symlinks, so that a path matches entries checked via a
+            # symlink, and the reverse
+            input = os.path.realpath(input)
+            keys = []
+            for key, (path, _) in self._entries.items():
+                cwd = key[2] or ""
+                for item in (path, key[1]):
+                    if os.path.realpath(os.path.join(cwd, item)) == input:
+                        keys.append(key)
+                        break
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> dict[str, int | float | None]:
+        "Returns the hits, misses, evictions, size, maxsize, and ttl of the cache"
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+        }
+
+
+#####
+# Working directory
+#####
+
+# Relative inputs are keyed on the working directory, which path checks read once
+# rather than on every lookup. While a cache is installed, os.chdir is wrapped to
+# clear the stored directory
+_chdir = os.chdir
+
+
+def _cleared_chdir(path: Any) -> None:
+    "Changes the working directory, and clears the directory of cache keys"
+    try:
+        _chdir(path)
+    finally:
+        path_module._cwd = None
+
+
+def _watch_chdir(watch: bool) -> None:
+    "Wraps (or restores) os.chdir, and clears the directory of cache keys"
+    global _chdir
+    path_module._cwd = None
+    if watch and os.chdir is not _cleared_chdir:
+        _chdir = os.chdir
+        os.chdir = _cleared_chdir
+    elif not watch and os.chdir is _cleared_chdir:
+        os.chdir = _chdir
+
+
+#####
+# Enabling
+#####
+
+
+def enable(maxsize: int = 1024, ttl: Optional[float] = None) -> PathCache:
+    """
+    Caches the results of path resolution and validation
+    ----------
+    enable()
+    enable(maxsize)
+    enable(maxsize, ttl)
+    Installs a new PathCache, which is used by `scicheck.path.path` (when
+    resolving), `existing_file`, and `existing_folder`. Checks of a str or
+    pathlib.Path input that was validated before, by the same checker with the
+    same options, return the cached path without any filesystem calls.
+
+    Cached checks do not notice paths that were deleted or replaced after they
+    were validated. Use a ttl to bound how stale results can be, or call
+    `invalidate` after changing the filesystem.
+
+    Relative inputs are keyed on the working directory, which is read once. While
+    a cache is installed, os.chdir is wrapped so that the working directory is
+    read again after it changes. Changes that bypass os.chdir (such as a
+    reference to chdir taken before the cache was enabled) are not noticed.
+    ----------
+    Inputs:
+        maxsize: The maximum number of cached paths
+        ttl: The number of seconds that entries stay valid, or None for no limit
+
+    Outputs:
+        PathCache: The installed cache
+    """
+
+    path_module._cache = PathCache(maxsize, ttl)
+    _watch_chdir(True)
+    return path_module._cache
+
+
+def disable() -> None:
+    "Stops caching path checks and discards the cache"
+    path_module._cache = None
+    _watch_chdir(False)
+
+
+def current() -> PathCache | None:
+    "Returns the installed cache, or None if path checks are not cached"
+    return path_module._cache
+
+
+@contextmanager
+def cached(maxsize: int = 1024, ttl: Optional[float] = None) -> Iterator[PathCache]:
+    """
+    Caches path checks within a with block
+    ----------
+    with cached() as cache:
+    with cached(maxsize, ttl) as cache:
+    Installs a new cache for the block, and restores the previous cache (or no
+    cache) afterwards. The cache, and its stats, remain usable after the block.
+    ----------
+    Inputs:
+        maxsize: The maximum number of cached paths
+        ttl: The number of seconds that entries stay valid, or None for no limit
+
+    Outputs:
+        PathCache: The cache used within the block
+    """
+
+    previous = path_module._cache
+    cache = enable(maxsize, ttl)
+    try:
+        yield cache
+    finally:
+        path_module._cache = previous
+        _watch_chdir(previous is not None)
+
+
+def invalidate(input: Any = None) -> int:
+    "Removes a path (or every path) from the installed cache. See PathCache.invalidate"
+    cache = path_module._cache
+    return 0 if cache is None else cache.invalidate(input)
+
+
+def stats() -> dict[str, int | float | None] | None:
+    "Returns the stats of the installed cache, or None if path checks are not cached"
+    cache = path_module._cache
+    return None if cache is None else cache.stats()
@@ -1,4 +1,14 @@
 
+from scicheck.errors.array import (
+    ArrayError,
+    ArrayTypeError,
+    ArrayValueError,
+    CannotConvertToArray,
+    CopyRequiredError,
+    NdimError,
+    NotArrayError,
+    ShapeError,
+)
 from scicheck.errors.base import (
     CannotConvertToType,
     NotTypeError,
@@ -39,9 +49,11 @@ from scicheck.errors.path import (
     FileExistsError,
     FileNotFoundError,
     FilePathError,
+    FolderContentError,
     FolderExistsError,
     FolderNotFoundError,
     FolderPathError,
+    MissingContentError,
     NotFileError,
     NotFolderError,
     NotPathError,
@@ -50,7 +62,15 @@ from scicheck.errors.path import (
     PathNotFoundError,
     PathTypeError,
     PathValueError,
-    FolderNotEmpty
+    FolderNotEmpty,
+    TooFewFiles,
+)
+from scicheck.errors.schema import (
+    MissingFieldError,
+    NotRecordError,
+    SchemaError,
+    SchemaValueError,
+    UnknownFieldError,
 )
 from scicheck.errors.string import (
     CannotConvertToString,
@@ -0,0 +1,46 @@
+from scicheck.errors.base import (
+    CannotConvertToType,
+    NotTypeError,
+    ScicheckError,
+    TypeError,
+    ValueError,
+)
+
+#####
+# Bases
+#####
+
+
+class ArrayError(ScicheckError):
+    "When an array input is not valid"
+
+class ArrayTypeError(ArrayError, TypeError):
+    "When an input does not represent a supported array"
+
+class ArrayValueError(ArrayError, ValueError):
+    "When an array does not have a supported shape"
+
+
+#####
+# Type
+#####
+
+class NotArrayError(ArrayTypeError, NotTypeError):
+    "When an input is not a numpy array with the required dtype and layout"
+
+class CannotConvertToArray(ArrayTypeError, CannotConvertToType):
+    "When an input cannot be converted to a numpy array with the required dtype and layout"
+
+class CopyRequiredError(CannotConvertToArray):
+    "When an input can only be converted to the required array by copying it"
+
+
+#####
+# Shape
+#####
+
+class NdimError(ArrayValueError):
+    "When an array does not have the required number of dimensions"
+
+class ShapeError(ArrayValueError):
+    "When an array does not have the required shape"
@@ -1,4 +1,10 @@
 
+from __future__ import annotations
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
 
 # Aliases for overshadowed exceptions
 TypeError_ = TypeError
@@ -11,7 +17,52 @@ ValueError_ = ValueError
 
 
 class ScicheckError(Exception):
-    "Errors originating from scicheck input validation"
+    """
+    Errors originating from scicheck input validation
+    ----------
+    ScicheckError(message)
+    Uses a fixed error message.
+
+    ScicheckError(format, *fields)
+    Stores the structured fields of the error (such as its name, description,
+    types, or path) and defers building the message until the error is converted
+    to a string, at which point the message is format(*fields). Errors that are
+    caught and used for control flow never pay for string formatting. The fields
+    are available by name via the `fields` dict and as attributes.
+    """
+
+    def __str__(self) -> str:
+        if self.args and callable(self.args[0]):
+            format, *fields = self.args
+            return format(*fields)
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        "The named fields used to build the error message"
+        if not (self.args and callable(self.args[0])):
+            return {}
+        # Callables without code (such as builtins) have no named fields
+        format, *values = self.args
+        code = getattr(format, "__code__", None)
+        if code is None:
+            return {}
+        names = code.co_varnames[: code.co_argcount]
+        return dict(zip(names, values))
+
+    def __getattr__(self, name: str) -> Any:
+        # Never look up "fields" via itself, should the property fail
+        try:
+            if name == "fields":
+                raise KeyError(name)
+            return self.fields[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
 
 
 class TypeError(ScicheckError, TypeError_):
@@ -20,9 +20,11 @@ class PathTypeError(PathError, TypeError):
 
 class PathValueError(PathError, ValueError):
     "When a path is not valid"
-    def __init__(self, message, path):
-        message = f"{message}\nPath: {path}"
-        super().__init__(message)
+
+    def __init__(self, *args):
+        # Store the arguments directly. Otherwise, the OSError bases of some
+        # subclasses would parse them as (errno, strerror, filename)
+        self.args = args
 
 
 #####
@@ -86,4 +88,13 @@ class NotFolderError(FolderPathError, NotADirectoryError):
     "When a path points to a resource that is not a folder"
 
 class FolderNotEmpty(FolderPathError):
-    "When a path points to a non-empty folder"
\ No newline at end of file
+    "When a path points to a non-empty folder"
+
+class FolderContentError(FolderPathError):
+    "When a folder does not contain its required contents"
+
+class MissingContentError(FolderContentError):
+    "When a folder is missing a required file, subfolder, or pattern match"
+
+class TooFewFiles(FolderContentError):
+    "When a folder contains fewer files than required"
@@ -0,0 +1,32 @@
+
+from scicheck.errors.base import NotTypeError, ScicheckError, ValueError
+
+#####
+# Bases
+#####
+
+
+class SchemaError(ScicheckError):
+    "When a record does not match a schema"
+
+class SchemaValueError(SchemaError, ValueError):
+    "When a record has the wrong fields"
+
+
+#####
+# Type
+#####
+
+class NotRecordError(SchemaError, NotTypeError):
+    "When a record is not a mapping"
+
+
+#####
+# Fields
+#####
+
+class MissingFieldError(SchemaValueError):
+    "When a record is missing a required field"
+
+class UnknownFieldError(SchemaValueError):
+    "When a record has fields that are not in the schema"
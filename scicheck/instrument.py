@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from functools import partial, wraps
+from importlib import import_module
+from threading import Lock, local
+from time import perf_counter_ns
+
+from scicheck._layers import MODULES, checkers, wrap
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from types import FunctionType
+    from typing import Any, Callable, Iterable, Iterator, Optional
+
+# The environment variable that instruments the checker modules as they are imported
+ENVIRONMENT = "SCICHECK_INSTRUMENT"
+
+# Maps (checker, name) to [calls, failures, nanoseconds]
+_counters: dict[tuple[str, str], list[int]] = {}
+_lock = Lock()
+
+# The instrumented modules
+_enabled: set[str] = set()
+
+
+class _Thread(local):
+    "Tracks whether a thread is running an instrumented checker"
+    running = False
+
+
+_thread = _Thread()
+
+
+#####
+# Wrappers
+#####
+
+
+def _name_argument(function: FunctionType) -> tuple[int | None, Any]:
+    """Returns the position of a checker's name argument (or None if it is
+    keyword-only), and its default value"""
+
+    code = function.__code__
+    arguments = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    if "name" not in arguments:
+        return None, ""
+    position = arguments.index("name")
+    if position >= code.co_argcount:
+        return None, (function.__kwdefaults__ or {}).get("name")
+
+    defaults = function.__defaults__ or ()
+    first = code.co_argcount - len(defaults)
+    default = defaults[position - first] if position >= first else None
+    return position, default
+
+
+def _instrument(checker: str, function: FunctionType) -> Callable:
+    "Returns a checker that records its calls, failures, and time"
+
+    position, default = _name_argument(function)
+    if position is None:
+        position = float("inf")
+
+    @wraps(function)
+    def instrumented(*args, **kwargs):
+        # Checkers that call other checkers are timed as a single check
+        thread = _thread
+        if thread.running:
+            return function(*args, **kwargs)
+
+        name = args[position] if len(args) > position else kwargs.get("name", default)
+        failed = 1
+        thread.running = True
+        start = perf_counter_ns()
+        try:
+            output = function(*args, **kwargs)
+            failed = 0
+            return output
+        finally:
+            elapsed = perf_counter_ns() - start
+            thread.running = False
+            key = (checker, name if isinstance(name, str) else str(name))
+            with _lock:
+                counters = _counters.get(key)
+                if counters is None:
+                    counters = _counters[key] = [0, 0, 0]
+                counters[0] += 1
+                counters[1] += failed
+                counters[2] += elapsed
+
+    return instrumented
+
+
+def _module_names(modules: Optional[str | Iterable[str]]) -> tuple[str, ...]:
+    "Parses and checks the names of the modules being instrumented"
+    if modules is None:
+        return MODULES
+    elif isinstance(modules, str):
+        modules = (modules,)
+    modules = tuple(module.removeprefix("scicheck.") for module in modules)
+    for module in modules:
+        if module not in MODULES:
+            allowed = ", ".join(repr(name) for name in MODULES)
+            raise ValueError(
+                f"Only the {allowed} modules can be instrumented, not {module!r}"
+            )
+    return modules
+
+
+#####
+# Enabling
+#####
+
+
+def enable(modules: Optional[str | Iterable[str]] = None) -> None:
+    """
+    Starts recording the checkers of the numeric, path, and type modules
+    ----------
+    enable()
+    enable(modules)
+    Replaces the public checkers of `scicheck.numeric`, `scicheck.path`, and
+    `scicheck.type` (or of the named modules) with instrumented versions, which
+    record the number of calls, the number of failures, and the time spent in each
+    checker, for each value of the `name` argument. Checkers called by other
+    checkers are recorded as part of the outer checker.
+
+    The instrumented functions are swapped into the modules, so uninstrumented
+    checkers have no overhead. References to checkers taken before instrumentation
+    is enabled (such as `from scicheck.numeric import real`, or compiled
+    validators) keep using the original functions. To instrument a whole program,
+    set the SCICHECK_INSTRUMENT environment variable to "1" (or to a
+    comma-separated list of modules), which instruments the modules as they are
+    imported.
+    ----------
+    Inputs:
+        modules: The names of the modules to instrument. Defaults to all three
+    """
+
+    for module_name in _module_names(modules):
+        if module_name in _enabled:
+            continue
+        _enabled.add(module_name)
+        module = import_module(f"scicheck.{module_name}")
+        for name in checkers(module):
+            instrument = partial(_instrument, f"{module_name}.{name}")
+            wrap("instrument", module_name, name, instrument)
+
+
+def disable(modules: Optional[str | Iterable[str]] = None) -> None:
+    """
+    Stops recording checkers and restores the original functions
+    ----------
+    disable()
+    disable(modules)
+    Restores the original checkers of every instrumented module (or of the named
+    modules). Recorded statistics are kept until `reset` is called.
+    ----------
+    Inputs:
+        modules: The names of the modules to restore. Defaults to all three
+    """
+
+    for module_name in _module_names(modules):
+        if module_name not in _enabled:
+            continue
+        _enabled.discard(module_name)
+        module = import_module(f"scicheck.{module_name}")
+        for name in checkers(module):
+            wrap("instrument", module_name, name, None)
+
+
+def enabled(module: str) -> bool:
+    "True if a module's checkers are instrumented"
+    return _module_names(module)[0] in _enabled
+
+
+@contextmanager
+def instrumented(modules: Optional[str | Iterable[str]] = None) -> Iterator[None]:
+    """
+    Records the checkers called within a with block
+    ----------
+    with instrumented():
+    with instrumented(modules):
+    Enables instrumentation for the block, and disables it afterwards for the
+    modules that it enabled. Statistics remain available after the block.
+    ----------
+    Inputs:
+        modules: The names of the modules to instrument. Defaults to all three
+    """
+
+    names = [name for name in _module_names(modules) if name not in _enabled]
+    enable(names)
+    try:
+        yield
+    finally:
+        disable(names)
+
+
+def _from_environment(module: str) -> None:
+    "Instruments a checker module on import, if requested by environment variable"
+
+    setting = os.environ.get(ENVIRONMENT, "").strip().lower()
+    if setting in ("", "0", "false", "no", "off"):
+        return
+    elif setting in ("1", "true", "yes", "on", "all"):
+        modules = MODULES
+    else:
+        modules = [name.strip() for name in setting.split(",") if name.strip()]
+
+    module = module.removeprefix("scicheck.")
+    if module in _module_names(modules):
+        enable(module)
+
+
+#####
+# Statistics
+#####
+
+
+def reset() -> None:
+    "Clears the recorded statistics"
+    with _lock:
+        _counters.clear()
+
+
+def statistics() -> dict[str, dict[str, dict[str, int | float]]]:
+    """
+    Returns the recorded statistics
+    ----------
+    statistics()
+    Returns a dict that maps each called checker (such as "numeric.real") to a dict
+    keyed by the `name` argument of its calls. Each value is a dict with the number
+    of "calls", the number of "failures" (calls that raised an error), and the total
+    "seconds" spent in the checker.
+    ----------
+    Outputs:
+        dict: The statistics of each checker and name
+    """
+
+    with _lock:
+        counters = [(key, list(values)) for key, values in _counters.items()]
+
+    output = {}
+    for (checker, name), (calls, failures, nanoseconds) in sorted(counters):
+        output.setdefault(checker, {})[name] = {
+            "calls": calls,
+            "failures": failures,
+            "seconds": nanoseconds / 1e9,
+        }
+    return output
+
+
+def _label(value: str) -> str:
+    "Escapes a Prometheus label value"
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus(prefix: str = "scicheck") -> str:
+    """
+    Returns the recorded statistics in the Prometheus text format
+    ----------
+    prometheus()
+    prometheus(prefix)
+    Returns the statistics as three counters, labelled by checker and name:
+    {prefix}_checks_total, {prefix}_failures_total, and {prefix}_check_seconds_total.
+    ----------
+    Inputs:
+        prefix: The prefix of the metric names
+
+    Outputs:
+        str: The statistics in the Prometheus text exposition format
+    """
+
+    metrics = (
+        ("checks_total", "calls", "The number of checker calls"),
+        ("failures_total", "failures", "The number of checker calls that failed"),
+        ("check_seconds_total", "seconds", "The time spent in checkers"),
+    )
+    stats = statistics()
+    lines = []
+    for metric, field, description in metrics:
+        metric = f"{prefix}_{metric}"
+        lines += [f"# HELP {metric} {description}", f"# TYPE {metric} counter"]
+        for checker, names in stats.items():
+            for name, values in names.items():
+                labels = f'checker="{_label(checker)}",name="{_label(name)}"'
+                lines.append(f"{metric}{{{labels}}} {values[field]}")
+    return "\n".join(lines) + "\n"
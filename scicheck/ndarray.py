@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from scicheck import _message
+from scicheck.errors import (
+    CannotConvertToArray,
+    CopyRequiredError,
+    NdimError,
+    NotArrayError,
+    ShapeError,
+)
+from scicheck.utils import convert, numpy
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Literal, Optional
+    from numpy import dtype as DType, ndarray
+
+_COPY = ('never', 'if_needed')
+
+# The array flag and order for each supported contiguity
+_LAYOUTS = {'C': ('C_CONTIGUOUS', 'C'), 'F': ('F_CONTIGUOUS', 'F')}
+_LAYOUT_NAMES = {'C': 'C-contiguous', 'F': 'Fortran-contiguous'}
+
+# Whether numpy is version 2 or later. Set on first use, since numpy is imported
+# lazily, so the version is parsed once rather than on every check
+_numpy2: bool | None = None
+
+
+#####
+# Utilities
+#####
+
+
+def _options(
+    dtype: Any, shape: Any, contiguous: Any, copy: str
+) -> tuple[DType | None, tuple | None, str | None]:
+    "Checks and normalizes the options of an array check"
+
+    if copy not in _COPY:
+        allowed = ", ".join(repr(option) for option in _COPY)
+        raise ValueError(f"copy must be one of {allowed}, but it is {copy!r}")
+    if contiguous is True:
+        contiguous = 'C'
+    elif contiguous is False:
+        contiguous = None
+    elif contiguous is not None and contiguous not in _LAYOUTS:
+        raise ValueError(
+            f"contiguous must be True, 'C', 'F', or None, but it is {contiguous!r}"
+        )
+
+    if dtype is not None:
+        dtype = numpy().dtype(dtype)
+    if shape is not None:
+        shape = tuple(shape)
+    return dtype, shape, contiguous
+
+
+def _description(dtype: DType | None, contiguous: str | None) -> str:
+    "Describes the required array for error messages"
+    description = 'numpy array'
+    if contiguous is not None:
+        description = f"{_LAYOUT_NAMES[contiguous]} {description}"
+    if dtype is not None:
+        description = f"{description} of {dtype}"
+    return description
+
+
+def _check_shape(
+    input: ndarray, name: str, ndim: Optional[int], shape: tuple | None
+) -> None:
+    "Checks the dimensions of an array. Lengths of None match any length"
+    if ndim is not None and input.ndim != ndim:
+        raise NdimError(_message.wrong_ndim, name, ndim, input.ndim)
+    if shape is not None and (
+        len(shape) != input.ndim
+        or any(
+            length is not None and length != actual
+            for length, actual in zip(shape, input.shape)
+        )
+    ):
+        raise ShapeError(_message.wrong_shape, name, shape, input.shape)
+
+
+def _view(input: Any, name: str, description: str) -> ndarray:
+    """Views a non-array input as an array that shares its memory. Raises
+    CopyRequiredError if numpy would need to copy the input"""
+
+    # Sequences are always copied, so are rejected before numpy builds an array
+    np = numpy()
+    if isinstance(input, (list, tuple)):
+        raise CopyRequiredError(_message.copy_required, name, description)
+
+    # numpy 2 refuses to copy when copy=False, so objects with an __array__ method
+    # are never materialized just to be rejected
+    global _numpy2
+    if _numpy2 is None:
+        _numpy2 = int(np.__version__.split('.')[0]) >= 2
+    if _numpy2:
+        try:
+            return np.asarray(input, copy=False)
+        except ValueError:
+            raise CopyRequiredError(_message.copy_required, name, description) from None
+        except Exception as error:
+            message = _message.cannot_convert
+            raise CannotConvertToArray(message, name, 'numpy array') from error
+
+    # Older numpy has no copy=False, so the view is checked for a new buffer
+    view = convert(input, np.asarray, name, 'numpy array', CannotConvertToArray)
+    if view.flags.owndata and view.size > 0:
+        raise CopyRequiredError(_message.copy_required, name, description)
+    return view
+
+
+#####
+# Checker
+#####
+
+
+def array(
+    input: Any,
+    name: str = 'input',
+    *,
+    dtype: Any = None,
+    shape: Optional[tuple[int | None, ...]] = None,
+    ndim: Optional[int] = None,
+    contiguous: Optional[bool | Literal['C', 'F']] = None,
+    strict: bool = False,
+    copy: Literal['never', 'if_needed'] = 'never',
+) -> ndarray:
+    """
+    Checks that an input is a numpy array with a required dtype, shape, and layout
+    ----------
+    array(input)
+    array(input, name)
+    Checks that an input is (or can be viewed as) a numpy array, and returns the
+    array. Arrays that already meet every requirement are returned as they are,
+    so validation never copies a conforming array.
+
+    array(..., *, dtype)
+    array(..., *, contiguous=True)
+    array(..., *, contiguous='C')
+    array(..., *, contiguous='F')
+    Requires the array to have a dtype (anything accepted by numpy.dtype), or to
+    be C-contiguous ("C" or True) or Fortran-contiguous ("F") in memory.
+
+    array(..., *, shape)
+    array(..., *, ndim)
+    Requires the array to have a number of dimensions, or a shape. Use None in a
+    shape to allow any length along a dimension, as in shape=(None, 3). Shapes
+    are checked before any conversion, and are never changed by conversion.
+
+    array(..., *, strict=True)
+    Requires the input to already be a numpy array with the required dtype and
+    layout, rather than converting it.
+
+    array(..., *, copy='never')
+    array(..., *, copy='if_needed')
+    Sets whether conversion may copy the input. By default, inputs are only
+    converted when the result can share their memory, such as memoryviews and
+    other buffers, and CopyRequiredError is raised when conversion would need a
+    copy (for example, to change the dtype or layout of an array, or to convert
+    a list). Whether a copy is needed is decided before converting, so large
+    arrays are never copied just to find out. Use copy='if_needed' to allow
+    copies. Converted dtypes must be castable under numpy's "same_kind" rule, so
+    that floats are never silently truncated to ints.
+    ----------
+    Inputs:
+        input: The input being validated
+        name: A name for the input
+        dtype: The required dtype
+        shape: The required shape. None matches any length along a dimension
+        ndim: The required number of dimensions
+        contiguous: True or "C" for C-contiguous, "F" for Fortran-contiguous
+        strict: True to require a conforming numpy array
+        copy: "never" to forbid copies during conversion, or "if_needed"
+
+    Outputs:
+        numpy.ndarray: The validated array
+
+    Raises:
+        NotArrayError: If strict and the input is not a conforming numpy array
+        CannotConvertToArray: If the input cannot be converted to the array
+        CopyRequiredError: If copy='never' and converting the input needs a copy
+        NdimError: If the array does not have ndim dimensions
+        ShapeError: If the array does not have the required shape
+    """
+
+    dtype, shape, contiguous = _options(dtype, shape, contiguous, copy)
+    np = numpy()
+
+    # Non-array inputs are first viewed as arrays
+    if not isinstance(input, np.ndarray):
+        if strict:
+            description = _description(dtype, contiguous)
+            raise NotArrayError(_message.not_type, name, description)
+        if copy == 'never':
+            input = _view(input, name, _description(dtype, contiguous))
+        else:
+            description = 'numpy array'
+            input = convert(input, np.asarray, name, description, CannotConvertToArray)
+    _check_shape(input, name, ndim, shape)
+
+    # Return conforming arrays unchanged
+    cast = dtype is not None and input.dtype != dtype
+    relayout = contiguous is not None and not input.flags[_LAYOUTS[contiguous][0]]
+    if not cast and not relayout:
+        return input
+
+    # Otherwise, a cast or layout change always copies
+    description = _description(dtype, contiguous)
+    if strict:
+        raise NotArrayError(_message.not_type, name, description)
+    elif copy == 'never':
+        raise CopyRequiredError(_message.copy_required, name, description)
+    order = 'K' if contiguous is None else _LAYOUTS[contiguous][1]
+    converter = lambda input: input.astype(
+        input.dtype if dtype is None else dtype, order=order, casting='same_kind'
+    )
+    return convert(input, converter, name, description, CannotConvertToArray)
@@ -1,11 +1,13 @@
 
 from __future__ import annotations
 
-import typing
+import numbers
+import os
+import sys
 from math import isinf, isnan
 from operator import lt, le, gt, ge
 
-from scicheck.utils import convert
+from scicheck.utils import convert, numpy, try_convert
 from scicheck import _message
 from scicheck.errors import (
     CannotConvertToComplex,
@@ -28,17 +30,22 @@ from scicheck.errors import (
     NotNegative,
     NotPositiveOrZero,
     NotNegativeOrZero,
+    ScicheckError,
 )
 
-if typing.TYPE_CHECKING:
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing import Any, Callable
     Real = int | float
     Numeric = Real | complex
-    from scicheck.errors import ComparisonError, CannotConvertToType
+    from numpy import ndarray
+    from pathlib import Path
+    from scicheck.errors import ComparisonError, CannotConvertToType, NotTypeError
 
 # Aliases for overshadowed built-in types
 float_ = float
 complex_ = complex
+min_ = min
 
 
 
@@ -51,8 +58,7 @@ def _float_as_int(input: float_, name: str) -> int:
     if input.is_integer():
         return int(input)
     else:
-        message = _message.not_integer(input, name)
-        raise CannotConvertToInt(message)
+        raise CannotConvertToInt(_message.not_integer, input, name)
     
 
 def _complex_as_float(
@@ -64,44 +70,256 @@ def _complex_as_float(
     "Converts a complex to a float when possible"
 
     if input.imag == 0:
-        return input.real
+        return float_(input.real)
     else:
-        message = _message.cannot_convert_complex(input, name, description)
-        raise CannotConvertError(message)
+        raise CannotConvertError(
+            _message.cannot_convert_complex, input, name, description
+        )
+
+
+def _simplify(input: complex_) -> Numeric:
+    "Converts a complex to a float or int when this does not lose information"
+    if input.imag == 0:
+        input = input.real
+        if input.is_integer():
+            input = int(input)
+    return input
+
+
+def _parse(input: str) -> Numeric | None:
+    """Parses a numeral as an int, float, or complex, in that order. Integer-valued
+    numerals are returned as exact ints. Returns None for other strings"""
+
+    # Decimal numerals are parsed once. Integer-valued floats are reparsed as
+    # ints, so that large integers keep every digit
+    try:
+        value = float_(input)
+    except ValueError:
+        value = None
+    if value is not None:
+        if not value.is_integer():
+            return value
+        try:
+            return int(input)
+        except ValueError:
+            return int(value)
+
+    # Only complex numerals contain a "j", so other strings skip the second parse
+    if 'j' not in input and 'J' not in input:
+        return None
+    try:
+        return _simplify(complex_(input))
+    except ValueError:
+        return None
 
 
 def _not_numeric(name: str) -> NotNumericError:
-    message = _message.not_type(name, 'numeric type')
-    return NotNumericError(message)
+    return NotNumericError(_message.not_type, name, 'numeric type')
+
+
+
+
+
+#####
+# Dispatch
+#####
+
+# Inputs that are already the checked type return after a single isinstance.
+# Otherwise, each checker maps the type of the input to the handler that converts
+# it, so a call costs one dict lookup rather than a chain of isinstance checks.
+# Handlers take (input, name, numeric_only). Subclasses and unknown types are
+# resolved on first use and cached in the table.
+#
+# Numeric types that are not built-ins (NumPy scalars, Fraction, Decimal, and
+# other types registered with the `numbers` ABCs) resolve to the table entry for
+# their ABC, which converts them directly rather than via a complex round trip
+
+# The numbers ABCs that resolve types missing from a table, most specific first
+_ABCS = (numbers.Integral, numbers.Rational, numbers.Real, numbers.Complex)
+
+
+def _category(table: dict[type, Callable], kind: type) -> type | None:
+    "Returns the numbers ABC whose table entry handles a non-built-in numeric type"
+
+    for abc in _ABCS:
+        if abc in table and issubclass(kind, abc):
+            return abc
+
+    # Decimal is only registered as a Number, but is real-valued
+    if issubclass(kind, numbers.Number) and hasattr(kind, '__float__'):
+        return numbers.Real
+    return None
+
+
+def _dispatch(table: dict[type, Callable], kind: type, default: Callable) -> Callable:
+    "Resolves and caches the handler for a type that is not yet in a dispatch table"
+    for base in kind.__mro__[1:]:
+        handler = table.get(base)
+        if handler is not None:
+            break
+    else:
+        handler = table.get(_category(table, kind), default)
+    table[kind] = handler
+    return handler
+
+
+def _numeric_from_integral(input: Any, name: str, numeric_only: bool) -> int:
+    return int(input)
+
+def _numeric_from_rational(input: Any, name: str, numeric_only: bool) -> Real:
+    "Integer-valued fractions are returned as exact ints"
+    if input.denominator == 1:
+        return int(input.numerator)
+    return _numeric_from_real(input, name, numeric_only)
+
+def _numeric_from_real(input: Any, name: str, numeric_only: bool) -> Real:
+    "Integer-valued reals are converted exactly to ints"
+    value = convert(input, float_, name, 'numeric type', CannotConvertToNumeric)
+    if value.is_integer():
+        return int(input)
+    return value
+
+def _numeric_from_complex(input: Any, name: str, numeric_only: bool) -> Numeric:
+    input = convert(input, complex_, name, 'numeric type', CannotConvertToNumeric)
+    return _simplify(input)
+
+def _numeric_from_string(input: str, name: str, numeric_only: bool) -> Numeric:
+    value = _parse(input)
+    if value is None:
+        raise CannotConvertToNumeric(_message.cannot_convert, name, 'numeric type')
+    return value
+
+def _numeric_from_other(input: Any, name: str, numeric_only: bool) -> Numeric:
+    input = convert(
+        input, complex_, name, 'numeric type', CannotConvertToNumeric
+    )
+    return _simplify(input)
+
+
+def _complex_from_number(input: Any, name: str, numeric_only: bool) -> complex_:
+    return convert(input, complex_, name, 'complex', CannotConvertToComplex)
 
+def _complex_from_other(input: Any, name: str, numeric_only: bool) -> complex_:
+    if numeric_only:
+        raise _not_numeric(name)
+    return convert(input, complex_, name, 'complex', CannotConvertToComplex)
+
+
+def _float_from_real(input: Any, name: str, numeric_only: bool) -> float_:
+    return convert(input, float_, name, 'a float', CannotConvertToFloat)
+
+def _float_from_complex(input: Any, name: str, numeric_only: bool) -> float_:
+    return _complex_as_float(input, name, 'a float', CannotConvertToFloat)
+
+def _float_from_other(input: Any, name: str, numeric_only: bool) -> float_:
+    if numeric_only:
+        raise _not_numeric(name)
+    return convert(input, float_, name, 'a float', CannotConvertToFloat)
+
+
+def _int_from_integral(input: Any, name: str, numeric_only: bool) -> int:
+    return int(input)
+
+def _int_from_float(input: float_, name: str, numeric_only: bool) -> int:
+    return _float_as_int(input, name)
+
+def _int_from_real(input: Any, name: str, numeric_only: bool) -> int:
+    "Converts exactly, so large Fraction, Decimal, and NumPy values keep precision"
+    value = convert(input, int, name, 'an integer', CannotConvertToInt)
+    if value != input:
+        raise CannotConvertToInt(_message.not_integer, input, name)
+    return value
 
+def _int_from_complex(input: Any, name: str, numeric_only: bool) -> int:
+    input = _complex_as_float(input, name, 'an integer', CannotConvertToInt)
+    return _float_as_int(input, name)
 
+def _int_from_other(input: Any, name: str, numeric_only: bool) -> int:
+    if numeric_only:
+        raise _not_numeric(name)
+    return convert(input, int, name, 'an integer', CannotConvertToInt)
+
+
+def _real_from_integral(input: Any, name: str, numeric_only: bool) -> int:
+    return int(input)
+
+def _real_from_rational(input: Any, name: str, numeric_only: bool) -> Real:
+    "Integer-valued fractions are returned as exact ints"
+    if input.denominator == 1:
+        return int(input.numerator)
+    return _real_from_real(input, name, numeric_only)
+
+def _real_from_real(input: Any, name: str, numeric_only: bool) -> float_:
+    return convert(
+        input, float_, name, 'a real-valued number', CannotConvertToReal
+    )
+
+def _real_from_complex(input: Any, name: str, numeric_only: bool) -> float_:
+    return _complex_as_float(
+        input, name, 'a real-valued number', CannotConvertToReal
+    )
+
+def _real_from_other(input: Any, name: str, numeric_only: bool) -> float_:
+    if numeric_only:
+        raise _not_numeric(name)
+    return convert(
+        input, float_, name, 'a real-valued number', CannotConvertToReal
+    )
+
+
+_NUMERIC = {
+    str: _numeric_from_string,
+    numbers.Integral: _numeric_from_integral,
+    numbers.Rational: _numeric_from_rational,
+    numbers.Real: _numeric_from_real,
+    numbers.Complex: _numeric_from_complex,
+}
+_COMPLEX = {
+    int: _complex_from_number,
+    float_: _complex_from_number,
+    numbers.Complex: _complex_from_number,
+    numbers.Real: _complex_from_number,
+    numbers.Integral: _complex_from_number,
+}
+_FLOAT = {
+    int: _float_from_real,
+    complex_: _float_from_complex,
+    numbers.Integral: _float_from_real,
+    numbers.Real: _float_from_real,
+    numbers.Complex: _float_from_complex,
+}
+_INTEGER = {
+    float_: _int_from_float,
+    complex_: _int_from_complex,
+    numbers.Integral: _int_from_integral,
+    numbers.Real: _int_from_real,
+    numbers.Complex: _int_from_complex,
+}
+_REAL = {
+    complex_: _real_from_complex,
+    numbers.Integral: _real_from_integral,
+    numbers.Rational: _real_from_rational,
+    numbers.Real: _real_from_real,
+    numbers.Complex: _real_from_complex,
+}
 
 
 #####
-# Type
+# Checkers
 #####
 
 def numeric(input: Any, name: str = 'input', *, strict: bool = False) -> Numeric:
     "Checks that an input represents a numeric type"
 
-    # Strict
     if isinstance(input, (int, float_, complex_)):
         return input
     elif strict:
         raise _not_numeric(name)
-    
-    # Attempt conversion
-    input = convert(
-        input, complex_, name, 'numeric type', CannotConvertToNumeric
-    )
 
-    # Simplify type as appropriate
-    if input.imag == 0:
-        input = input.real
-    if input.is_integer():
-        input = int(input)
-    return input
+    kind = type(input)
+    handler = _NUMERIC.get(kind) or _dispatch(_NUMERIC, kind, _numeric_from_other)
+    return handler(input, name, False)
+
 
 def complex(
     input: Any, 
@@ -111,22 +329,14 @@ def complex(
     numeric_only: bool = True
 ) -> complex_:
 
-    # Strict
     if isinstance(input, complex_):
         return input
     elif strict:
-        message = _message.not_type(name, 'complex')
-        raise NotComplexError(message)
-    
-    # Convert other numeric types
-    elif isinstance(input, (int, float_)):
-        return complex_(input)
-    
-    # Require numeric or attempt type conversion
-    elif numeric_only:
-        raise _not_numeric(name)
-    else:
-        return convert(input, complex_, name, 'complex', CannotConvertToComplex)
+        raise NotComplexError(_message.not_type, name, 'complex')
+
+    kind = type(input)
+    handler = _COMPLEX.get(kind) or _dispatch(_COMPLEX, kind, _complex_from_other)
+    return handler(input, name, numeric_only)
 
 
 def float(
@@ -137,24 +347,14 @@ def float(
     numeric_only: bool = True,
 ) -> float_:
 
-    # Strict
     if isinstance(input, float_):
         return input
     elif strict:
-        message = _message.not_type(name, 'float')
-        raise NotFloatError(message)
-    
-    # Handle complex and int types
-    elif isinstance(input, complex_):
-        return _complex_as_float(input, name, 'a float', CannotConvertToFloat)
-    elif isinstance(input, int):
-        return float_(input)
-    
-    # Require numeric, or attempt type conversion
-    elif numeric_only:
-        raise _not_numeric(name)
-    else:
-        return convert(input, float_, name, 'a float', CannotConvertToFloat)
+        raise NotFloatError(_message.not_type, name, 'float')
+
+    kind = type(input)
+    handler = _FLOAT.get(kind) or _dispatch(_FLOAT, kind, _float_from_other)
+    return handler(input, name, numeric_only)
     
 
 def integer(
@@ -165,23 +365,14 @@ def integer(
     numeric_only: bool = True,
 ) -> int:
 
-    # Strict
     if isinstance(input, int):
         return input
     elif strict:
-        raise NotIntError(f"{name} must be an int")
-    
-    # Handle float and complex
-    if isinstance(input, complex_):
-        input = _complex_as_float(input, name, 'an integer', CannotConvertToInt)
-    if isinstance(input, float_):
-        return _float_as_int(input, name)
-    
-    # Require numeric or attempt type conversion
-    elif numeric_only:
-        raise _not_numeric(name)
-    else:
-        return convert(input, int, name, 'an integer', CannotConvertToInt)
+        raise NotIntError(_message.not_type, name, 'an int')
+
+    kind = type(input)
+    handler = _INTEGER.get(kind) or _dispatch(_INTEGER, kind, _int_from_other)
+    return handler(input, name, numeric_only)
     
     
 def real(
@@ -194,38 +385,698 @@ def real(
     allow_inf: bool = False, 
 ) -> Real:
     
-    # Strict
+    # Ints are always valid. Floats are valid in strict mode
     if isinstance(input, int):
         return input
-    elif strict and not isinstance(input, float_):
-        message = _message.not_type(name, 'an int or float')
-        raise NotRealError(message)
-    
-    # Handle complex
-    elif isinstance(input, complex_):
-        input = _complex_as_float(input, name, )
-    
-    # Require numeric or attempt type conversion
-    elif numeric_only:
-        raise _not_numeric(name)
-    else:
-        input = convert(
-            input, float_, name, 'a real-valued number', CannotConvertToReal
-        )
+    elif not isinstance(input, float_):
+        if strict:
+            raise NotRealError(_message.not_type, name, 'an int or float')
+        kind = type(input)
+        handler = _REAL.get(kind) or _dispatch(_REAL, kind, _real_from_other)
+        input = handler(input, name, numeric_only)
 
     # Optionally prevent NaN and Inf
     if isnan(input) and not allow_nan:
-        message = _message.cannot_be(name, 'NaN')
-        raise IsNaNError(message)
+        raise IsNaNError(_message.cannot_be, name, 'NaN')
     elif isinf(input) and not allow_inf:
-        message = _message.cannot_be(name, 'Inf')
-        raise IsInfError(message)
+        raise IsInfError(_message.cannot_be, name, 'Inf')
     return input
 
 
-# #####
-# # Comparison operators
-# #####
+# Private references to the checkers, used by the checkers that call them. Policies
+# and instrumentation rebind the public names, which must not change how the
+# try_ checkers behave
+_numeric, _complex, _float, _integer, _real = numeric, complex, float, integer, real
+
+
+#####
+# Non-raising
+#####
+
+def _try(checker: Callable, input: Any, default: Any, **options: Any) -> Any:
+    "Runs a raising checker on numeric types that are rarely invalid"
+    try:
+        return checker(input, **options)
+    except ScicheckError:
+        return default
+
+
+def try_numeric(input: Any, *, strict: bool = False, default: Any = None) -> Any:
+    """
+    Returns an input as a numeric type, or a default value if this is not possible
+    ----------
+    Non-raising version of `numeric`. Returns `default` instead of raising an
+    error, so no exception object or traceback is built when an input fails. Use
+    in parsing loops where most candidate values are expected to fail.
+    """
+
+    if isinstance(input, (int, float_, complex_)):
+        return input
+    elif strict:
+        return default
+    elif isinstance(input, numbers.Number):
+        return _try(_numeric, input, default)
+    elif isinstance(input, str):
+        value = _parse(input)
+        return default if value is None else value
+    input = try_convert(input, complex_)
+    if input is None:
+        return default
+    return _simplify(input)
+
+
+def try_complex(
+    input: Any, 
+    *, 
+    strict: bool = False, 
+    numeric_only: bool = True,
+    default: Any = None,
+) -> Any:
+    "Non-raising version of `complex`. Returns `default` for invalid inputs"
+
+    if isinstance(input, complex_):
+        return input
+    elif strict:
+        return default
+    elif isinstance(input, (int, float_)):
+        return complex_(input)
+    elif isinstance(input, numbers.Number):
+        return _try(_complex, input, default)
+    elif numeric_only:
+        return default
+    input = try_convert(input, complex_)
+    return default if input is None else input
+
+
+def try_float(
+    input: Any, 
+    *, 
+    strict: bool = False, 
+    numeric_only: bool = True,
+    default: Any = None,
+) -> Any:
+    "Non-raising version of `float`. Returns `default` for invalid inputs"
+
+    if isinstance(input, float_):
+        return input
+    elif strict:
+        return default
+    elif isinstance(input, complex_):
+        return input.real if input.imag == 0 else default
+    elif isinstance(input, int):
+        return float_(input)
+    elif isinstance(input, numbers.Number):
+        return _try(_float, input, default)
+    elif numeric_only:
+        return default
+    input = try_convert(input, float_)
+    return default if input is None else input
+
+
+def try_integer(
+    input: Any, 
+    *, 
+    strict: bool = False, 
+    numeric_only: bool = True,
+    default: Any = None,
+) -> Any:
+    "Non-raising version of `integer`. Returns `default` for invalid inputs"
+
+    if isinstance(input, int):
+        return input
+    elif strict:
+        return default
+    if isinstance(input, complex_):
+        if input.imag != 0:
+            return default
+        input = input.real
+    if isinstance(input, float_):
+        return int(input) if input.is_integer() else default
+    elif isinstance(input, numbers.Number):
+        return _try(_integer, input, default)
+    elif numeric_only:
+        return default
+    input = try_convert(input, int)
+    return default if input is None else input
+
+
+def try_real(
+    input: Any, 
+    *, 
+    strict: bool = False, 
+    numeric_only: bool = True,
+    allow_nan: bool = False,
+    allow_inf: bool = False,
+    default: Any = None,
+) -> Any:
+    "Non-raising version of `real`. Returns `default` for invalid inputs"
+
+    if isinstance(input, int):
+        return input
+    elif isinstance(input, float_):
+        pass
+    elif strict:
+        return default
+    elif isinstance(input, complex_):
+        if input.imag != 0:
+            return default
+        input = input.real
+    elif isinstance(input, numbers.Number):
+        return _try(_real, input, default, allow_nan=allow_nan, allow_inf=allow_inf)
+    elif numeric_only:
+        return default
+    else:
+        input = try_convert(input, float_)
+        if input is None:
+            return default
+
+    if (isnan(input) and not allow_nan) or (isinf(input) and not allow_inf):
+        return default
+    return input
+
+
+#####
+# Arrays
+#####
+
+def _first_index(mask: ndarray) -> int | tuple[int, ...]:
+    "Returns the index of the first True element of a boolean array"
+    np = numpy()
+    index = np.unravel_index(mask.argmax(), mask.shape)
+    if len(index) == 1:
+        return int(index[0])
+    return tuple(int(i) for i in index)
+
+
+def _as_array(
+    input: Any,
+    name: str,
+    strict: bool,
+    kinds: str,
+    dtype: type,
+    description: str,
+    NotTypeError: NotTypeError,
+    CannotConvertError: CannotConvertToType,
+) -> ndarray:
+    "Checks an input is an array whose dtype kind is supported, optionally converting"
+
+    # Strict
+    np = numpy()
+    if isinstance(input, np.ndarray) and input.dtype.kind in kinds:
+        return input
+    elif strict:
+        raise NotTypeError(_message.not_type, name, description)
+
+    # Convert to array. Complex arrays must have no imaginary part
+    input = convert(input, np.asarray, name, description, CannotConvertError)
+    if input.dtype.kind == 'c' and 'c' not in kinds:
+        imaginary = input.imag != 0
+        if imaginary.any():
+            index = _first_index(imaginary)
+            value = input[index]
+            raise CannotConvertError(
+                _message.complex_element, name, index, value, description
+            )
+        input = input.real
+
+    # Cast unsupported dtypes in a single pass
+    if input.dtype.kind not in kinds:
+        cast = lambda input: input.astype(dtype)
+        input = convert(input, cast, name, description, CannotConvertError)
+    return input
+
+
+def _check_finite(
+    input: ndarray, name: str, allow_nan: bool, allow_inf: bool
+) -> None:
+    "Checks an array for NaN and Inf elements using a single vectorized reduction"
+
+    # Only floating arrays can hold NaN or Inf
+    if input.dtype.kind not in 'fc' or (allow_nan and allow_inf):
+        return
+    np = numpy()
+
+    # Locate invalid elements. The fused isfinite pass is used when neither is
+    # allowed, and the per-element masks are only built on the failure path
+    if allow_nan:
+        invalid = np.isinf(input)
+    elif allow_inf:
+        invalid = np.isnan(input)
+    elif np.isfinite(input).all():
+        return
+    else:
+        invalid = ~np.isfinite(input)
+    if not invalid.any():
+        return
+
+    # Report the first invalid element
+    index = _first_index(invalid)
+    if np.isnan(input[index]):
+        raise IsNaNError(_message.cannot_contain, name, 'NaN', index)
+    else:
+        raise IsInfError(_message.cannot_contain, name, 'Inf', index)
+
+
+def real_array(
+    input: Any,
+    name: str = 'input',
+    *,
+    strict: bool = False,
+    allow_nan: bool = False,
+    allow_inf: bool = False,
+) -> ndarray:
+    "Checks that an input represents a numpy array of real-valued numbers"
+
+    input = _as_array(
+        input, 
+        name, 
+        strict, 
+        kinds='biuf', 
+        dtype=float_, 
+        description='an array of real-valued numbers',
+        NotTypeError=NotRealError,
+        CannotConvertError=CannotConvertToReal,
+    )
+    _check_finite(input, name, allow_nan, allow_inf)
+    return input
+
+
+def float_array(
+    input: Any,
+    name: str = 'input',
+    *,
+    strict: bool = False,
+    allow_nan: bool = False,
+    allow_inf: bool = False,
+) -> ndarray:
+    "Checks that an input represents a numpy array of floats"
+
+    input = _as_array(
+        input, 
+        name, 
+        strict, 
+        kinds='f', 
+        dtype=float_, 
+        description='an array of floats',
+        NotTypeError=NotFloatError,
+        CannotConvertError=CannotConvertToFloat,
+    )
+    _check_finite(input, name, allow_nan, allow_inf)
+    return input
+
+
+def _integral_extrema(input: ndarray) -> tuple[bool, Any, Any]:
+    """Checks that every element of a float array is integer-valued, and returns
+    the array's min and max, in a single blocked pass over memory. Returns
+    (False, None, None) as soon as a block holds a non-integer element"""
+
+    np = numpy()
+    contiguous = input.flags.c_contiguous or input.flags.f_contiguous
+    if not contiguous or input.size <= _EXTREMA_BLOCK:
+        blocks = [input]
+    else:
+        flat = input.ravel(order='K')
+        blocks = (
+            flat[start : start + _EXTREMA_BLOCK]
+            for start in range(0, flat.size, _EXTREMA_BLOCK)
+        )
+
+    # NaN is never equal to its truncation, so it fails the integer check
+    minima = []
+    maxima = []
+    for block in blocks:
+        if not (block == np.trunc(block)).all():
+            return False, None, None
+        minima.append(block.min())
+        maxima.append(block.max())
+    return True, np.min(minima), np.max(maxima)
+
+
+def integer_array(
+    input: Any, name: str = 'input', *, strict: bool = False, dtype: Any = None
+) -> ndarray:
+    """
+    Checks that an input represents a numpy array of integers
+    ----------
+    integer_array(input)
+    integer_array(input, name)
+    Returns integer (and boolean) arrays unchanged. Otherwise, converts the input
+    to an array. Arrays of integer-valued floats (such as index arrays stored as
+    float64) are checked in a single vectorized pass, and then cast to int64 in
+    one go. Raises CannotConvertToInt for the first element that is not an
+    integer (including NaN), or that does not fit in the integer dtype (including
+    Inf).
+
+    integer_array(..., *, dtype)
+    Sets the integer dtype of the output. Arrays of any other dtype are cast to
+    it, after checking that their elements fit in the dtype. Casts that always
+    fit (such as int32 to int64) skip the check.
+
+    integer_array(..., *, strict=True)
+    Requires the input to be a numpy array with an integer or boolean dtype.
+    ----------
+    Inputs:
+        input: The input being validated
+        name: A name for the input
+        strict: True to require an integer numpy array
+        dtype: The integer dtype of the output. Defaults to the dtype of integer
+            arrays, and to int64 for converted arrays
+
+    Outputs:
+        numpy.ndarray: The validated array
+
+    Raises:
+        NotIntError: If strict and the input is not an integer array
+        CannotConvertToInt: If the input cannot be converted to an integer array
+    """
+
+    np = numpy()
+    keep = dtype is None
+    dtype = np.dtype('int64' if keep else dtype)
+    if dtype.kind not in 'iu':
+        raise ValueError(f"dtype must be an integer dtype, but it is {dtype}")
+
+    input = _as_array(
+        input,
+        name,
+        strict,
+        kinds='biu' if strict else 'biuf',
+        dtype=float_,
+        description='an array of integers',
+        NotTypeError=NotIntError,
+        CannotConvertError=CannotConvertToInt,
+    )
+    if input.dtype == dtype or (keep and input.dtype.kind != 'f'):
+        return input
+    elif input.size == 0 or np.can_cast(input.dtype, dtype):
+        return input.astype(dtype)
+
+    # Integer arrays are compared to the dtype's bounds exactly
+    info = np.iinfo(dtype)
+    if input.dtype.kind != 'f':
+        minimum, maximum = _extrema(input, True, True)
+        if minimum < info.min or maximum > info.max:
+            _out_of_range(input, name, dtype, (input < info.min) | (input > info.max))
+        return input.astype(dtype)
+
+    # Locate the first invalid element only on the failure path
+    integral, minimum, maximum = _integral_extrema(input)
+    if not integral:
+        index = _first_index(input != np.trunc(input))
+        value = input[index].item()
+        raise CannotConvertToInt(_message.element_not_integer, name, index, value)
+
+    # Float bounds are exact powers of two, so maximum must be strictly below
+    # the bound above the dtype's max
+    low, high = float_(info.min), float_(info.max) + 1
+    if minimum < low or maximum >= high:
+        _out_of_range(input, name, dtype, (input < low) | (input >= high))
+    return input.astype(dtype)
+
+
+def _out_of_range(input: ndarray, name: str, dtype: Any, invalid: ndarray):
+    "Raises the error for the first element that does not fit in an integer dtype"
+    index = _first_index(invalid)
+    value = input[index].item()
+    raise CannotConvertToInt(_message.element_out_of_range, name, index, value, dtype)
+
+
+# The dtypes tried when parsing an array of numerals, in order
+_PARSED_DTYPES = ('int64', 'float64', 'complex128')
+
+
+def _first_unparsable(input: ndarray) -> int | tuple[int, ...] | None:
+    "Returns the index of the first element of an array that is not a numeral"
+    np = numpy()
+    for index in np.ndindex(input.shape):
+        element = input[index]
+        if isinstance(element, bytes):
+            element = element.decode(errors='replace')
+        if _parse(str(element)) is None:
+            return index[0] if input.ndim == 1 else index
+    return None
+
+
+def numeric_array(
+    input: Any, name: str = 'input', *, strict: bool = False
+) -> ndarray:
+    """
+    Checks that an input represents a numpy array of numbers, parsing numerals
+    ----------
+    numeric_array(input)
+    numeric_array(input, name)
+    Returns numeric arrays unchanged. Otherwise, converts the input to an array,
+    and parses arrays of numeral strings (such as a list of str, or a numpy
+    string array) in a single vectorized cast. Numerals are parsed as int64, then
+    float64, then complex128, and the first dtype that holds every element is
+    used. Integers too large for int64 are parsed as float64. If an element is not
+    a numeral, the error reports its index.
+
+    numeric_array(..., *, strict=True)
+    Requires a numpy array with a numeric dtype.
+    ----------
+    Inputs:
+        input: The input being checked
+        name: A name for the input
+        strict: True to require a numeric numpy array
+
+    Outputs:
+        ndarray: The numeric array
+
+    Raises:
+        NotNumericError: If strict and the input is not a numeric array
+        CannotConvertToNumeric: If an element cannot be parsed as a number
+    """
+
+    description = 'an array of numbers'
+    np = numpy()
+    if isinstance(input, np.ndarray) and input.dtype.kind in 'biufc':
+        return input
+    elif strict:
+        raise NotNumericError(_message.not_type, name, description)
+
+    # Numeric inputs only need converting to an array. Object arrays are parsed
+    # from their strings, since casting would silently convert None to NaN
+    input = convert(input, np.asarray, name, description, CannotConvertToNumeric)
+    if input.dtype.kind in 'biufc':
+        return input
+    elif input.dtype.kind == 'O':
+        input = input.astype(str)
+
+    # Try each dtype in a single cast. Casts fail on the first invalid element,
+    # so failed attempts are cheap unless the invalid element is late
+    for dtype in _PARSED_DTYPES:
+        try:
+            return input.astype(dtype)
+        except (ValueError, OverflowError, TypeError):
+            pass
+
+    # Report the first element that is not a numeral
+    index = _first_unparsable(input)
+    if index is None:
+        raise CannotConvertToNumeric(_message.cannot_convert, name, description)
+    value = input[index].item()
+    raise CannotConvertToNumeric(
+        _message.not_numeral, name, index, value, description
+    )
+
+
+#####
+# Files
+#####
+
+# The number of elements checked at a time, which bounds the memory used by the
+# temporary arrays of each check (8 MiB of float64 per chunk)
+_FILE_CHUNK = 2**20
+
+
+def _open_file(file: Path, dtype: Any) -> ndarray:
+    "Memory-maps a .npy file, or a raw binary file of the given dtype"
+    np = numpy()
+    if file.suffix == '.npy':
+        return np.load(file, mmap_mode='r')
+    elif file.stat().st_size == 0:
+        return np.empty(0, dtype)
+    return np.memmap(file, dtype=dtype, mode='r')
+
+
+def _file_index(array: ndarray, flat: int) -> tuple[int | tuple[int, ...], int]:
+    "Returns the array index and byte offset of an element of a mapped file"
+    offset = getattr(array, 'offset', 0) + flat * array.itemsize
+    if array.ndim > 1:
+        index = numpy().unravel_index(flat, array.shape, order=_order(array))
+        return tuple(int(i) for i in index), offset
+    return flat, offset
+
+
+def _order(array: ndarray) -> str:
+    "Returns the order of the elements of a mapped array in the file"
+    return 'F' if array.flags.f_contiguous and not array.flags.c_contiguous else 'C'
+
+
+def _check_chunk(
+    chunk: ndarray,
+    allow_nan: bool,
+    allow_inf: bool,
+    min: Real | None,
+    max: Real | None,
+) -> tuple[int, type[ScicheckError], str, Any] | None:
+    """Checks a chunk of a file. Returns (index, error, description, bound) for the
+    first invalid element in the chunk, or None if the chunk is valid"""
+
+    np = numpy()
+    failures = []
+
+    # Finite checks use the same single reduction as the array checkers
+    if chunk.dtype.kind == 'f' and not (allow_nan and allow_inf):
+        if allow_nan:
+            invalid = np.isinf(chunk)
+        elif allow_inf:
+            invalid = np.isnan(chunk)
+        else:
+            invalid = ~np.isfinite(chunk)
+        if invalid.any():
+            index = int(invalid.argmax())
+            if np.isnan(chunk[index]):
+                failures.append((index, IsNaNError, 'NaN', None))
+            else:
+                failures.append((index, IsInfError, 'Inf', None))
+
+    # Bounds use a NaN-ignoring min/max reduction, and only build a mask for the
+    # chunk that fails
+    if min is not None and chunk.size and np.fmin.reduce(chunk) < min:
+        index = int((chunk < min).argmax())
+        failures.append((index, NotGreaterEqual, 'greater than or equal to', min))
+    if max is not None and chunk.size and np.fmax.reduce(chunk) > max:
+        index = int((chunk > max).argmax())
+        failures.append((index, NotLessEqual, 'less than or equal to', max))
+    return min_(failures, key=lambda failure: failure[0], default=None)
+
+
+def real_file(
+    input: Any,
+    name: str = 'input',
+    *,
+    strict: bool = False,
+    dtype: Any = 'float64',
+    allow_nan: bool = False,
+    allow_inf: bool = False,
+    min: Real | None = None,
+    max: Real | None = None,
+    chunk_size: int = _FILE_CHUNK,
+) -> Path:
+    """
+    Checks that a binary file holds real-valued numbers, without loading it
+    ----------
+    real_file(input)
+    real_file(input, name)
+    Checks that the input is an existing file of real-valued numbers with no NaN
+    or Inf elements, and returns its path. Files ending in .npy are read with the
+    dtype and shape in their header. Other files are read as raw binary arrays of
+    float64. The file is memory-mapped and checked chunk_size elements at a time,
+    so memory use is bounded however large the file is. Errors report the index
+    of the first invalid element, and its byte offset in the file.
+
+    real_file(..., *, dtype)
+    Sets the dtype of raw binary files.
+
+    real_file(..., *, allow_nan=True)
+    real_file(..., *, allow_inf=True)
+    Allows NaN or Inf elements.
+
+    real_file(..., *, min)
+    real_file(..., *, max)
+    Requires every element to be within inclusive bounds. NaN elements are not
+    compared to the bounds.
+    ----------
+    Inputs:
+        input: The path to the file
+        name: A name for the file
+        strict: True to require a pathlib.Path input
+        dtype: The dtype of a raw binary file
+        allow_nan: True to allow NaN elements
+        allow_inf: True to allow Inf elements
+        min: An inclusive lower bound for the elements
+        max: An inclusive upper bound for the elements
+        chunk_size: The number of elements checked at a time
+
+    Outputs:
+        Path: The path to the file
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        NotRealError: If the file does not hold real-valued numbers
+        CannotConvertToReal: If the file cannot be read as an array
+        IsNaNError: If an element is NaN
+        IsInfError: If an element is Inf
+        NotGreaterEqual: If an element is less than min
+        NotLessEqual: If an element is greater than max
+        ValueError: If chunk_size is not a positive int
+    """
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(
+            f"chunk_size must be a positive int, but it is {chunk_size!r}"
+        )
+
+    # Imported on first use, so that scalar checks do not import pathlib
+    from scicheck.path import _existing_file
+    file = _existing_file(input, name, strict=strict)
+    description = 'an array of real-valued numbers'
+    opener = lambda file: _open_file(file, dtype)
+    array = convert(file, opener, name, description, CannotConvertToReal)
+
+    # Release the mapping before raising, so that errors (and their tracebacks)
+    # do not keep the file mapped
+    if array.dtype.kind not in 'biuf':
+        del array
+        raise NotRealError(_message.not_type, name, description)
+    failure = _scan_file(array, chunk_size, allow_nan, allow_inf, min, max)
+    del array
+    if failure is None:
+        return file
+
+    # Report the first invalid element
+    error, description, bound, index, offset, value = failure
+    if bound is None:
+        raise error(_message.file_element, name, description, index, offset)
+    raise error(
+        _message.file_bound, name, description, bound, index, offset, value
+    )
+
+
+def _scan_file(
+    array: ndarray,
+    chunk_size: int,
+    allow_nan: bool,
+    allow_inf: bool,
+    min: Real | None,
+    max: Real | None,
+) -> tuple | None:
+    """Checks the elements of a mapped file in file order, one chunk at a time.
+    Returns (error, description, bound, index, offset, value) for the first
+    invalid element, or None if every element is valid"""
+
+    flat = array.reshape(-1, order=_order(array))
+    for start in range(0, flat.size, chunk_size):
+        chunk = numpy().asarray(flat[start : start + chunk_size])
+        failure = _check_chunk(chunk, allow_nan, allow_inf, min, max)
+        if failure is not None:
+            index, error, description, bound = failure
+            value = chunk[index]
+            index, offset = _file_index(array, start + index)
+            return error, description, bound, index, offset, value
+    return None
+
+
+#####
+# Comparisons
+#####
+
+# Arrays larger than this are reduced in blocks that fit in cache, so that the
+# min and max reductions read each block from memory once rather than twice
+_EXTREMA_BLOCK = 2**16
+
 
 def _operator(op: Callable):
     "Returns the description and error associated with different operators"
@@ -240,80 +1091,187 @@ def _operator(op: Callable):
         return 'greater than or equal to', NotGreaterEqual
 
 
+def _extrema(input: ndarray, low: bool, high: bool) -> tuple[Any, Any]:
+    "Returns the min and/or max of an array in a single pass over memory"
+
+    contiguous = input.flags.c_contiguous or input.flags.f_contiguous
+    if not (low and high and contiguous) or input.size <= _EXTREMA_BLOCK:
+        minimum = input.min() if low else None
+        maximum = input.max() if high else None
+        return minimum, maximum
+
+    # The max of each block is computed while the block is still in cache
+    flat = input.ravel(order='K')
+    minima = []
+    maxima = []
+    for start in range(0, flat.size, _EXTREMA_BLOCK):
+        block = flat[start : start + _EXTREMA_BLOCK]
+        minima.append(block.min())
+        maxima.append(block.max())
+    np = numpy()
+    return np.min(minima), np.max(maxima)
+
 
 def _compare(
-    input: Real, 
-    isvalid: Callable, 
-    X: Real, 
-    name: str, 
-    ComparisonError: ComparisonError,
-) -> None:
+    input: Real | ndarray,
+    comparisons: list[tuple[Callable, Real, ComparisonError]],
+    name: str,
+) -> Real | ndarray:
+    """Checks an input passes each (operator, bound, error) comparison. Arrays are
+    checked with min/max reductions, and only the failing comparison builds a mask
+    to locate the first invalid element"""
 
-    if not op(input, X):
-        description, error = _operator(op)
-        raise error(input, description, X, name)
+    # Scalars. Arrays can only exist once numpy was imported, so scalar checks never
+    # import it
+    np = sys.modules.get('numpy')
+    if np is None or not isinstance(input, np.ndarray):
+        for op, X, error in comparisons:
+            try:
+                valid = op(input, X)
+            except TypeError as cause:
+                raise NotRealError(
+                    _message.not_type, name, 'a real-valued number or numpy array'
+                ) from cause
+            if not valid:
+                description, _ = _operator(op)
+                raise error(_message.not_compared, name, description, X, input)
+        return input
+
+    # Arrays. NaN elements propagate to the extrema, so they also fail
+    if input.size == 0:
+        return input
+    low = any(op in (gt, ge) for op, _, _ in comparisons)
+    high = any(op in (lt, le) for op, _, _ in comparisons)
+    minimum, maximum = _extrema(input, low, high)
+    for op, X, error in comparisons:
+        extreme = minimum if op in (gt, ge) else maximum
+        if not op(extreme, X):
+            index = _first_index(~op(input, X))
+            value = input[index]
+            description, _ = _operator(op)
+            raise error(
+                _message.element_not_compared, name, description, X, index, value
+            )
+    return input
 
 
-# def less(input: Real, X: Real, name: str = 'input') -> None:
-#     _compare(input, lt, X, name)
-    
-# def less_equal(input: Real, X: Real, name: str = 'input') -> None:
-#     _compare(input, le, X, name)
+def less(input: Real | ndarray, X: Real, name: str = 'input') -> Real | ndarray:
+    "Checks that an input (or every element of an array) is less than X"
+    return _compare(input, [(lt, X, NotLess)], name)
 
-# def greater(input: Real, X: Real, name: str = 'input') -> None:
-#     _compare(input, gt, X, name)
+def less_equal(input: Real | ndarray, X: Real, name: str = 'input') -> Real | ndarray:
+    "Checks that an input (or every element of an array) is <= X"
+    return _compare(input, [(le, X, NotLessEqual)], name)
 
-# def greater_equal(input: Real, X: Real, name: str = 'input') -> None:
-#     _compare(input, ge, X, name)
+def greater(input: Real | ndarray, X: Real, name: str = 'input') -> Real | ndarray:
+    "Checks that an input (or every element of an array) is greater than X"
+    return _compare(input, [(gt, X, NotGreater)], name)
 
+def greater_equal(input: Real | ndarray, X: Real, name: str = 'input') -> Real | ndarray:
+    "Checks that an input (or every element of an array) is >= X"
+    return _compare(input, [(ge, X, NotGreaterEqual)], name)
 
 
-# #####
-# # Inclusive/Exclusive Ranges
-# #####
+#####
+# Inclusive/Exclusive Ranges
+#####
 
-# def in_range(
-#     input: Real, 
-#     min: Real, 
-#     max: Real,
-#     name: str = 'input',
-#     *, 
-#     include_min: bool = True, 
-#     include_max: bool = True,
-# ) -> None:
+def in_range(
+    input: Real | ndarray, 
+    min: Real | None, 
+    max: Real | None,
+    name: str = 'input',
+    *, 
+    include_min: bool = True, 
+    include_max: bool = True,
+) -> Real | ndarray:
+    """
+    Checks that an input (or every element of an array) is within a range
+    ----------
+    in_range(input, min, max)
+    in_range(input, min, max, name)
+    Checks that min <= input <= max. Either bound may be None to skip it. Arrays
+    are checked with a single pass that computes their min and max together, and
+    errors report the index and value of the first element outside the range.
+    NaN is never within a range.
+
+    in_range(..., *, include_min=False)
+    in_range(..., *, include_max=False)
+    Excludes a bound from the range.
+    ----------
+    Inputs:
+        input: A real-valued number or numpy array
+        min: The lower bound, or None
+        max: The upper bound, or None
+        name: A name for the input
+        include_min: True if the range includes min
+        include_max: True if the range includes max
+
+    Outputs:
+        Real | ndarray: The input
+
+    Raises:
+        NotRealError: If the input cannot be compared to the bounds
+        NotGreaterEqual / NotGreater: If an element is below the range
+        NotLessEqual / NotLess: If an element is above the range
+    """
     
-#     # Get the operators for each bound
-#     bounds = (
-#         (min, include_min, ge, gt),
-#         (max, include_max, le, lt),
-#     )
+    # Get the operators for each bound
+    bounds = (
+        (min, include_min, (ge, NotGreaterEqual), (gt, NotGreater)),
+        (max, include_max, (le, NotLessEqual), (lt, NotLess)),
+    )
 
-#     # Compare to each bound. Skip any unprovided bounds
-#     for bound, use_inclusive, inclusive, exclusive in bounds:
-#         op = inclusive if use_inclusive else exclusive
-#         _compare(input, op, bound, name)
+    # Compare to each bound. Skip any unprovided bounds
+    comparisons = []
+    for bound, use_inclusive, inclusive, exclusive in bounds:
+        if bound is not None:
+            op, error = inclusive if use_inclusive else exclusive
+            comparisons.append((op, bound, error))
+    return _compare(input, comparisons, name)
 
 
-# def _sign(
-#     input: Real, 
-#     name: str, 
-#     allow_zero: bool, 
-#     inclusive: Callable, 
-#     exclusive: Callable, 
-#     error: Exception
-# ):
+#####
+# Sign
+#####
 
-#     op = inclusive if allow_zero else exclusive
-#     if not op(input, 0):
-#         description, _ = _operator(op)
-#         raise error(input, description, 0, name)
+def _sign(
+    input: Real | ndarray, 
+    name: str, 
+    allow_zero: bool, 
+    inclusive: tuple[Callable, ComparisonError], 
+    exclusive: tuple[Callable, ComparisonError], 
+) -> Real | ndarray:
+    op, error = inclusive if allow_zero else exclusive
+    return _compare(input, [(op, 0, error)], name)
 
 
-# def positive(input: Real, name: str = 'input', *, allow_zero: bool = False):
-#     _sign(input, name, allow_zero, inclusive=ge, exclusive=gt, error=NotPositiveError)
+def positive(
+    input: Real | ndarray, name: str = 'input', *, allow_zero: bool = False
+) -> Real | ndarray:
+    "Checks that an input (or every element of an array) is positive"
+    return _sign(
+        input, 
+        name, 
+        allow_zero, 
+        inclusive=(ge, NotPositiveOrZero), 
+        exclusive=(gt, NotPositive),
+    )
 
-# def negative(input: Real, name: str = 'input', *, allow_zero: bool = False):
-#     _sign(input, name, allow_zero, inclusive=le, exclusive=lt, error=NotNegativeError)
+def negative(
+    input: Real | ndarray, name: str = 'input', *, allow_zero: bool = False
+) -> Real | ndarray:
+    "Checks that an input (or every element of an array) is negative"
+    return _sign(
+        input, 
+        name, 
+        allow_zero, 
+        inclusive=(le, NotNegativeOrZero), 
+        exclusive=(lt, NotNegative),
+    )
 
 
- 
+# Instrumentation can be enabled for a whole program by environment variable
+if "SCICHECK_INSTRUMENT" in os.environ:
+    from scicheck.instrument import _from_environment
+    _from_environment(__name__)
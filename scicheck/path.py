@@ -1,10 +1,15 @@
 
 from __future__ import annotations
 
-import typing
-from pathlib import Path
+import os
+from errno import EBADF, ELOOP, ENOENT, ENOTDIR
+from fnmatch import translate
+from functools import partial
+from pathlib import Path, PurePath
+from re import compile as compile_regex
+from stat import S_ISDIR, S_ISREG
 
-from scicheck.utils import check_type
+from scicheck.utils import check_type, try_convert
 from scicheck import _message
 from scicheck.errors import (
     CannotConvertToPath,
@@ -15,11 +20,24 @@ from scicheck.errors import (
     FolderExistsError,
     FolderNotFoundError,
     NotFolderError,
-    FolderNotEmpty
+    FolderNotEmpty,
+    MissingContentError,
+    PathError,
+    TooFewFiles,
 )
 
-if typing.TYPE_CHECKING:
-    from typing import Any
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    from typing import Any, Iterable, Optional
+    from scicheck.cache import PathCache
+
+# The cache of validated paths installed by `scicheck.cache`, or None
+_cache: PathCache | None = None
+
+# The working directory of cache keys for relative inputs. Read on first use, and
+# cleared by `scicheck.cache` on os.chdir, so cached checks do not call getcwd
+_cwd: str | None = None
 
 
 def path(
@@ -41,62 +59,212 @@ def path(
         CannotConvertToType=CannotConvertToPath
     )
 
-    # Optionally resolve
+    # Optionally resolve. Resolution costs a syscall per path component, so
+    # resolved str and Path inputs are cached when a cache is installed
     if resolve:
+        cache = _cache
+        if cache is not None and isinstance(input, (str, Path)):
+            key = _cache_key('path', input, strict)
+            resolved = cache.get(key)
+            if resolved is None:
+                resolved = path.resolve()
+                cache.put(key, resolved)
+            return resolved
         path = path.resolve()
     return path
 
 
+def try_path(
+    input: Any, 
+    *, 
+    strict: bool = False, 
+    resolve: bool = True,
+    default: Any = None,
+) -> Any:
+    "Non-raising version of `path`. Returns `default` for invalid inputs"
+
+    if not isinstance(input, Path):
+        if strict:
+            return default
+        input = try_convert(input, Path)
+        if input is None:
+            return default
+    if resolve:
+        input = input.resolve()
+    return input
+
+
 #####
 # File
 #####
 
+# Errors from os.stat that indicate a path does not exist. Matches Path.exists
+_MISSING = (ENOENT, ENOTDIR, EBADF, ELOOP)
 
-def _check_type(path: Path, type: str, name: str):
-    
-    # Get the validator and error associated with the type
+
+def _stat(path: Path) -> os.stat_result | None:
+    "Returns the stat result for a path, or None if the path does not exist"
+    try:
+        return os.stat(path)
+    except OSError as error:
+        if error.errno in _MISSING:
+            return None
+        raise
+
+
+def _wrong_type(path: Path, type: str, name: str) -> NotFileError | NotFolderError:
+    "Returns the error for a path that does not point to the expected type"
+    error = NotFileError if type == 'file' else NotFolderError
+    return error(_message.wrong_path, name, path, type)
+
+
+def _check_type(path: Path, mode: int, type: str, name: str):
+    "Checks that the mode from a stat result matches the expected path type"
     if type == 'file':
-        valid = path.is_file()
-        error = NotFileError
+        valid = S_ISREG(mode)
     elif type == 'folder':
-        valid = path.is_dir()
-        error = NotFolderError
-
-    # Error if not valid
+        valid = S_ISDIR(mode)
     if not valid:
-        message = _message.wrong_path(name, path, type)
-        raise error(message)
+        raise _wrong_type(path, type, name)
+
+
+def _cache_key(kind: str, input: str | Path, *options: Any) -> tuple:
+    """Returns the cache key of a check. Relative inputs are also keyed on the
+    working directory, so that they are not found after os.chdir"""
+    global _cwd
+    if os.path.isabs(input):
+        cwd = None
+    else:
+        cwd = _cwd
+        if cwd is None:
+            cwd = _cwd = os.getcwd()
+    return (kind, input, cwd, *options)
 
 
-def _existing(input, type, name, strict, MissingError):
-    input = path(input, name, strict=strict, resolve=True)
-    if not input.exists():
-        message = _message.missing(name, input)
-        raise MissingError(message)
-    _check_type(input, type, name)
+def _existing(input, type, name, strict, resolve, MissingError):
+    # Successful checks of str and Path inputs are cached, when a cache is installed
+    cache = _cache
+    if cache is not None and isinstance(input, (str, Path)):
+        key = _cache_key(type, input, strict, resolve)
+        output = cache.get(key)
+        if output is None:
+            output = _check_existing(input, type, name, strict, resolve, MissingError)
+            cache.put(key, output)
+        return output
+    return _check_existing(input, type, name, strict, resolve, MissingError)
+
+
+def _check_existing(input, type, name, strict, resolve, MissingError):
+    "Checks that a path exists and is the expected type"
+
+    # Resolved here, so that the resolved path is only cached for the check.
+    # Resolving costs an lstat per path component, so the check is a single stat
+    # only when resolve=False
+    input = _path(input, name, strict=strict, resolve=False)
+    if resolve:
+        input = input.resolve()
+    stat = _stat(input)
+    if stat is None:
+        raise MissingError(_message.missing, name, input)
+    _check_type(input, stat.st_mode, type, name)
     return input
  
     
-def existing_file(input: Any, name: str = 'input', *, strict: bool = False):
-    return _existing(input, 'file', name, strict, FileNotFoundError)
+def existing_file(
+    input: Any, name: str = 'input', *, strict: bool = False, resolve: bool = True
+) -> Path:
+    return _existing(input, 'file', name, strict, resolve, FileNotFoundError)
 
-def existing_folder(input: Any, name: str = 'input', *, strict: bool = False):
-    return _existing(input, 'folder', name, strict, FolderNotFoundError)
+def existing_folder(
+    input: Any,
+    name: str = 'input',
+    *,
+    strict: bool = False,
+    resolve: bool = True,
+    contains: Iterable[str | PurePath] = (),
+    patterns: Iterable[str] = (),
+    min_files: int = 0,
+    recursive: bool = False,
+) -> Path:
+    """
+    Checks that an input points to an existing folder
+    ----------
+    existing_folder(input)
+    existing_folder(input, name)
+    Checks that an input points to an existing folder and returns the path.
 
-def _new(input, type, name, strict, exist_ok, ExistsError):
+    existing_folder(..., *, contains)
+    existing_folder(..., *, patterns)
+    existing_folder(..., *, min_files)
+    existing_folder(..., *, recursive=True)
+    Also checks the contents of the folder. `contains` lists paths, relative to
+    the folder, that must exist. Paths ending in "/" must be subfolders, and all
+    others must be files. `patterns` lists glob patterns that must each match at
+    least one entry, and `min_files` is the minimum number of files the folder
+    must hold. Use recursive=True to match patterns against the paths of entries
+    relative to the folder (as with fnmatch, "*" also matches "/"), and to count
+    files, throughout the folder's subtree.
 
-    input = path(input, name, strict=strict, resolve=True)
-    if input.exists():
-        if not exist_ok:
-            message = _message.exists(name, path)
-            raise ExistsError(message)
-        _check_type(path, type, name)
-    return input
+    Each folder is listed at most once with os.scandir, and listing stops as soon
+    as every requirement is met, or at the first required entry of the wrong
+    type. When only `contains` is given, nothing needs counting, so each required
+    entry is checked with a single stat instead. Content checks are never cached
+    by `scicheck.cache`.
+    ----------
+    Inputs:
+        input: The path being validated
+        name: A name for the folder
+        strict: True to require a pathlib.Path input
+        resolve: True to return the resolved path
+        contains: Relative paths of required files, and subfolders ending in "/".
+            A single str is one path
+        patterns: Glob patterns that must each match an entry
+        min_files: The minimum number of files in the folder
+        recursive: True to match patterns and count files in subfolders
+
+    Outputs:
+        Path: The validated folder
 
+    Raises:
+        FolderNotFoundError: If the folder does not exist
+        NotFolderError: If the path is not a folder, or a required subfolder is not
+        NotFileError: If a required file is not a file
+        MissingContentError: If a required entry or pattern match is missing
+        TooFewFiles: If the folder holds fewer than min_files files
+    """
+
+    folder = _existing(input, 'folder', name, strict, resolve, FolderNotFoundError)
+    if isinstance(contains, str):
+        contains = [contains]
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    if contains or patterns or min_files:
+        _check_contents(folder, name, contains, patterns, min_files, recursive)
+    return folder
 
+def _new(input, type, name, strict, resolve, exist_ok, ExistsError):
+    "Returns the path, and whether it already exists"
 
-def new_file(input: Any, name: str = 'input', *, strict: bool = False, exist_ok: bool = False):
-    return _new(input, 'file', name, strict, exist_ok, FileExistsError)
+    input = _path(input, name, strict=strict, resolve=resolve)
+    stat = _stat(input)
+    if stat is None:
+        return input, False
+    elif not exist_ok:
+        raise ExistsError(_message.exists, name, input)
+    _check_type(input, stat.st_mode, type, name)
+    return input, True
+
+
+def new_file(
+    input: Any, 
+    name: str = 'input', 
+    *, 
+    strict: bool = False, 
+    resolve: bool = True,
+    exist_ok: bool = False,
+) -> Path:
+    file, _ = _new(input, 'file', name, strict, resolve, exist_ok, FileExistsError)
+    return file
 
 
 def new_folder(
@@ -104,14 +272,552 @@ def new_folder(
     name: str = 'input', 
     *, 
     strict: bool = False, 
+    resolve: bool = True,
     exist_ok: bool = False,
     require_empty: bool = True,
-):
+) -> Path:
     
-    folder = _new(input, 'folder', name, strict, exist_ok, FolderExistsError)
-    if require_empty and any(folder.iterdir()):
-        message = _message.not_empty(name, path)
-        raise FolderNotEmpty(message)
+    folder, exists = _new(
+        input, 'folder', name, strict, resolve, exist_ok, FolderExistsError
+    )
+    if exists and require_empty:
+        with os.scandir(folder) as entries:
+            empty = next(entries, None) is None
+        if not empty:
+            raise FolderNotEmpty(_message.not_empty, name, folder)
     return folder
 
 
+# Private references to the checkers, used by the checkers that call them.
+# Policies and instrumentation rebind the public names, which must not change
+# the paths that other checkers receive
+_path = path
+_existing_file = existing_file
+
+
+#####
+# Folder contents
+#####
+
+
+def _manifest(
+    contains: Iterable[str | PurePath],
+) -> dict[str, dict[str, tuple[str, bool]]]:
+    """Groups required entries by their parent folder, relative to the checked
+    folder. Maps each entry's name to its (item, is_folder)"""
+
+    required = {}
+    for item in contains:
+        item = os.fspath(item)
+        path = PurePath(item)
+        if not path.parts or path.is_absolute() or '..' in path.parts:
+            raise ValueError(
+                "contains must list paths within the folder, but it includes "
+                f"{item!r}"
+            )
+        parent = '/'.join(path.parts[:-1])
+        folder = item.endswith(('/', os.sep))
+        required.setdefault(parent, {})[path.parts[-1]] = (item, folder)
+    return required
+
+
+def _check_entry(entry: os.DirEntry, item: str, folder: bool, name: str):
+    "Checks that a required entry is the expected type"
+    if entry.is_dir() if folder else entry.is_file():
+        return
+
+    # Broken symlinks do not point to anything, so the entry is missing
+    path = Path(entry.path)
+    if entry.is_symlink() and _stat(path) is None:
+        raise MissingContentError(_message.missing_content, name, item, path)
+    _wrong_content(path, item, folder, name)
+
+
+def _wrong_content(path: Path, item: str, folder: bool, name: str):
+    "Raises the error for a required entry of the wrong type"
+    if folder:
+        raise NotFolderError(_message.wrong_content, name, item, 'folder', path)
+    raise NotFileError(_message.wrong_content, name, item, 'file', path)
+
+
+def _stat_contents(
+    folder: Path, name: str, required: dict[str, dict[str, tuple[str, bool]]]
+):
+    "Checks required entries with a stat each, without listing their folders"
+    for entries in required.values():
+        for item, is_folder in entries.values():
+            path = folder / item
+            stat = _stat(path)
+            if stat is None:
+                raise MissingContentError(_message.missing_content, name, item, path)
+            mode = stat.st_mode
+            if not (S_ISDIR(mode) if is_folder else S_ISREG(mode)):
+                _wrong_content(path, item, is_folder, name)
+
+
+def _check_contents(
+    folder: Path,
+    name: str,
+    contains: Iterable[str | PurePath],
+    patterns: Iterable[str],
+    min_files: int,
+    recursive: bool,
+):
+    "Checks the contents of a folder, listing each folder at most once"
+
+    required = _manifest(contains)
+    if not patterns and not min_files:
+        return _stat_contents(folder, name, required)
+    remaining = sum(len(items) for items in required.values())
+    unmatched = {
+        pattern: compile_regex(translate(pattern)).match for pattern in patterns
+    }
+    files = 0
+
+    # Queue (relative folder, counted) pairs. Counted folders are the checked
+    # folder and, when recursive, its subfolders. Their entries are counted and
+    # matched against patterns. The parents of required entries are only listed
+    # to find those entries, after the counted folders
+    queue = [('', True)]
+    while queue or required:
+        if not queue:
+            queue.append((next(iter(required)), False))
+        relative, counted = queue.pop()
+        needed = required.pop(relative, {})
+        prefix = f"{relative}/" if relative else ''
+
+        try:
+            entries = os.scandir(os.path.join(folder, relative))
+        except OSError:
+            # Subfolders may be removed while they are listed
+            if not needed:
+                continue
+            item, _ = next(iter(needed.values()))
+            raise MissingContentError(
+                _message.missing_content, name, item, folder / item
+            ) from None
+
+        with entries:
+            for entry in entries:
+                if needed:
+                    required_entry = needed.pop(entry.name, None)
+                    if required_entry is not None:
+                        _check_entry(entry, *required_entry, name)
+                        remaining -= 1
+
+                if counted:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            queue.append((prefix + entry.name, True))
+                    elif entry.is_file():
+                        files += 1
+                    if unmatched:
+                        path = prefix + entry.name
+                        matched = [p for p, match in unmatched.items() if match(path)]
+                        for pattern in matched:
+                            del unmatched[pattern]
+
+                # Stop listing as soon as every requirement is met
+                if not remaining and not unmatched and files >= min_files:
+                    return
+                elif not counted and not needed:
+                    break
+
+        if needed:
+            item, _ = next(iter(needed.values()))
+            raise MissingContentError(
+                _message.missing_content, name, item, folder / item
+            )
+
+    if unmatched:
+        pattern = next(iter(unmatched))
+        raise MissingContentError(_message.unmatched_pattern, name, pattern, folder)
+    if files < min_files:
+        raise TooFewFiles(_message.too_few_files, name, min_files, folder)
+
+
+#####
+# Batches
+#####
+
+
+def _listing(folder: Path) -> dict[str, os.DirEntry] | None:
+    "Lists a folder once. Returns None if the folder cannot be listed"
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return None
+
+
+def _existing_entry(
+    input: Path,
+    parent: Path,
+    listing: dict[str, os.DirEntry] | None,
+    type: str,
+    name: str,
+    resolve: bool,
+    MissingError: type[PathError],
+) -> Path:
+    "Checks a path against the cached listing of its parent folder"
+
+    # Symlinks, names missing from the listing (which may differ only by case
+    # on some filesystems), and unlisted folders fall back to a single-path check
+    entry = None if listing is None else listing.get(input.name)
+    if entry is None or entry.is_symlink():
+        return _existing(input, type, name, True, resolve, MissingError)
+
+    # Otherwise, the entry's cached type answers the check without a syscall
+    if type == 'file':
+        valid = entry.is_file(follow_symlinks=False)
+    else:
+        valid = entry.is_dir(follow_symlinks=False)
+    if resolve:
+        input = parent / input.name
+    if not valid:
+        raise _wrong_type(input, type, name)
+    return input
+
+
+def _existing_batch(
+    inputs: Iterable[Any], type, name, strict, resolve, collect, MissingError
+):
+    "Checks a batch of paths, listing each parent folder at most once"
+
+    # Convert inputs and group them by parent folder
+    paths = {}
+    errors = {}
+    groups = {}
+    for index, input in enumerate(inputs):
+        label = f"{name}[{index}]"
+        try:
+            input = _path(input, label, strict=strict, resolve=False)
+        except PathError as error:
+            if not collect:
+                raise
+            errors[index] = error
+            continue
+        groups.setdefault(input.parent, []).append((index, label, input))
+
+    # Folders holding a single path are cheaper to stat than to list. Resolve
+    # each parent once, rather than every component of every path
+    for parent, members in groups.items():
+        listing = _listing(parent) if len(members) > 1 else None
+        if resolve and listing is not None:
+            parent = parent.resolve()
+        for index, label, input in members:
+            try:
+                paths[index] = _existing_entry(
+                    input, parent, listing, type, label, resolve, MissingError
+                )
+            except PathError as error:
+                if not collect:
+                    raise
+                errors[index] = error
+
+    return _in_order(paths, errors, collect)
+
+
+def _in_order(paths: dict[int, Path], errors: dict[int, PathError], collect: bool):
+    """Returns the paths of a batch in input order. When collecting, invalid inputs
+    are None, so that the paths line up with the input indexes of the errors"""
+    if collect:
+        count = len(paths) + len(errors)
+        paths = [paths.get(index) for index in range(count)]
+        return paths, dict(sorted(errors.items()))
+    return [paths[index] for index in sorted(paths)]
+
+
+def existing_files(
+    inputs: Iterable[Any],
+    name: str = 'input',
+    *,
+    strict: bool = False,
+    resolve: bool = True,
+    collect: bool = False,
+) -> list[Path] | tuple[list[Path | None], dict[int, PathError]]:
+    """
+    Checks that a batch of inputs all point to existing files
+    ----------
+    existing_files(inputs)
+    existing_files(inputs, name)
+    Checks each input points to an existing file and returns the paths in input
+    order. Paths are grouped by parent folder, and each folder is listed once with
+    os.scandir, so a batch costs one metadata round trip per folder rather than
+    per path. Error messages name each path as "{name}[{index}]".
+
+    existing_files(..., *, collect=True)
+    Returns a (paths, errors) tuple instead of raising the first error. The paths
+    line up with the inputs, with None for each invalid input, and errors maps the
+    index of each invalid input to its error.
+    ----------
+    Inputs:
+        inputs: The paths being validated
+        name: A name for the batch of paths
+        strict: True to require pathlib.Path inputs
+        resolve: True to return resolved paths
+        collect: True to return errors instead of raising them
+
+    Outputs:
+        list[Path | None]: The validated paths, with None for invalid inputs
+        dict[int, PathError]: The errors for invalid inputs, when collecting
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+        NotFileError: If a path does not point to a file
+    """
+    return _existing_batch(
+        inputs, 'file', name, strict, resolve, collect, FileNotFoundError
+    )
+
+
+def existing_folders(
+    inputs: Iterable[Any],
+    name: str = 'input',
+    *,
+    strict: bool = False,
+    resolve: bool = True,
+    collect: bool = False,
+) -> list[Path] | tuple[list[Path | None], dict[int, PathError]]:
+    """
+    Checks that a batch of inputs all point to existing folders
+    ----------
+    existing_folders(inputs)
+    existing_folders(inputs, name)
+    existing_folders(..., *, collect=True)
+    Batch version of existing_folder. See existing_files for details.
+    ----------
+    Inputs:
+        inputs: The paths being validated
+        name: A name for the batch of paths
+        strict: True to require pathlib.Path inputs
+        resolve: True to return resolved paths
+        collect: True to return errors instead of raising them
+
+    Outputs:
+        list[Path | None]: The validated paths, with None for invalid inputs
+        dict[int, PathError]: The errors for invalid inputs, when collecting
+
+    Raises:
+        FolderNotFoundError: If a path does not exist
+        NotFolderError: If a path does not point to a folder
+    """
+    return _existing_batch(
+        inputs, 'folder', name, strict, resolve, collect, FolderNotFoundError
+    )
+
+
+#####
+# Async
+#####
+
+# The maximum number of threads shared by all async checks
+_THREADS = 32
+_executor = None
+
+# asyncio and concurrent.futures are slow to import, so they are imported on
+# first use. Async callers have always imported asyncio already
+
+
+def _threads() -> ThreadPoolExecutor:
+    "Returns the thread pool for async checks, creating it on first use"
+    global _executor
+    if _executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _executor = ThreadPoolExecutor(_THREADS, thread_name_prefix="scicheck")
+    return _executor
+
+
+async def _in_thread(checker, input, name, **options) -> Path:
+    "Runs a blocking path check in the thread pool"
+    import asyncio
+    loop = asyncio.get_running_loop()
+    check = partial(checker, input, name, **options)
+    return await loop.run_in_executor(_threads(), check)
+
+
+async def existing_file_async(
+    input: Any, name: str = 'input', *, strict: bool = False, resolve: bool = True
+) -> Path:
+    """
+    Async version of existing_file
+    ----------
+    Runs existing_file in a bounded thread pool, so the event loop is not blocked
+    by slow filesystem metadata calls. Raises the same errors as existing_file.
+    """
+    return await _in_thread(existing_file, input, name, strict=strict, resolve=resolve)
+
+
+async def existing_folder_async(
+    input: Any, name: str = 'input', *, strict: bool = False, resolve: bool = True
+) -> Path:
+    """
+    Async version of existing_folder
+    ----------
+    Runs existing_folder in a bounded thread pool, so the event loop is not blocked
+    by slow filesystem metadata calls. Raises the same errors as existing_folder.
+    """
+    return await _in_thread(
+        existing_folder, input, name, strict=strict, resolve=resolve
+    )
+
+
+async def new_folder_async(
+    input: Any, 
+    name: str = 'input', 
+    *, 
+    strict: bool = False, 
+    resolve: bool = True,
+    exist_ok: bool = False,
+    require_empty: bool = True,
+) -> Path:
+    """
+    Async version of new_folder
+    ----------
+    Runs new_folder in a bounded thread pool, so the event loop is not blocked
+    by slow filesystem metadata calls. Raises the same errors as new_folder.
+    """
+    return await _in_thread(
+        new_folder, 
+        input, 
+        name, 
+        strict=strict, 
+        resolve=resolve, 
+        exist_ok=exist_ok, 
+        require_empty=require_empty,
+    )
+
+
+async def _async_batch(checker, inputs, name, limit, collect, **options):
+    "Checks a batch of paths concurrently, with at most limit checks in flight"
+    import asyncio
+
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"limit must be a positive int, but it is {limit!r}")
+
+    # A fixed number of workers pull inputs in order, so that at most limit
+    # checks (and tasks) exist at once, however large the batch
+    pending = enumerate(inputs)
+    paths = {}
+    errors = {}
+
+    async def work():
+        for index, input in pending:
+            if errors and not collect:
+                return
+            try:
+                paths[index] = await _in_thread(
+                    checker, input, f"{name}[{index}]", **options
+                )
+            except PathError as error:
+                errors[index] = error
+
+    # Any other exception (such as PermissionError) stops the remaining workers
+    tasks = [asyncio.ensure_future(work()) for _ in range(limit)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    # Inputs are pulled in order, so every input before an error has been
+    # checked, and the first error in input order is deterministic
+    if errors and not collect:
+        raise errors[min(errors)]
+    return _in_order(paths, errors, collect)
+
+
+async def existing_files_async(
+    inputs: Iterable[Any],
+    name: str = 'input',
+    *,
+    strict: bool = False,
+    resolve: bool = True,
+    collect: bool = False,
+    limit: int = 16,
+) -> list[Path] | tuple[list[Path | None], dict[int, PathError]]:
+    """
+    Concurrently checks that a batch of inputs all point to existing files
+    ----------
+    existing_files_async(inputs)
+    existing_files_async(inputs, name)
+    Checks each input with existing_file in a bounded thread pool, with up to
+    limit checks in flight at once, and returns the paths in input order. This
+    hides the latency of network filesystems, where each metadata call is slow
+    but many can run at once. Error messages name each path as "{name}[{index}]".
+    Raises the first error in input order.
+
+    existing_files_async(..., *, limit)
+    Sets the maximum number of concurrent checks (default 16). Checks from all
+    calls share a pool of at most 32 threads.
+
+    existing_files_async(..., *, collect=True)
+    Returns a (paths, errors) tuple instead of raising the first error. See
+    existing_files for details.
+    ----------
+    Inputs:
+        inputs: The paths being validated
+        name: A name for the batch of paths
+        strict: True to require pathlib.Path inputs
+        resolve: True to return resolved paths
+        collect: True to return errors instead of raising them
+        limit: The maximum number of concurrent checks
+
+    Outputs:
+        list[Path | None]: The validated paths, with None for invalid inputs
+        dict[int, PathError]: The errors for invalid inputs, when collecting
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+        NotFileError: If a path does not point to a file
+    """
+    return await _async_batch(
+        existing_file, inputs, name, limit, collect, strict=strict, resolve=resolve
+    )
+
+
+async def existing_folders_async(
+    inputs: Iterable[Any],
+    name: str = 'input',
+    *,
+    strict: bool = False,
+    resolve: bool = True,
+    collect: bool = False,
+    limit: int = 16,
+) -> list[Path] | tuple[list[Path | None], dict[int, PathError]]:
+    """
+    Concurrently checks that a batch of inputs all point to existing folders
+    ----------
+    existing_folders_async(inputs)
+    existing_folders_async(inputs, name)
+    existing_folders_async(..., *, limit)
+    existing_folders_async(..., *, collect=True)
+    Async batch version of existing_folder. See existing_files_async for details.
+    ----------
+    Inputs:
+        inputs: The paths being validated
+        name: A name for the batch of paths
+        strict: True to require pathlib.Path inputs
+        resolve: True to return resolved paths
+        collect: True to return errors instead of raising them
+        limit: The maximum number of concurrent checks
+
+    Outputs:
+        list[Path | None]: The validated paths, with None for invalid inputs
+        dict[int, PathError]: The errors for invalid inputs, when collecting
+
+    Raises:
+        FolderNotFoundError: If a path does not exist
+        NotFolderError: If a path does not point to a folder
+    """
+    return await _async_batch(
+        existing_folder, inputs, name, limit, collect, strict=strict, resolve=resolve
+    )
+
+
+# Instrumentation can be enabled for a whole program by environment variable
+if "SCICHECK_INSTRUMENT" in os.environ:
+    from scicheck.instrument import _from_environment
+    _from_environment(__name__)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from functools import wraps
+from importlib import import_module
+from itertools import count
+
+from scicheck._layers import MODULES, checkers, wrap
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Iterator, Literal, Optional
+
+    Mode = Literal["full", "sample", "off"]
+
+_MODES = ("full", "sample", "off")
+
+# Maps "module.checker" names to the (mode, every) policies of the checkers that
+# are not "full"
+_policies: dict[str, tuple[str, Optional[int]]] = {}
+
+# Checkers whose output is not their input, so cannot be skipped. The try_
+# checkers return a default for invalid inputs, the batch checkers return lists
+# (or tuples with errors), real_file returns a Path for its input file, and the
+# array checkers convert lists and other array-likes to numpy arrays
+_UNSKIPPABLE = (
+    "existing_files",
+    "existing_folders",
+    "real_file",
+    "real_array",
+    "float_array",
+    "integer_array",
+    "numeric_array",
+)
+
+
+#####
+# Wrappers
+#####
+
+
+def _sampled(function: Callable, every: int) -> Callable:
+    "Returns a checker that only checks one in every N calls"
+
+    calls = count()
+
+    @wraps(function)
+    def sampled(input, *args, **kwargs):
+        if next(calls) % every:
+            return input
+        return function(input, *args, **kwargs)
+
+    return sampled
+
+
+def _trusted(function: Callable) -> Callable:
+    "Returns a checker that returns its input without checking it"
+
+    @wraps(function)
+    def trusted(input, *args, **kwargs):
+        return input
+
+    return trusted
+
+
+#####
+# Targets
+#####
+
+
+def _targets(targets: tuple[str, ...]) -> list[tuple[str, str]]:
+    """Parses checker and module names to a list of (module, checker) names.
+    Defaults to every checker of the numeric, path, and type modules"""
+
+    targets = targets or MODULES
+    output = []
+    for target in targets:
+        module_name, _, checker = target.removeprefix("scicheck.").partition(".")
+        if module_name not in MODULES:
+            allowed = ", ".join(repr(name) for name in MODULES)
+            raise ValueError(
+                f"Policies can only be set for the {allowed} modules and their "
+                f"checkers, not {target!r}"
+            )
+
+        module = import_module(f"scicheck.{module_name}")
+        names = list(checkers(module))
+        if checker and checker not in names:
+            raise ValueError(f"scicheck.{module_name} has no checker {checker!r}")
+        elif checker and not _skippable(checker):
+            raise ValueError(
+                f"Policies cannot be set for scicheck.{module_name}.{checker}, "
+                "because its output is not its input"
+            )
+        names = [checker] if checker else list(filter(_skippable, names))
+        output += [(module_name, name) for name in names]
+    return output
+
+
+def _skippable(checker: str) -> bool:
+    "True if a checker returns its input, so can be skipped by a policy"
+    return not checker.startswith("try_") and checker not in _UNSKIPPABLE
+
+
+def _check_mode(mode: str, every: Optional[int]) -> None:
+    "Checks a policy mode and its sampling interval"
+    if mode not in _MODES:
+        allowed = ", ".join(repr(option) for option in _MODES)
+        raise ValueError(f"mode must be one of {allowed}, but it is {mode!r}")
+    elif mode == "sample":
+        if not isinstance(every, int) or isinstance(every, bool) or every < 1:
+            raise ValueError(
+                f'every must be a positive int for "sample" mode, but it is {every!r}'
+            )
+    elif every is not None:
+        raise ValueError(f'every is only supported for "sample" mode, not {mode!r}')
+
+
+def _apply(module_name: str, name: str, mode: str, every: Optional[int]) -> None:
+    "Sets the policy of a checker, by swapping its function in the module"
+
+    key = f"{module_name}.{name}"
+    if mode == "full" or (mode == "sample" and every == 1):
+        _policies.pop(key, None)
+        wrapper = None
+    elif mode == "sample":
+        _policies[key] = (mode, every)
+        wrapper = lambda function: _sampled(function, every)
+    else:
+        _policies[key] = (mode, every)
+        wrapper = _trusted
+    wrap("policy", module_name, name, wrapper)
+
+
+#####
+# Policies
+#####
+
+
+def set_policy(mode: Mode, *targets: str, every: Optional[int] = None) -> None:
+    """
+    Sets how often the numeric, path, and type checkers check their inputs
+    ----------
+    set_policy(mode)
+    set_policy(mode, *targets)
+    Sets the policy of every checker in `scicheck.numeric`, `scicheck.path`, and
+    `scicheck.type`, or of the given targets. Targets may be module names (such as
+    "numeric"), or checker names (such as "numeric.real"). A later policy for a
+    module replaces any earlier policies for its checkers, so set module policies
+    before the policies of individual checkers.
+
+    "full" (default) checks every input. "off" replaces each checker with a
+    function that returns its input unchanged, so it costs a single call and never
+    converts the input (path checkers return strings as strings, and numeric
+    checkers do not parse numerals). Only use "off" for inputs that are already
+    known to be valid, such as the inputs of a kernel that was checked on its
+    first calls.
+
+    set_policy('sample', ..., *, every)
+    Checks only one in every N calls of each checker, starting with the first, and
+    returns the other inputs unchanged.
+
+    Only checkers that return their (converted) input can be skipped. The try_
+    checkers, the batch checkers `existing_files` and `existing_folders`,
+    `real_file`, and the array checkers (`real_array`, `float_array`,
+    `integer_array`, and `numeric_array`, which convert array-likes to numpy
+    arrays) always check their inputs, and are not valid targets. Checkers
+    that call other checkers (such as `existing_file`, which converts its input
+    with `path`) are not affected by the policies of the checkers they call.
+
+    Policies are applied by swapping the checkers in their modules, so "full"
+    checkers have no overhead. Policies apply to every thread, and do not affect
+    references taken before the policy was set (such as
+    `from scicheck.numeric import real`, or compiled validators).
+    ----------
+    Inputs:
+        mode: "full", "sample", or "off"
+        *targets: The names of modules or checkers. Defaults to all three modules
+        every: The sampling interval for "sample" mode
+
+    Raises:
+        ValueError: If the mode, a target, or the sampling interval is not valid
+    """
+
+    _check_mode(mode, every)
+    for module_name, name in _targets(targets):
+        _apply(module_name, name, mode, every)
+
+
+def get_policy(checker: str) -> tuple[str, int | None]:
+    """
+    Returns the policy of a checker
+    ----------
+    get_policy(checker)
+    Returns the (mode, every) policy of a checker named like "numeric.real". The
+    sampling interval is None unless the mode is "sample".
+    ----------
+    Inputs:
+        checker: The name of a checker
+
+    Outputs:
+        tuple[str, int | None]: The mode and sampling interval of the checker
+    """
+
+    targets = _targets((checker,))
+    if len(targets) != 1:
+        raise ValueError(f"{checker!r} is a module, not a checker")
+    return _policies.get(".".join(targets[0]), ("full", None))
+
+
+@contextmanager
+def policy(mode: Mode, *targets: str, every: Optional[int] = None) -> Iterator[None]:
+    """
+    Sets the policy of checkers within a with block
+    ----------
+    with policy(mode):
+    with policy(mode, *targets):
+    with policy('sample', ..., *, every):
+    Sets a policy (as for `set_policy`) for the block, and restores the previous
+    policies of the targets afterwards. The policy applies to every thread while
+    the block runs.
+    ----------
+    Inputs:
+        mode: "full", "sample", or "off"
+        *targets: The names of modules or checkers. Defaults to all three modules
+        every: The sampling interval for "sample" mode
+    """
+
+    _check_mode(mode, every)
+    targets = _targets(targets)
+    previous = [
+        (module_name, name, *_policies.get(f"{module_name}.{name}", ("full", None)))
+        for module_name, name in targets
+    ]
+    for module_name, name in targets:
+        _apply(module_name, name, mode, every)
+    try:
+        yield
+    finally:
+        for module_name, name, mode, every in previous:
+            _apply(module_name, name, mode, every)
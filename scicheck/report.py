@@ -0,0 +1,237 @@
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter, namedtuple
+from pathlib import PurePath
+
+from scicheck.errors import ScicheckError
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Iterator
+
+# Values of these types (and tuples of them) are stored as they are. Long strings
+# are truncated, and all other values are stored as their truncated repr
+_SCALARS = (bool, int, float, complex, type(None), PurePath, type)
+
+
+def _key(value: Any) -> Any:
+    """Returns the intern key of a value. Keys include types, so that equal values
+    of different types (such as 1, 1.0, and True) are not interned together"""
+    if isinstance(value, tuple):
+        return (tuple, tuple(_key(item) for item in value))
+    return (type(value), value)
+
+
+# A collections namedtuple rather than a typing.NamedTuple, since typing is slow
+# to import
+Failure = namedtuple("Failure", ["index", "field", "error", "value"])
+Failure.__doc__ = "A failure recorded in a ValidationReport"
+
+
+class ValidationReport:
+    """
+    A compact record of the failures from validating many items
+    ----------
+    ValidationReport()
+    ValidationReport(max_length)
+    Stores each failure as an item index, a field id, an error code, and the
+    offending value, rather than as an exception object. Indexes, field ids, and
+    error codes are held in typed arrays. Field names, error kinds, error fields,
+    and values are interned, so repeated failures share storage, and string values
+    are truncated to max_length characters. Exceptions, along with their messages,
+    are only built when requested, using the error's original class and fields.
+
+    Reports are returned by `scicheck.batch.stream` and `scicheck.batch.parallel`
+    with on_error="report".
+    ----------
+    Inputs:
+        max_length: The maximum length of stored string values
+
+    Outputs:
+        ValidationReport: An empty report
+    """
+
+    __slots__ = (
+        "max_length",
+        "indexes",
+        "fields",
+        "codes",
+        "_arguments",
+        "_values",
+        "_field_names",
+        "_kinds",
+        "_argument_table",
+        "_tables",
+    )
+
+    def __init__(self, max_length: int = 80):
+        self.max_length = max_length
+
+        # One entry per failure
+        self.indexes = array("q")
+        self.fields = array("I")
+        self.codes = array("I")
+        self._arguments = array("I")
+        self._values = []
+
+        # Interned field names, error kinds, and error fields
+        self._field_names = []
+        self._kinds = []
+        self._argument_table = []
+        self._tables = ({}, {}, {}, {})
+
+    def __repr__(self) -> str:
+        return f"ValidationReport({len(self)} failures)"
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __bool__(self) -> bool:
+        return len(self.indexes) > 0
+
+    def __iter__(self) -> Iterator[Failure]:
+        for k in range(len(self)):
+            yield self[k]
+
+    def __getitem__(self, k: int) -> Failure:
+        "Returns a recorded failure without building its exception"
+        error = self._kinds[self.codes[k]][0]
+        field = self._field_names[self.fields[k]]
+        return Failure(self.indexes[k], field, error, self._values[k])
+
+    def __reduce__(self):
+        # Rebuilt from its failures, so reports can be returned from worker processes
+        return (_rebuild, (self.max_length, list(self._records())))
+
+    #####
+    # Recording
+    #####
+
+    def _intern(self, table: int, item: Any, items: list) -> int:
+        "Returns the id of an item in an intern table, adding it if needed"
+        ids = self._tables[table]
+        key = _key(item)
+        id = ids.get(key)
+        if id is None:
+            id = ids[key] = len(items)
+            items.append(item)
+        return id
+
+    def _value(self, value: Any) -> Any:
+        "Truncates and interns a value"
+        if isinstance(value, str):
+            if len(value) > self.max_length:
+                value = value[: self.max_length] + "..."
+        elif isinstance(value, tuple):
+            value = tuple(self._value(item) for item in value)
+        elif not isinstance(value, _SCALARS):
+            value = self._value(repr(value))
+        return self._tables[3].setdefault(_key(value), value)
+
+    def add(
+        self,
+        index: int,
+        field: str,
+        error: ScicheckError,
+        value: Any = None,
+        *,
+        indexed: bool = False,
+    ):
+        """
+        Records a failure
+        ----------
+        Records the error for the item at index, for a field of the item (or the
+        name of the batch). The error's name is not stored when it is the field,
+        or "{field}[{index}]", so that it does not cost a string per failure. Use
+        indexed=True to name the built exception "{field}[{index}]" when the
+        error was raised with the name of the field.
+        """
+
+        # Separate the error's format from its fields, and drop the name field
+        # when it can be rebuilt from the field and index
+        format, *arguments = error.args or (None,)
+        position = mode = None
+        if callable(format):
+            names = list(error.fields)
+            if "name" in names:
+                position = names.index("name")
+                name = arguments[position]
+                if name == field:
+                    mode = "indexed" if indexed else "field"
+                elif name == f"{field}[{index}]":
+                    mode = "indexed"
+                if mode is not None:
+                    del arguments[position]
+
+        kind = (type(error), format, mode and position, mode)
+        arguments = tuple(self._value(argument) for argument in arguments)
+        self._append(index, field, kind, arguments, self._value(value))
+
+    def extend(self, report: ValidationReport, offset: int = 0) -> None:
+        "Adds the failures from another report, optionally offsetting their indexes"
+        for index, field, kind, arguments, value in report._records():
+            self._append(index + offset, field, kind, arguments, value)
+
+    def _records(self) -> Iterator[tuple]:
+        "Yields the full record of each failure"
+        for k in range(len(self)):
+            yield (
+                self.indexes[k],
+                self._field_names[self.fields[k]],
+                self._kinds[self.codes[k]],
+                self._argument_table[self._arguments[k]],
+                self._values[k],
+            )
+
+    def _append(self, index, field, kind, arguments, value) -> None:
+        "Adds a full failure record"
+        self.indexes.append(index)
+        self.fields.append(self._intern(0, field, self._field_names))
+        self.codes.append(self._intern(1, kind, self._kinds))
+        self._arguments.append(self._intern(2, arguments, self._argument_table))
+        self._values.append(value)
+
+    #####
+    # Errors
+    #####
+
+    def error(self, k: int) -> ScicheckError:
+        "Builds the exception for the kth failure"
+
+        error, format, position, mode = self._kinds[self.codes[k]]
+        arguments = list(self._argument_table[self._arguments[k]])
+        if mode is not None:
+            name = self._field_names[self.fields[k]]
+            if mode == "indexed":
+                name = f"{name}[{self.indexes[k]}]"
+            arguments.insert(position, name)
+        if format is None:
+            return error(*arguments)
+        return error(format, *arguments)
+
+    def errors(self) -> Iterator[tuple[int, ScicheckError]]:
+        "Yields the (index, exception) for each failure, building them one at a time"
+        for k in range(len(self)):
+            yield self.indexes[k], self.error(k)
+
+    def raise_first(self) -> None:
+        "Raises the exception for the first recorded failure, if there is one"
+        if self:
+            raise self.error(0)
+
+    def counts(self) -> dict[type[ScicheckError], int]:
+        "Returns the number of failures of each error class"
+        counts = Counter()
+        for code, count in Counter(self.codes).items():
+            counts[self._kinds[code][0]] += count
+        return dict(counts)
+
+
+def _rebuild(max_length: int, records: list[tuple]) -> ValidationReport:
+    "Rebuilds a pickled report"
+    report = ValidationReport(max_length)
+    for record in records:
+        report._append(*record)
+    return report
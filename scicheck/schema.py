@@ -0,0 +1,226 @@
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import partial
+
+from scicheck import _message
+from scicheck.errors import (
+    MissingFieldError,
+    NotRecordError,
+    ScicheckError,
+    UnknownFieldError,
+)
+from scicheck.validator import _bind
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable
+
+
+class Schema:
+    """
+    Validates records that map field names to values
+    ----------
+    Schema(fields)
+    Schema(fields, name)
+    Compiles a schema from a dict that maps field names to checkers. Checkers may
+    be scicheck checker functions (such as `scicheck.numeric.real`), validators
+    from `scicheck.validator.compile`, types, or any callable that accepts
+    (input, name=...). A nested dict (or Schema) validates a nested record.
+
+    Each checker is compiled once, with its field name bound, into a flat list of
+    (field, validator) steps. Validating a record is then a single loop over the
+    steps, with no per-record lookups of checkers, options, or error messages.
+    Fields of nested records are named "{parent}.{field}" in error messages.
+
+    Schema(..., *, optional)
+    Lists fields that records may omit. Omitted fields are left out of the output.
+
+    Schema(..., *, allow_extra=False)
+    Forbids fields that are not in the schema. By default, extra fields are copied
+    to the output without validation.
+    ----------
+    Inputs:
+        fields: Maps field names to checkers
+        name: A name for the record, used in error messages
+        optional: The names of fields that records may omit
+        allow_extra: True to allow fields that are not in the schema
+
+    Outputs:
+        Schema: A callable that validates a record and returns the validated copy
+    """
+
+    __slots__ = (
+        "fields", "name", "optional", "allow_extra", "_prefix", "_plan", "_names"
+    )
+
+    def __init__(
+        self,
+        fields: Mapping[str, Any],
+        name: str = "record",
+        *,
+        optional: Iterable[str] = (),
+        allow_extra: bool = True,
+        _prefix: str = "",
+    ):
+        self.fields = dict(fields)
+        self.name = name
+        self.optional = frozenset(optional)
+        self.allow_extra = allow_extra
+        self._prefix = _prefix
+
+        unknown = self.optional - self.fields.keys()
+        if unknown:
+            unknown = ", ".join(sorted(unknown))
+            raise TypeError(f"The optional fields are not in the schema: {unknown}")
+
+        # Compile each field's checker once, with its full name bound
+        self._plan = tuple(
+            (field, self._compile(field, checker), field not in self.optional)
+            for field, checker in self.fields.items()
+        )
+        self._names = frozenset(self.fields)
+
+    def _compile(self, field: str, checker: Any) -> Callable[[Any], Any]:
+        "Compiles the validator for a field. Nested records become nested schemas"
+
+        # Top-level fields are named by the field alone, which reads best for flat
+        # records. Nested fields are prefixed with the names of their parents
+        label = self._prefix + field
+        if isinstance(checker, Schema):
+            optional, allow_extra = checker.optional, checker.allow_extra
+            checker = checker.fields
+        else:
+            optional, allow_extra = (), self.allow_extra
+        if isinstance(checker, dict):
+            return Schema(
+                checker,
+                label,
+                optional=optional,
+                allow_extra=allow_extra,
+                _prefix=f"{label}.",
+            )
+        return _bind(checker, label)
+
+    def __reduce__(self):
+        # The compiled plan holds closures, so schemas are pickled by their
+        # arguments and recompiled. This lets schemas be sent to worker processes
+        options = {
+            "optional": self.optional,
+            "allow_extra": self.allow_extra,
+            "_prefix": self._prefix,
+        }
+        return (partial(Schema, **options), (self.fields, self.name))
+
+    def __repr__(self) -> str:
+        return f"Schema({self.fields!r}, {self.name!r})"
+
+    def __call__(self, record: Any) -> dict[str, Any]:
+        "Validates a record and returns the validated copy. Raises the first error"
+
+        if not isinstance(record, dict) and not isinstance(record, Mapping):
+            raise NotRecordError(_message.not_type, self.name, "mapping", (Mapping,))
+        output = dict(record) if self.allow_extra else {}
+        for field, check, required in self._plan:
+            try:
+                value = record[field]
+            except KeyError:
+                if required:
+                    raise MissingFieldError(
+                        _message.missing_field, self.name, field
+                    ) from None
+                continue
+            output[field] = check(value)
+
+        if not self.allow_extra and len(record) > len(output):
+            self._check_extra(record)
+        return output
+
+    def _check_extra(self, record: Mapping) -> None:
+        "Raises an error if a record has fields that are not in the schema"
+        extra = [field for field in record if field not in self._names]
+        if extra:
+            raise UnknownFieldError(_message.unknown_fields, self.name, extra)
+
+    def validate(
+        self, record: Any, *, collect: bool = False
+    ) -> dict[str, Any] | tuple[dict[str, Any], dict[str, ScicheckError]]:
+        """
+        Validates a record
+        ----------
+        schema.validate(record)
+        Returns the validated copy of the record. Raises the first error. This is
+        the same as calling the schema.
+
+        schema.validate(record, *, collect=True)
+        Returns a (record, errors) tuple instead of raising. The record holds the
+        valid fields, and errors maps the name of each invalid field to its error.
+        Errors in nested records are keyed by "{parent}.{field}". Errors for the
+        record itself (wrong type or unknown fields) are keyed by the record name.
+        ----------
+        Inputs:
+            record: The record being validated
+            collect: True to return errors instead of raising them
+
+        Outputs:
+            dict: The validated record
+            dict[str, ScicheckError]: The errors for invalid fields, when collecting
+
+        Raises:
+            NotRecordError: If the record is not a mapping
+            MissingFieldError: If a required field is missing
+            UnknownFieldError: If extra fields are forbidden and the record has one
+            ScicheckError: The error raised by the checker of an invalid field
+        """
+
+        if not collect:
+            return self(record)
+        errors = {}
+        output = self._collect(record, errors)
+        return ({} if output is None else output), errors
+
+    def _collect(
+        self, record: Any, errors: dict[str, ScicheckError]
+    ) -> dict[str, Any] | None:
+        """Validates a record, adding every error to errors instead of raising.
+        Returns the valid fields, or None if the record is not a mapping"""
+
+        if not isinstance(record, dict) and not isinstance(record, Mapping):
+            errors[self.name] = NotRecordError(
+                _message.not_type, self.name, "mapping", (Mapping,)
+            )
+            return None
+        output = dict(record) if self.allow_extra else {}
+
+        prefix = self._prefix
+        for field, check, required in self._plan:
+            try:
+                value = record[field]
+            except KeyError:
+                if required:
+                    errors[prefix + field] = MissingFieldError(
+                        _message.missing_field, self.name, field
+                    )
+                continue
+
+            # Nested schemas add their own errors, so that each is keyed by field
+            if isinstance(check, Schema):
+                nested = check._collect(value, errors)
+                if nested is None:
+                    output.pop(field, None)
+                else:
+                    output[field] = nested
+                continue
+            try:
+                output[field] = check(value)
+            except ScicheckError as error:
+                output.pop(field, None)
+                errors[prefix + field] = error
+
+        if not self.allow_extra:
+            try:
+                self._check_extra(record)
+            except UnknownFieldError as error:
+                errors[self.name] = error
+        return output
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import typing
+import os
 
 from scicheck.errors import CannotConvertToString, NotStringError, NotTypeError
 from scicheck.utils import check_type
 
-if typing.TYPE_CHECKING:
+TYPE_CHECKING = False
+if TYPE_CHECKING:
     from typing import Any, Optional
 
 # Alias for the built-in type object (whose name we will overshadow)
@@ -59,7 +60,7 @@ def type(
     """
 
     return check_type(
-        input, types, name, description, strict=True, TypeError=NotTypeError
+        input, types, name, description, strict=True, NotTypeError=NotTypeError
     )
 
 def string(
@@ -99,3 +100,7 @@ def string(
     )
 
 
+# Instrumentation can be enabled for a whole program by environment variable
+if "SCICHECK_INSTRUMENT" in os.environ:
+    from scicheck.instrument import _from_environment
+    _from_environment(__name__)
@@ -1,20 +1,37 @@
 
 from __future__ import annotations
 
-import typing
+from types import UnionType
 
 from scicheck import _message
 
-if typing.TYPE_CHECKING:
+# typing is slow to import, and annotations are only evaluated by type checkers,
+# so the checker modules define TYPE_CHECKING rather than importing typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from types import ModuleType
     from typing import Any, Callable, Optional
     from scicheck.errors import NotTypeError, CannotConvertToType
 
 
+def numpy() -> ModuleType:
+    "Imports numpy on first use, so that scalar validation does not require it"
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "Array validation requires numpy. Install it with `pip install numpy`"
+        ) from error
+    return numpy
+
+
 def astuple(input: Any) -> tuple:
     if isinstance(input, tuple):
         return input
     elif isinstance(input, list):
         return tuple(input)
+    elif isinstance(input, UnionType):
+        return input.__args__
     else:
         return (input,)
 
@@ -38,8 +55,7 @@ def check_type(
     if isinstance(input, types):
         return input
     elif strict:
-        message = _message.not_type(name, description, types)
-        raise NotTypeError(message)
+        raise NotTypeError(_message.not_type, name, description, types)
 
     # Attempt type conversion
     converter = types[0]
@@ -58,6 +74,15 @@ def convert(
     try:
         return converter(input)
     except Exception as error:
-        message = _message.cannot_convert(name, description)
-        raise CannotConvertToType(message) from error
+        message = _message.cannot_convert
+        raise CannotConvertToType(message, name, description) from error
+
 
+def try_convert(input: Any, converter: Callable) -> Any | None:
+    """Attempts to convert an object to a specific type. Returns None instead of
+    raising an error, so converters must not return None when they succeed"""
+
+    try:
+        return converter(input)
+    except Exception:
+        return None
@@ -0,0 +1,368 @@
+
+from __future__ import annotations
+
+from functools import partial, wraps
+from types import FunctionType, UnionType
+
+from scicheck import _message, numeric, type as type_module
+from scicheck.errors import CannotConvertToType as CannotConvertToType_
+from scicheck.errors import NotTypeError as NotTypeError_
+from scicheck.utils import astuple
+
+# inspect and typing are slow to import, and are only needed to decorate functions,
+# so they are imported by the decorator rather than by `compile`
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from inspect import Signature
+    from typing import Any, Callable, Optional
+    from scicheck.errors import CannotConvertToType, NotTypeError
+
+
+#####
+# Validators
+#####
+
+
+def _validator(types: tuple[type], fallback: Callable[[Any], Any]) -> Callable:
+    "Returns a function that passes through supported types and defers all others"
+
+    # A closure is used because it is cheaper to call than an object's __call__
+    def validator(input: Any) -> Any:
+        if isinstance(input, types):
+            return input
+        return fallback(input)
+
+    validator.types = types
+    validator.fallback = fallback
+    return validator
+
+
+def _raise(error: type[Exception], message: str) -> Callable:
+    "Returns a fallback that raises an error with a precompiled message"
+
+    def fallback(input: Any):
+        raise error(message)
+
+    return fallback
+
+
+def _convert(converter: Callable, error: type[Exception], message: str) -> Callable:
+    "Returns a fallback that converts an input, using a precompiled error message"
+
+    def fallback(input: Any) -> Any:
+        try:
+            return converter(input)
+        except Exception as cause:
+            raise error(message) from cause
+
+    return fallback
+
+
+#####
+# Compilation
+#####
+
+
+def _passthrough(checker: Callable, options: dict[str, Any]) -> tuple[type]:
+    "Returns the types that a scicheck checker always returns unchanged"
+
+    if checker is numeric.numeric:
+        return (int, float, complex)
+    elif checker is numeric.complex:
+        return (complex,)
+    elif checker is numeric.float:
+        return (float,)
+    elif checker is numeric.integer:
+        return (int,)
+    elif checker is numeric.real:
+        if options.get("allow_nan") and options.get("allow_inf"):
+            return (int, float)
+        return (int,)
+    elif checker is type_module.string:
+        return (str,)
+    elif checker is type_module.type:
+        return astuple(options["types"])
+    else:
+        return ()
+
+
+def _compile_checker(checker: Callable, name: str, options: dict[str, Any]):
+    "Compiles a scicheck checker function with bound name and options"
+
+    types = _passthrough(checker, options)
+    fallback = partial(checker, name=name, **options)
+    return _validator(types, fallback)
+
+
+def compile(
+    types: type | tuple[type] | Callable,
+    /,
+    name: str = "input",
+    description: Optional[str] = None,
+    *,
+    strict: Optional[bool] = None,
+    converter: Optional[Callable] = None,
+    NotTypeError: NotTypeError = NotTypeError_,
+    CannotConvertToType: CannotConvertToType = CannotConvertToType_,
+    **options: Any,
+) -> Callable[[Any], Any]:
+    """
+    Builds a reusable validator whose setup is performed once
+    ----------
+    compile(types, name)
+    compile(types, name, description)
+    Returns a validator function that checks an input is one of the supported
+    types. The type tuple, error class, and error message are resolved once, so
+    each call only costs an isinstance check on the success path.
+
+    compile(..., *, strict=False)
+    compile(..., *, strict=False, converter)
+    Returns a validator that attempts to convert unsupported inputs. The converter
+    defaults to the first supported type.
+
+    compile(checker, name, **options)
+    Compiles a scicheck checker function (such as `scicheck.numeric.float` or
+    `scicheck.type.string`) with a bound name and options. Inputs that the checker
+    always returns unchanged skip the function call entirely. All other inputs are
+    passed to the checker, so the validator behaves exactly like the checker.
+    ----------
+    Inputs:
+        types: The supported types, or a scicheck checker function
+        name: A name for the input being validated
+        description: A description of the supported types
+        strict: True (default) to forbid type conversion. False to allow it
+        converter: The callable used to convert unsupported inputs
+        NotTypeError: The error raised when a strict check fails
+        CannotConvertToType: The error raised when conversion fails
+        **options: Options for a compiled checker function
+
+    Outputs:
+        Callable: A function that validates a single input and returns it
+
+    Raises:
+        NotTypeError: If a strict compiled validator receives an unsupported type
+        CannotConvertToType: If a compiled validator cannot convert an input
+    """
+
+    # Checker functions
+    if isinstance(types, FunctionType):
+        if converter is not None or description is not None:
+            raise ValueError(
+                "converter and description are not supported when compiling a "
+                "checker function. Pass checker options as keywords instead"
+            )
+        if strict is not None:
+            options["strict"] = strict
+        return _compile_checker(types, name, options)
+    elif options:
+        unexpected = ", ".join(options)
+        raise TypeError(f"compile() got unexpected keyword arguments: {unexpected}")
+
+    # Resolve the types and error message once
+    types = astuple(types)
+    if strict is None or strict:
+        message = _message.not_type(name, description, types)
+        fallback = _raise(NotTypeError, message)
+    else:
+        if converter is None:
+            converter = types[0]
+        if description is None:
+            description = _message.strlist([type.__name__ for type in types])
+        message = _message.cannot_convert(name, description)
+        fallback = _convert(converter, CannotConvertToType, message)
+    return _validator(types, fallback)
+
+
+#####
+# Decorator
+#####
+
+def _bind(checker: Any, name: str) -> Callable[[Any], Any]:
+    "Converts a checker from a validation spec to a compiled single-input validator"
+
+    if hasattr(checker, "fallback"):
+        return checker
+    elif isinstance(checker, (type, tuple, UnionType)):
+        return compile(checker, name)
+    elif isinstance(checker, FunctionType):
+        return compile(checker, name)
+    elif callable(checker):
+        return partial(checker, name=name)
+    raise TypeError(f"The validation spec for {name} is not a checker or type")
+
+
+def _annotated(annotation: Any) -> Any:
+    "Returns the checker in an Annotated[type, checker] annotation, if there is one"
+    from typing import Annotated, get_origin
+
+    if get_origin(annotation) is Annotated:
+        for metadata in annotation.__metadata__:
+            if callable(metadata):
+                return metadata
+    return None
+
+
+def _hints(function: Callable) -> tuple[dict[str, Any], set[str]]:
+    """Resolves the annotations of a function. Returns the resolved annotations, and
+    the names of parameters whose Annotated annotations could not be resolved"""
+
+    from inspect import get_annotations
+    from typing import get_type_hints
+
+    try:
+        return get_type_hints(function, include_extras=True), set()
+    except (NameError, TypeError):
+        pass
+
+    # If any annotation cannot be resolved (for example, because it names a type
+    # imported under TYPE_CHECKING), resolve the others one at a time
+    hints = {}
+    unresolved = set()
+    namespace = getattr(function, "__globals__", {})
+    for name, annotation in get_annotations(function).items():
+        if isinstance(annotation, str):
+            try:
+                annotation = eval(annotation, namespace)
+            except Exception:
+                if "Annotated" in annotation:
+                    unresolved.add(name)
+                continue
+        hints[name] = annotation
+    return hints, unresolved
+
+
+def _plan(
+    function: Callable, signature: Signature, spec: dict[str, Any]
+) -> dict[str, Callable]:
+    "Returns the compiled validator for each validated parameter"
+    from inspect import Parameter
+
+    # Annotations are resolved once. Unresolvable annotations that may hold a
+    # checker are errors, rather than silently left unvalidated
+    hints, unresolved = _hints(function)
+
+    spec = dict(spec)
+    plan = {}
+    for name, parameter in signature.parameters.items():
+        checker = spec.pop(name, None)
+        if checker is None and name in unresolved:
+            raise TypeError(
+                f"Cannot resolve the annotation of {name} in "
+                f"{function.__qualname__}, so its checker cannot be used. Define "
+                "the names in the annotation at runtime, or pass the checker to "
+                "validate as a spec"
+            )
+        elif checker is None:
+            checker = _annotated(hints.get(name))
+        if checker is None:
+            continue
+        elif parameter.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            raise TypeError(f"Cannot validate the variadic parameter {name}")
+        plan[name] = _bind(checker, name)
+
+    if spec:
+        unknown = ", ".join(spec)
+        raise TypeError(f"{function.__qualname__} has no parameters named: {unknown}")
+    return plan
+
+
+class _Name:
+    "Formats as a bare variable name when a signature is converted to source code"
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def _wrapper(function: Callable, signature: Signature, plan: dict[str, Callable]):
+    """Generates a wrapper with the same signature as the function, so that Python
+    binds the arguments and each call only runs the compiled validators"""
+    from inspect import Parameter, Signature
+
+    namespace = {"__function": function}
+    parameters = []
+    arguments = []
+    for name, parameter in signature.parameters.items():
+        kind = parameter.kind
+
+        # Defaults are referenced from the namespace, rather than rebuilt from source
+        if parameter.default is not Parameter.empty:
+            default = f"__default_{name}"
+            namespace[default] = parameter.default
+            parameter = parameter.replace(default=_Name(default))
+        parameters.append(parameter.replace(annotation=Parameter.empty))
+
+        # Validate the argument, unless a parameter was left at its default
+        value = name
+        if name in plan:
+            check = f"__check_{name}"
+            namespace[check] = plan[name]
+            value = f"{check}({name})"
+            if parameter.default is not Parameter.empty:
+                value = f"({name} if {name} is {default} else {value})"
+
+        if kind is Parameter.VAR_POSITIONAL:
+            arguments.append(f"*{name}")
+        elif kind is Parameter.VAR_KEYWORD:
+            arguments.append(f"**{name}")
+        elif kind is Parameter.KEYWORD_ONLY:
+            arguments.append(f"{name}={value}")
+        else:
+            arguments.append(value)
+
+    signature = signature.replace(
+        parameters=parameters, return_annotation=Signature.empty
+    )
+    arguments = ", ".join(arguments)
+    source = f"def validated{signature}:\n    return __function({arguments})\n"
+    exec(source, namespace)
+    return namespace["validated"]
+
+
+def validate(function: Optional[Callable] = None, /, **spec: Any) -> Callable:
+    """
+    Decorates a function so that its inputs are validated on every call
+    ----------
+    @validate
+    Validates parameters annotated as Annotated[type, checker], where checker is a
+    scicheck checker such as `scicheck.numeric.real`.
+
+    @validate(**spec)
+    Validates the named parameters using the given checkers. Spec values may be
+    scicheck checker functions, validators from `compile`, types, or any callable
+    that accepts (input, name=...). Spec values override annotations.
+
+    The validation plan is compiled once, when the function is decorated. Each
+    checker is compiled with the parameter name bound, and a wrapper with the same
+    signature as the function is generated, so calls do not inspect the signature
+    or bind arguments in Python. The validated (and possibly converted) values are
+    passed to the function. Parameters left at their defaults are not validated.
+    Annotations are resolved when the function is decorated. Annotations that
+    cannot be resolved (such as names imported under TYPE_CHECKING) are ignored,
+    unless they use Annotated, in which case a TypeError is raised.
+    ----------
+    Inputs:
+        function: The function being decorated
+        **spec: Maps parameter names to checkers
+
+    Outputs:
+        Callable: The decorated function, or a decorator when called with a spec
+
+    Raises:
+        TypeError: If the spec names unknown or variadic parameters
+        TypeError: If an Annotated annotation cannot be resolved
+    """
+
+    if function is None:
+        return lambda function: validate(function, **spec)
+
+    import inspect
+
+    signature = inspect.signature(function)
+    plan = _plan(function, signature, spec)
+    if not plan:
+        return function
+    validated = _wrapper(function, signature, plan)
+    return wraps(function)(validated)
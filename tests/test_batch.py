@@ -0,0 +1,199 @@
+import pytest
+
+from scicheck import Schema, numeric, parallel, stream
+from scicheck.errors import CannotConvertToInt, NotTypeError, ScicheckError
+from scicheck.report import ValidationReport
+from scicheck.validator import compile
+
+INPUTS = [1, 2.0, 2.5, "a", 4]
+
+
+def even(input, name="input"):
+    "A module-level checker function"
+    if input % 2:
+        raise ScicheckError(f"{name} must be even")
+    return input
+
+
+class Positive:
+    "A picklable callable that is not a function"
+
+    def __call__(self, input):
+        if input <= 0:
+            raise ScicheckError("input must be positive")
+        return input
+
+
+def lines(read):
+    "A generator that records the items that were read"
+    for input in INPUTS:
+        read.append(input)
+        yield input
+
+
+class TestStream:
+    def test_lazy(self):
+        read = []
+        values = stream(lines(read), numeric.integer)
+        assert [next(values), next(values)] == [1, 2]
+        assert read == [1, 2.0]
+
+    def test_raise(self):
+        values = stream(INPUTS, numeric.integer, "row")
+        assert next(values) == 1
+        assert next(values) == 2
+        with pytest.raises(CannotConvertToInt, match=r"row\[2\]") as error:
+            next(values)
+        assert error.value.__context__ is None
+
+    def test_skip(self):
+        assert list(stream(INPUTS, numeric.integer, on_error="skip")) == [1, 2, 4]
+
+    def test_collect(self):
+        values = stream(INPUTS, numeric.integer, on_error="collect")
+        assert list(values) == [1, 2, 4]
+        assert list(values.errors) == [2, 3]
+        assert "input[3]" in str(values.errors[3])
+
+    def test_options(self):
+        values = stream(["1", "2"], numeric.integer, numeric_only=False)
+        assert list(values) == [1, 2]
+
+    def test_compiled(self):
+        values = stream([1, "a"], compile(int, "n"), on_error="collect")
+        assert list(values) == [1]
+        assert isinstance(values.errors[1], NotTypeError)
+        with pytest.raises(TypeError, match="only supported"):
+            stream([1], compile(int), numeric_only=False)
+
+    def test_functions_are_relabelled(self):
+        values = stream([2, 3], even, "x")
+        assert next(values) == 2
+        with pytest.raises(ScicheckError, match=r"x\[1\] must be even"):
+            next(values)
+
+    def test_errors_are_kept_when_reruns_pass(self):
+        calls = []
+
+        def flaky(input, name="input"):
+            calls.append(name)
+            if len(calls) == 1:
+                raise ScicheckError(f"{name} failed once")
+            return input
+
+        with pytest.raises(ScicheckError, match="input failed once"):
+            list(stream([1], flaky))
+        assert calls == ["input", "input[0]"]
+
+    def test_schema_options(self):
+        with pytest.raises(TypeError, match="only supported"):
+            stream([], Schema({"a": int}), numeric_only=False)
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError, match="on_error"):
+            stream([], numeric.integer, on_error="ignore")
+        for chunk_size in [0, 1.5]:
+            with pytest.raises(ValueError, match="chunk_size"):
+                stream([], numeric.integer, chunk_size=chunk_size)
+
+
+class TestChunks:
+    def test_sizes(self):
+        values = stream(range(5), numeric.integer, chunk_size=2)
+        assert list(values) == [[0, 1], [2, 3], [4]]
+
+    def test_invalid_items(self):
+        values = stream(INPUTS, numeric.integer, chunk_size=3, on_error="collect")
+        assert list(values) == [[1, 2], [4]]
+        assert list(values.errors) == [2, 3]
+        assert "input[3]" in str(values.errors[3])
+
+    def test_raise(self):
+        values = stream(INPUTS, numeric.integer, chunk_size=3)
+        with pytest.raises(CannotConvertToInt, match=r"input\[2\]"):
+            next(values)
+
+
+class TestReport:
+    def test_items(self):
+        values = stream(INPUTS, numeric.integer, "row", on_error="report")
+        assert list(values) == [1, 2, 4]
+        report = values.errors
+        assert isinstance(report, ValidationReport)
+        assert [failure.index for failure in report] == [2, 3]
+        assert [failure.value for failure in report] == [2.5, "a"]
+        assert "row[3]" in str(report.error(1))
+
+    def test_schema_fields(self):
+        schema = Schema({"a": numeric.integer, "b": {"c": int}})
+        records = [{"a": 1, "b": {"c": 1}}, {"a": 1.5, "b": {"c": "x"}}]
+        values = stream(records, schema, on_error="report")
+        assert list(values) == records[:1]
+        failures = list(values.errors)
+        assert [failure.field for failure in failures] == ["a", "b.c"]
+        assert [failure.value for failure in failures] == [1.5, "x"]
+        assert all(issubclass(failure.error, ScicheckError) for failure in failures)
+
+    def test_missing_field_values(self):
+        schema = Schema({"a": numeric.integer})
+        values = stream([5, {}], schema, on_error="report")
+        assert list(values) == []
+        assert [failure.value for failure in values.errors] == [None, None]
+
+
+class TestParallel:
+    def test_in_process(self):
+        assert parallel(INPUTS[:2], numeric.integer) == [1, 2]
+        assert parallel(iter(INPUTS[:2]), numeric.integer) == [1, 2]
+        values, errors = parallel(INPUTS, numeric.integer, on_error="collect")
+        assert values == [1, 2, 4]
+        assert list(errors) == [2, 3]
+
+    @pytest.mark.parametrize("on_error", ["raise", "skip", "collect", "report"])
+    def test_workers(self, on_error):
+        inputs = list(range(10)) + [1.5] + list(range(9))
+        options = {"workers": 2, "chunk_size": 4, "on_error": on_error}
+        if on_error == "raise":
+            with pytest.raises(CannotConvertToInt, match=r"n\[10\]"):
+                parallel(inputs, numeric.integer, "n", **options)
+            return
+        output = parallel(inputs, numeric.integer, "n", **options)
+        if on_error == "skip":
+            assert output == list(range(10)) + list(range(9))
+            return
+        values, errors = output
+        assert values == list(range(10)) + list(range(9))
+        if on_error == "collect":
+            assert list(errors) == [10]
+            assert "n[10]" in str(errors[10])
+        else:
+            assert [failure.index for failure in errors] == [10]
+            assert "n[10]" in str(errors.error(0))
+
+    def test_module_functions(self):
+        with pytest.raises(ScicheckError, match=r"x\[1\] must be even"):
+            parallel([2, 3, 4], even, "x", workers=2, chunk_size=1)
+
+    def test_schema_fields_are_indexed(self):
+        schema = Schema({"a": numeric.integer})
+        records = [{"a": 1}, {"a": 1.5}, {}]
+        values, errors = parallel(records, schema, "row", on_error="collect")
+        assert values == [{"a": 1}]
+        assert "row[1].a" in str(errors[1])
+        assert "row[2]" in str(errors[2])
+
+    def test_other_callables_are_indexed(self):
+        values, errors = parallel(
+            [1, -1, 2, -2], Positive(), workers=2, chunk_size=2, on_error="collect"
+        )
+        assert values == [1, 2]
+        assert [error.index for error in errors.values()] == [1, 3]
+        with pytest.raises(ScicheckError) as error:
+            parallel([1, -1], Positive())
+        assert error.value.index == 1
+
+    def test_rejects_compiled_validators(self):
+        with pytest.raises(TypeError, match="cannot be sent"):
+            parallel([1], compile(int))
+        with pytest.raises(TypeError, match="only supported"):
+            parallel([1], Positive(), numeric_only=True)
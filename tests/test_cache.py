@@ -0,0 +1,165 @@
+import os
+
+import pytest
+
+from scicheck import cache, path
+from scicheck.errors import FileNotFoundError
+
+
+@pytest.fixture
+def folders(tmp_path, monkeypatch):
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / "data.txt").touch()
+    monkeypatch.chdir(first)
+    return first, second
+
+
+class TestPathCache:
+    @pytest.mark.parametrize(
+        "options", [{"maxsize": 0}, {"maxsize": 1.5}, {"maxsize": True}, {"ttl": 0}]
+    )
+    def test_invalid_options(self, options):
+        with pytest.raises(ValueError):
+            cache.PathCache(**options)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        paths = cache.PathCache(maxsize=2)
+        for key in "abc":
+            paths.put(key, tmp_path / key)
+            paths.get("a")
+        assert paths.get("b") is None
+        assert paths.get("a") == tmp_path / "a"
+        assert repr(paths) == "PathCache(2/2 paths)"
+        assert paths.stats() == {
+            "hits": 4,
+            "misses": 1,
+            "evictions": 1,
+            "size": 2,
+            "maxsize": 2,
+            "ttl": None,
+        }
+
+    def test_ttl(self, tmp_path, monkeypatch):
+        paths = cache.PathCache(ttl=10)
+        monkeypatch.setattr(cache, "monotonic", lambda: 0)
+        paths.put("a", tmp_path)
+        assert paths.get("a") == tmp_path
+        monkeypatch.setattr(cache, "monotonic", lambda: 10)
+        assert paths.get("a") is None
+        assert len(paths) == 0
+
+    def test_enable(self):
+        try:
+            paths = cache.enable(maxsize=5)
+            assert cache.current() is paths
+            assert cache.stats()["maxsize"] == 5
+        finally:
+            cache.disable()
+        assert cache.current() is None
+        assert cache.stats() is None
+
+
+class TestWorkingDirectory:
+    def test_relative_inputs_follow_chdir(self, folders, monkeypatch):
+        first, second = folders
+        with cache.cached():
+            assert path.path("data.txt") == first / "data.txt"
+            assert path.existing_file("data.txt") == first / "data.txt"
+            monkeypatch.chdir(second)
+            assert path.path("data.txt") == second / "data.txt"
+            with pytest.raises(FileNotFoundError):
+                path.existing_file("data.txt")
+
+    def test_absolute_inputs_are_shared(self, folders, monkeypatch):
+        first, second = folders
+        file = str(first / "data.txt")
+        with cache.cached() as paths:
+            path.existing_file(file)
+            monkeypatch.chdir(second)
+            path.existing_file(file)
+            assert paths.stats()["hits"] == 1
+
+
+class TestChdir:
+    def test_reads_the_working_directory_once(self, folders, monkeypatch):
+        first, second = folders
+        calls = []
+        getcwd = os.getcwd
+
+        def counted():
+            calls.append(1)
+            return getcwd()
+
+        monkeypatch.setattr(os, "getcwd", counted)
+        with cache.cached() as paths:
+            path.existing_file("data.txt")
+            calls.clear()
+            for _ in range(3):
+                path.existing_file("data.txt")
+            assert paths.stats()["hits"] == 3
+            assert calls == []
+
+            os.chdir(second)
+            with pytest.raises(FileNotFoundError):
+                path.existing_file("data.txt")
+            assert paths.stats()["hits"] == 3
+
+    def test_restores_chdir(self, folders):
+        chdir = os.chdir
+        with cache.cached():
+            assert os.chdir is not chdir
+            with cache.cached():
+                pass
+            assert os.chdir is not chdir
+        assert os.chdir is chdir
+        cache.enable()
+        cache.disable()
+        assert os.chdir is chdir
+
+    def test_failed_chdir(self, folders):
+        first, _ = folders
+        with cache.cached():
+            path.path("data.txt")
+            with pytest.raises(OSError):
+                os.chdir(first / "missing")
+            assert path.path("data.txt") == first / "data.txt"
+
+
+class TestInvalidate:
+    def test_relative_entries(self, folders, monkeypatch):
+        first, second = folders
+        with cache.cached() as paths:
+            path.existing_file("data.txt", resolve=False)
+            path.path("data.txt")
+            monkeypatch.chdir(second)
+            assert paths.invalidate("data.txt") == 0
+            assert paths.invalidate(first / "data.txt") == 2
+            assert len(paths) == 0
+
+    def test_relative_input(self, folders):
+        first, _ = folders
+        with cache.cached() as paths:
+            path.existing_file(str(first / "data.txt"))
+            assert paths.invalidate("data.txt") == 1
+
+    def test_symlinks(self, folders):
+        first, second = folders
+        link = second / "link.txt"
+        link.symlink_to(first / "data.txt")
+        with cache.cached() as paths:
+            path.existing_file(first / "data.txt", resolve=False)
+            path.existing_file(link, resolve=False)
+            assert paths.invalidate(link) == 2
+
+            path.existing_file(link)
+            assert paths.invalidate(first / "data.txt") == 1
+
+    def test_all(self, folders):
+        with cache.cached() as paths:
+            path.path("data.txt")
+            path.path("other.txt")
+            assert paths.invalidate() == 2
+            assert cache.invalidate() == 0
+        assert cache.invalidate() == 0
@@ -0,0 +1,70 @@
+import pickle
+
+import pytest
+
+from scicheck import _message
+from scicheck.errors import CannotConvertToPath, ScicheckError
+from scicheck.report import ValidationReport
+
+
+class TestLazyMessage:
+    def test_formats_on_str(self):
+        calls = []
+
+        def format(name, value):
+            calls.append(name)
+            return f"{name} is {value}"
+
+        error = ScicheckError(format, "x", 5)
+        assert calls == []
+        assert str(error) == "x is 5"
+        assert calls == ["x"]
+        assert repr(error) == "ScicheckError('x is 5')"
+
+    def test_fixed_message(self):
+        assert str(ScicheckError("fixed")) == "fixed"
+        assert str(ScicheckError()) == ""
+
+    def test_subclasses(self):
+        error = CannotConvertToPath(_message.cannot_convert, "x", "a path")
+        assert isinstance(error, TypeError)
+        assert str(error) == _message.cannot_convert("x", "a path")
+
+    def test_pickled(self):
+        error = ScicheckError(_message.cannot_convert, "x", "a path")
+        assert str(pickle.loads(pickle.dumps(error))) == str(error)
+
+
+class TestFields:
+    def test_named(self):
+        error = ScicheckError(_message.cannot_convert, "x", "a path")
+        assert error.fields == {"name": "x", "description": "a path"}
+        assert error.name == "x"
+        assert error.description == "a path"
+
+    def test_missing(self):
+        error = ScicheckError(_message.cannot_convert, "x", "a path")
+        with pytest.raises(AttributeError, match="no attribute 'path'"):
+            error.path
+        assert ScicheckError("fixed").fields == {}
+
+    def test_failing_fields(self):
+        class Broken(ScicheckError):
+            @property
+            def fields(self):
+                raise AttributeError("fields")
+
+        with pytest.raises(AttributeError, match="no attribute 'fields'"):
+            Broken(_message.cannot_convert, "x", "a path").name
+
+    def test_callables_without_code(self):
+        error = ScicheckError(str.upper, "x")
+        assert error.fields == {}
+        assert str(error) == "X"
+        with pytest.raises(AttributeError):
+            error.name
+
+    def test_reported(self):
+        report = ValidationReport()
+        report.add(0, "input", ScicheckError(str.upper, "x"), [1])
+        assert str(report.error(0)) == "X"
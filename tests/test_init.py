@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import scicheck
+
+ROOT = Path(__file__).parents[1]
+
+
+class TestLazyImports:
+    def test_submodules(self):
+        from scicheck import numeric
+
+        assert scicheck.numeric is numeric
+        assert "numeric" in vars(scicheck)
+
+    def test_exports(self):
+        from scicheck.batch import stream
+        from scicheck.schema import Schema
+
+        assert scicheck.stream is stream
+        assert scicheck.Schema is Schema
+
+    def test_unknown(self):
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            scicheck.missing
+
+    def test_dir(self):
+        names = dir(scicheck)
+        assert set(scicheck.__all__) <= set(names)
+        assert names == sorted(names)
+
+    @pytest.mark.slow
+    def test_import_time_budget(self):
+        command = [sys.executable, "-m", "benchmarks.importtime", "--repeat", "1"]
+        result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "REGRESSION" not in result.stdout
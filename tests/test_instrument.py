@@ -0,0 +1,163 @@
+import sys
+from importlib import import_module
+
+import pytest
+
+import scicheck
+from scicheck import instrument, numeric, path, type
+from scicheck.errors import ScicheckError
+
+ORIGINALS = {"real": numeric.real, "string": type.string, "path": path.path}
+CHECKERS = {"numeric": "real", "path": "path", "type": "string"}
+
+
+@pytest.fixture(autouse=True)
+def restore():
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+class TestEnable:
+    def test_swaps_and_restores(self):
+        instrument.enable("numeric")
+        assert instrument.enabled("numeric")
+        assert not instrument.enabled("scicheck.type")
+        assert numeric.real is not ORIGINALS["real"]
+        assert numeric.real.__wrapped__ is ORIGINALS["real"]
+        assert type.string is ORIGINALS["string"]
+
+        instrument.disable()
+        assert not instrument.enabled("numeric")
+        assert numeric.real is ORIGINALS["real"]
+
+    def test_all_modules(self):
+        instrument.enable()
+        instrument.enable("numeric")
+        for module in ["numeric", "path", "type"]:
+            assert instrument.enabled(module)
+        instrument.disable(["scicheck.path"])
+        assert path.path is ORIGINALS["path"]
+        assert type.string is not ORIGINALS["string"]
+
+    def test_async_checkers_are_not_wrapped(self):
+        coroutine = path.existing_file_async
+        instrument.enable("path")
+        assert path.existing_file_async is coroutine
+
+    def test_invalid_module(self):
+        with pytest.raises(ValueError, match="can be instrumented, not 'schema'"):
+            instrument.enable("schema")
+
+    def test_context(self):
+        instrument.enable("type")
+        with instrument.instrumented():
+            assert numeric.real is not ORIGINALS["real"]
+            numeric.real(1, "x")
+        assert numeric.real is ORIGINALS["real"]
+        assert instrument.enabled("type")
+        assert instrument.statistics()["numeric.real"]["x"]["calls"] == 1
+
+    def test_environment(self, monkeypatch):
+        monkeypatch.setenv(instrument.ENVIRONMENT, "0")
+        instrument._from_environment("scicheck.numeric")
+        assert not instrument.enabled("numeric")
+
+        monkeypatch.setenv(instrument.ENVIRONMENT, "type, path")
+        instrument._from_environment("scicheck.numeric")
+        instrument._from_environment("scicheck.type")
+        assert not instrument.enabled("numeric")
+        assert instrument.enabled("type")
+
+        monkeypatch.setenv(instrument.ENVIRONMENT, "1")
+        instrument._from_environment("scicheck.numeric")
+        assert instrument.enabled("numeric")
+
+    @pytest.mark.parametrize("module", ["numeric", "path", "type"])
+    def test_instruments_on_import(self, monkeypatch, module):
+        # Import a fresh copy of the module, and restore the original afterwards
+        name = f"scicheck.{module}"
+        original = sys.modules[name]
+        monkeypatch.setenv(instrument.ENVIRONMENT, module)
+        monkeypatch.setitem(sys.modules, name, original)
+        monkeypatch.setattr(scicheck, module, original)
+        del sys.modules[name]
+        fresh = import_module(name)
+        try:
+            assert fresh is not original
+            assert instrument.enabled(module)
+            assert hasattr(getattr(fresh, CHECKERS[module]), "__wrapped__")
+        finally:
+            instrument.disable(module)
+
+
+class TestStatistics:
+    def test_counts(self):
+        with instrument.instrumented("numeric"):
+            numeric.real(1, "dt")
+            numeric.real(2, name="dt")
+            numeric.real(3)
+            with pytest.raises(ScicheckError):
+                numeric.real("a", "dt", numeric_only=True)
+        stats = instrument.statistics()["numeric.real"]
+        assert stats["dt"]["calls"] == 3
+        assert stats["dt"]["failures"] == 1
+        assert stats["dt"]["seconds"] > 0
+        assert stats["input"]["calls"] == 1
+
+    def test_names(self):
+        with instrument.instrumented("type"):
+            type.type(1, int, "n")
+            type.type(1, int, name=5)
+        assert set(instrument.statistics()["type.type"]) == {"n", "5"}
+
+    def test_nested_checkers_count_once(self):
+        inner = instrument._instrument("inner", lambda input, name="a": input)
+
+        def outer(input, name="b"):
+            return inner(input)
+
+        instrument._instrument("outer", outer)(1)
+        assert list(instrument.statistics()) == ["outer"]
+
+    def test_name_argument(self):
+        def positional(input, name="x"):
+            "Takes the name as a positional argument"
+
+        def keyword(input, *, name="y"):
+            "Takes the name as a keyword argument"
+
+        def required(name, input):
+            "Requires the name"
+
+        def unnamed(input):
+            "Takes no name"
+
+        assert instrument._name_argument(positional) == (1, "x")
+        assert instrument._name_argument(keyword) == (None, "y")
+        assert instrument._name_argument(required) == (0, None)
+        assert instrument._name_argument(unnamed) == (None, "")
+
+    def test_reset(self):
+        with instrument.instrumented("numeric"):
+            numeric.real(1)
+        instrument.reset()
+        assert instrument.statistics() == {}
+
+
+class TestPrometheus:
+    def test_format(self):
+        with instrument.instrumented("numeric"):
+            numeric.real(1, 'a "b"\n')
+        lines = instrument.prometheus("app").splitlines()
+        assert lines[:2] == [
+            "# HELP app_checks_total The number of checker calls",
+            "# TYPE app_checks_total counter",
+        ]
+        labels = 'checker="numeric.real",name="a \\"b\\"\\n"'
+        assert lines[2] == f"app_checks_total{{{labels}}} 1"
+        assert lines[5].startswith("app_failures_total{") and lines[5].endswith(" 0")
+        assert lines[8].startswith("app_check_seconds_total{")
+
+    def test_empty(self):
+        assert instrument.prometheus().count("\n") == 6
@@ -0,0 +1,151 @@
+import pytest
+
+from scicheck import ndarray
+from scicheck.errors import (
+    CannotConvertToArray,
+    CopyRequiredError,
+    NdimError,
+    NotArrayError,
+    ShapeError,
+)
+
+np = pytest.importorskip("numpy")
+NUMPY1 = int(np.__version__.split(".")[0]) < 2
+
+
+class Lazy:
+    "An array-like that counts how often it is materialized"
+
+    def __init__(self):
+        self.copies = 0
+
+    def __array__(self, dtype=None, copy=None):
+        if copy is False:
+            raise ValueError("Lazy inputs cannot be viewed")
+        self.copies += 1
+        return np.zeros(3)
+
+
+class Broken:
+    "An array-like that cannot be converted"
+
+    def __array__(self, dtype=None, copy=None):
+        raise TypeError("cannot be converted")
+
+
+class TestOptions:
+    def test_invalid_copy(self):
+        with pytest.raises(ValueError, match="copy must be"):
+            ndarray.array(np.zeros(3), copy="always")
+
+    def test_invalid_contiguous(self):
+        with pytest.raises(ValueError, match="contiguous must be"):
+            ndarray.array(np.zeros(3), contiguous="A")
+
+
+class TestConforming:
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"dtype": "float64", "shape": (2, 3), "ndim": 2},
+            {"shape": [None, 3]},
+            {"contiguous": True},
+            {"contiguous": False},
+            {"strict": True},
+        ],
+    )
+    def test_returned_unchanged(self, options):
+        input = np.zeros((2, 3))
+        assert ndarray.array(input, **options) is input
+
+    def test_ndim(self):
+        with pytest.raises(NdimError) as error:
+            ndarray.array(np.zeros(3), "x", ndim=2)
+        assert str(error.value) == "x must have 2 dimensions, but it has 1"
+
+    def test_shape(self):
+        with pytest.raises(ShapeError) as error:
+            ndarray.array(np.zeros((2, 2)), "x", shape=(None, 3))
+        assert str(error.value) == "x must have shape (any, 3), but it has shape (2, 2)"
+        with pytest.raises(ShapeError, match=r"must have shape \(3,\)"):
+            ndarray.array(np.zeros((2, 2)), shape=(3,))
+
+    def test_strict(self):
+        with pytest.raises(NotArrayError) as error:
+            ndarray.array([1.0], "x", dtype="float64", contiguous="F", strict=True)
+        assert str(error.value) == (
+            "x must be a Fortran-contiguous numpy array of float64"
+        )
+        with pytest.raises(NotArrayError):
+            ndarray.array(np.zeros(3), dtype="int64", strict=True)
+
+
+class TestNever:
+    @pytest.mark.parametrize("input", [[1, 2], (1, 2), [], "abc"])
+    def test_rejects_copies(self, input):
+        with pytest.raises(CopyRequiredError):
+            ndarray.array(input)
+
+    def test_views_buffers(self):
+        buffer = bytearray(8)
+        output = ndarray.array(memoryview(buffer), dtype="uint8")
+        output[0] = 1
+        assert buffer[0] == 1
+
+    def test_rejects_casts_and_layouts(self):
+        with pytest.raises(CopyRequiredError) as error:
+            ndarray.array(np.zeros(3), "x", dtype="float32")
+        assert str(error.value) == (
+            "x can only be converted to a numpy array of float32 by copying it, "
+            "but copy='never'"
+        )
+        with pytest.raises(CopyRequiredError):
+            ndarray.array(np.zeros((2, 2))[:, ::2], contiguous=True)
+
+    def test_cannot_convert(self):
+        with pytest.raises(CannotConvertToArray):
+            ndarray.array(Broken())
+
+    @pytest.mark.skipif(NUMPY1, reason="requires copy=False")
+    def test_does_not_materialize(self):
+        input = Lazy()
+        with pytest.raises(CopyRequiredError):
+            ndarray.array(input)
+        assert input.copies == 0
+
+
+class TestIfNeeded:
+    def test_converts(self):
+        input = Lazy()
+        assert ndarray.array(input, copy="if_needed").shape == (3,)
+        assert input.copies == 1
+        assert ndarray.array([1, 2], copy="if_needed").tolist() == [1, 2]
+
+    def test_casts_and_layouts(self):
+        output = ndarray.array(np.arange(3), dtype="float64", copy="if_needed")
+        assert output.dtype == "float64"
+        input = np.zeros((2, 3), order="F")
+        output = ndarray.array(input, contiguous="C", copy="if_needed")
+        assert output.flags.c_contiguous
+        output = ndarray.array(input, dtype="float32", copy="if_needed")
+        assert output.flags.f_contiguous
+
+    def test_unsafe_casts(self):
+        with pytest.raises(CannotConvertToArray):
+            ndarray.array(np.zeros(3), dtype="int64", copy="if_needed")
+
+
+class TestVersion:
+    def test_parsed_once(self):
+        ndarray.array(np.zeros(3).data)
+        assert ndarray._numpy2 is not NUMPY1
+
+    def test_numpy1_checks_for_copies(self, monkeypatch):
+        monkeypatch.setattr(ndarray, "_numpy2", False)
+        input = Lazy()
+        with pytest.raises(CopyRequiredError):
+            ndarray.array(input)
+        assert input.copies == 1
+        buffer = bytearray(8)
+        assert ndarray.array(memoryview(buffer), dtype="uint8").size == 8
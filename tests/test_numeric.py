@@ -0,0 +1,692 @@
+import sys
+import weakref
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from scicheck import numeric
+from scicheck.errors import (
+    CannotConvertToComplex,
+    CannotConvertToFloat,
+    CannotConvertToInt,
+    CannotConvertToNumeric,
+    CannotConvertToReal,
+    FileNotFoundError,
+    IsInfError,
+    IsNaNError,
+    NotComplexError,
+    NotFloatError,
+    NotGreater,
+    NotGreaterEqual,
+    NotIntError,
+    NotLess,
+    NotLessEqual,
+    NotNegative,
+    NotNegativeOrZero,
+    NotNumericError,
+    NotPositive,
+    NotPositiveOrZero,
+    NotRealError,
+)
+
+
+@pytest.fixture
+def np():
+    return pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def without_numpy(monkeypatch):
+    # A None entry makes "import numpy" raise ImportError
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+
+class TestCompareWithoutNumpy:
+    @pytest.mark.parametrize("input", [Fraction(1, 2), Decimal("0.5"), 0.5, 1])
+    def test_scalars(self, without_numpy, input):
+        assert numeric.less_equal(input, 1) == input
+        assert numeric.in_range(input, 0, 1) == input
+
+    def test_failures(self, without_numpy):
+        with pytest.raises(NotGreater):
+            numeric.greater(Fraction(1, 2), 1)
+
+    def test_arrays_require_numpy(self, without_numpy):
+        with pytest.raises(ImportError, match="requires numpy"):
+            numeric.real_array([1.5])
+
+
+class TestRealArray:
+    def test_returns_real_arrays_unchanged(self, np):
+        for input in [np.arange(3), np.linspace(0, 1, 3), np.array([True, False])]:
+            assert numeric.real_array(input) is input
+            assert numeric.real_array(input, strict=True) is input
+
+    def test_converts(self, np):
+        output = numeric.real_array([1, 2.5])
+        assert isinstance(output, np.ndarray)
+        assert output.tolist() == [1, 2.5]
+
+    def test_casts_unsupported_dtypes(self, np):
+        output = numeric.real_array(np.array(["1.5", "2"], dtype=object))
+        assert output.dtype == float
+        assert output.tolist() == [1.5, 2]
+
+    def test_real_complex(self, np):
+        output = numeric.real_array(np.array([1 + 0j, 2 + 0j]))
+        assert output.dtype == float
+        assert output.tolist() == [1, 2]
+
+    def test_imaginary_element(self, np):
+        with pytest.raises(CannotConvertToReal, match="element 1"):
+            numeric.real_array([1, 2 + 1j])
+
+    @pytest.mark.parametrize("input", [["a"], [[1, 2], [3]]])
+    def test_cannot_convert(self, input):
+        with pytest.raises(CannotConvertToReal):
+            numeric.real_array(input)
+
+    def test_strict(self, np):
+        for input in [[1, 2], np.array([1j])]:
+            with pytest.raises(NotRealError):
+                numeric.real_array(input, strict=True)
+
+    def test_nan(self, np):
+        with pytest.raises(IsNaNError) as error:
+            numeric.real_array([0, 1, np.nan, np.inf], "x")
+        assert error.value.index == 2
+        assert str(error.value) == (
+            "x cannot contain NaN elements, but element 2 is NaN"
+        )
+
+    def test_inf(self, np):
+        with pytest.raises(IsInfError) as error:
+            numeric.real_array([[0, 1], [-np.inf, 2]])
+        assert error.value.index == (1, 0)
+
+    def test_allowed(self, np):
+        nan, inf = np.nan, np.inf
+        assert numeric.real_array([nan], allow_nan=True).size == 1
+        assert numeric.real_array([inf], allow_inf=True).size == 1
+        assert numeric.real_array([nan, inf], allow_nan=True, allow_inf=True).size == 2
+        with pytest.raises(IsInfError):
+            numeric.real_array([nan, inf], allow_nan=True)
+        with pytest.raises(IsNaNError):
+            numeric.real_array([inf, nan], allow_inf=True)
+
+    def test_finite(self, np):
+        input = np.linspace(0, 1, 10)
+        assert numeric.real_array(input, allow_nan=True) is input
+        assert numeric.real_array(input, allow_inf=True) is input
+
+
+class TestFloatArray:
+    def test_returns_float_arrays_unchanged(self, np):
+        input = np.linspace(0, 1, 3, dtype="float32")
+        assert numeric.float_array(input, strict=True) is input
+
+    def test_casts_to_float(self, np):
+        output = numeric.float_array(np.arange(3))
+        assert output.dtype == float
+        assert numeric.float_array([True]).dtype == float
+
+    def test_strict(self, np):
+        with pytest.raises(NotFloatError):
+            numeric.float_array(np.arange(3), strict=True)
+
+    def test_invalid(self, np):
+        with pytest.raises(CannotConvertToFloat):
+            numeric.float_array([1j])
+        with pytest.raises(CannotConvertToFloat):
+            numeric.float_array(["a"])
+        with pytest.raises(IsNaNError):
+            numeric.float_array([np.nan])
+
+
+class TestTry:
+    @pytest.mark.parametrize(
+        "checker, input, output",
+        [
+            (numeric.try_numeric, 2, 2),
+            (numeric.try_numeric, "2.5", 2.5),
+            (numeric.try_numeric, Fraction(4, 2), 2),
+            (numeric.try_complex, 1j, 1j),
+            (numeric.try_complex, 2, 2 + 0j),
+            (numeric.try_complex, Fraction(1, 2), 0.5 + 0j),
+            (numeric.try_float, 1.5, 1.5),
+            (numeric.try_float, 2, 2.0),
+            (numeric.try_float, 2 + 0j, 2.0),
+            (numeric.try_float, Decimal("0.5"), 0.5),
+            (numeric.try_integer, 3, 3),
+            (numeric.try_integer, 3.0, 3),
+            (numeric.try_integer, 3 + 0j, 3),
+            (numeric.try_integer, Fraction(6, 2), 3),
+            (numeric.try_real, 3, 3),
+            (numeric.try_real, 1.5, 1.5),
+            (numeric.try_real, 1.5 + 0j, 1.5),
+            (numeric.try_real, Fraction(1, 2), 0.5),
+        ],
+    )
+    def test_valid(self, checker, input, output):
+        value = checker(input)
+        assert value == output
+        assert type(value) is type(output)
+
+    @pytest.mark.parametrize(
+        "checker, input",
+        [
+            (numeric.try_numeric, "a"),
+            (numeric.try_numeric, None),
+            (numeric.try_complex, "1j"),
+            (numeric.try_float, 1 + 1j),
+            (numeric.try_float, "1.5"),
+            (numeric.try_integer, 1.5),
+            (numeric.try_integer, 1 + 1j),
+            (numeric.try_integer, Fraction(1, 2)),
+            (numeric.try_integer, "1"),
+            (numeric.try_real, 1j),
+            (numeric.try_real, float("nan")),
+            (numeric.try_real, float("inf")),
+            (numeric.try_real, Decimal("NaN")),
+            (numeric.try_real, "1.5"),
+        ],
+    )
+    def test_invalid(self, checker, input):
+        assert checker(input) is None
+        assert checker(input, default=0) == 0
+
+    @pytest.mark.parametrize(
+        "checker, input",
+        [
+            (numeric.try_numeric, "1"),
+            (numeric.try_complex, 1),
+            (numeric.try_float, 1),
+            (numeric.try_integer, 1.0),
+            (numeric.try_real, 1j),
+        ],
+    )
+    def test_strict(self, checker, input):
+        assert checker(input, strict=True) is None
+
+    def test_non_numeric(self):
+        assert numeric.try_complex("1j", numeric_only=False) == 1j
+        assert numeric.try_complex("a", numeric_only=False) is None
+        assert numeric.try_float("1.5", numeric_only=False) == 1.5
+        assert numeric.try_float("a", numeric_only=False) is None
+        assert numeric.try_integer("1", numeric_only=False) == 1
+        assert numeric.try_integer("a", numeric_only=False) is None
+        assert numeric.try_real("1.5", numeric_only=False) == 1.5
+        assert numeric.try_real("a", numeric_only=False) is None
+
+    def test_other_types(self):
+        value = numeric.try_numeric(Floating())
+        assert value == 2
+        assert type(value) is int
+
+    def test_allowed(self):
+        nan, inf = float("nan"), float("inf")
+        assert numeric.try_real(inf, allow_inf=True) == inf
+        assert numeric.try_real(nan, allow_nan=True) is nan
+        assert numeric.try_real(Decimal("Infinity"), allow_inf=True) == inf
+
+
+class Complex(complex):
+    "A complex subclass, missing from the dispatch tables"
+
+
+class Floating:
+    "A non-numeric type that converts to float"
+
+    def __float__(self):
+        return 2.0
+
+    def __complex__(self):
+        return 2 + 0j
+
+    def __int__(self):
+        return 2
+
+
+class TestDispatch:
+    @pytest.mark.parametrize(
+        "checker, input, output",
+        [
+            (numeric.numeric, 1j, 1j),
+            (numeric.numeric, "2", 2),
+            (numeric.numeric, True, True),
+            (numeric.complex, 1j, 1j),
+            (numeric.complex, 2, 2 + 0j),
+            (numeric.complex, 1.5, 1.5 + 0j),
+            (numeric.float, 1.5, 1.5),
+            (numeric.float, 2, 2.0),
+            (numeric.float, 2 + 0j, 2.0),
+            (numeric.integer, 2, 2),
+            (numeric.integer, 2.0, 2),
+            (numeric.integer, 2 + 0j, 2),
+            (numeric.real, 2 + 0j, 2.0),
+            (numeric.real, True, True),
+        ],
+    )
+    def test_builtins(self, checker, input, output):
+        value = checker(input)
+        assert value == output
+        assert type(value) is type(output)
+
+    def test_subclasses_resolve_via_their_bases(self):
+        assert numeric.float(Complex(2)) == 2.0
+        assert numeric._FLOAT[Complex] is numeric._float_from_complex
+        assert numeric.integer(Complex(3)) == 3
+        with pytest.raises(CannotConvertToReal):
+            numeric.real(Complex(1, 1))
+
+    def test_unknown_types(self):
+        for checker in [numeric.complex, numeric.float, numeric.integer, numeric.real]:
+            with pytest.raises(NotNumericError):
+                checker(Floating())
+        assert numeric.complex(Floating(), numeric_only=False) == 2 + 0j
+        assert numeric.float(Floating(), numeric_only=False) == 2.0
+        assert numeric.integer(Floating(), numeric_only=False) == 2
+        assert numeric.real(Floating(), numeric_only=False) == 2.0
+        assert numeric.numeric(Floating()) == 2
+        assert numeric._NUMERIC[Floating] is numeric._numeric_from_other
+
+    def test_cached(self):
+        class Subclass(float):
+            pass
+
+        assert Subclass not in numeric._INTEGER
+        assert numeric.integer(Subclass(2)) == 2
+        assert numeric._INTEGER[Subclass] is numeric._int_from_float
+
+    @pytest.mark.parametrize(
+        "checker, input, error",
+        [
+            (numeric.numeric, "a", CannotConvertToNumeric),
+            (numeric.numeric, None, CannotConvertToNumeric),
+            (numeric.complex, "a", CannotConvertToComplex),
+            (numeric.float, 1j, CannotConvertToFloat),
+            (numeric.integer, 1.5, CannotConvertToInt),
+            (numeric.integer, 1j, CannotConvertToInt),
+            (numeric.real, 1j, CannotConvertToReal),
+            (numeric.real, float("nan"), IsNaNError),
+            (numeric.real, float("-inf"), IsInfError),
+        ],
+    )
+    def test_invalid(self, checker, input, error):
+        options = {} if checker is numeric.numeric else {"numeric_only": False}
+        with pytest.raises(error):
+            checker(input, **options)
+
+    def test_complex_messages(self):
+        with pytest.raises(CannotConvertToFloat, match="is complex-valued"):
+            numeric.float(1 + 1j)
+    @pytest.mark.parametrize(
+        "checker, input, error",
+        [
+            (numeric.numeric, "1", NotNumericError),
+            (numeric.complex, 1, NotComplexError),
+            (numeric.float, 1, NotFloatError),
+            (numeric.integer, 1.0, NotIntError),
+            (numeric.real, 1j, NotRealError),
+        ],
+    )
+    def test_strict(self, checker, input, error):
+        with pytest.raises(error):
+            checker(input, strict=True)
+
+
+class TestNativeScalars:
+    @pytest.mark.parametrize(
+        "input, output",
+        [
+            (Decimal("2"), 2),
+            (Decimal("2.5"), 2.5),
+            (Decimal("1e30"), 10**30),
+            (Fraction(6, 3), 2),
+            (Fraction(1, 4), 0.25),
+        ],
+    )
+    def test_numeric(self, input, output):
+        value = numeric.numeric(input)
+        assert value == output
+        assert type(value) is type(output)
+
+    def test_numpy_numeric(self, np):
+        for input, output in [
+            (np.float32(3.0), 3),
+            (np.float32(2.5), 2.5),
+            (np.int64(5), 5),
+            (np.complex64(2), 2),
+            (np.complex64(1 + 1j), 1 + 1j),
+        ]:
+            value = numeric.numeric(input)
+            assert value == output
+            assert type(value) is type(output)
+
+    def test_numpy_checkers(self, np):
+        assert type(numeric.integer(np.int64(2**62))) is int
+        assert numeric.integer(np.int64(2**62)) == 2**62
+        assert type(numeric.integer(np.float32(2))) is int
+        assert type(numeric.float(np.float32(0.5))) is float
+        assert type(numeric.float(np.int8(2))) is float
+        assert numeric.float(np.complex64(2)) == 2.0
+        assert type(numeric.complex(np.float32(2))) is complex
+        assert type(numeric.real(np.uint8(2))) is int
+        assert type(numeric.real(np.float16(0.5))) is float
+        with pytest.raises(CannotConvertToInt):
+            numeric.integer(np.float32(0.5))
+        with pytest.raises(IsNaNError):
+            numeric.real(np.float32("nan"))
+
+    def test_exact_integers(self):
+        assert numeric.integer(Decimal(10**30)) == 10**30
+        assert numeric.integer(Fraction(10**30, 1)) == 10**30
+        assert numeric.real(Fraction(10**30, 1)) == 10**30
+        assert numeric.real(Fraction(1, 2)) == 0.5
+        with pytest.raises(CannotConvertToInt):
+            numeric.integer(Decimal("0.5"))
+        with pytest.raises(CannotConvertToInt):
+            numeric.integer(Fraction(1, 2))
+
+    def test_complex(self):
+        assert numeric.complex(Fraction(1, 2)) == 0.5 + 0j
+        assert numeric.float(Decimal("0.5")) == 0.5
+        with pytest.raises(CannotConvertToInt):
+            numeric.integer(Decimal("NaN"))
+
+
+class TestRealFile:
+    def test_npy(self, np, tmp_path):
+        file = tmp_path / "data.npy"
+        np.save(file, np.linspace(0, 1, 100).reshape(10, 10))
+        assert numeric.real_file(str(file)) == file
+        assert numeric.real_file(file, chunk_size=7, min=0, max=1) == file
+
+    def test_raw(self, np, tmp_path):
+        file = tmp_path / "data.bin"
+        np.arange(10, dtype="int16").tofile(file)
+        assert numeric.real_file(file, dtype="int16") == file
+        (tmp_path / "empty.bin").touch()
+        assert numeric.real_file(tmp_path / "empty.bin") == tmp_path / "empty.bin"
+
+    def test_nan(self, np, tmp_path):
+        file = tmp_path / "data.bin"
+        data = np.zeros(10)
+        data[7] = np.nan
+        data[8] = np.inf
+        data.tofile(file)
+        with pytest.raises(IsNaNError) as error:
+            numeric.real_file(file, "x", chunk_size=3)
+        assert str(error.value) == (
+            "x cannot contain NaN elements, but element 7 (byte offset 56) is NaN"
+        )
+        with pytest.raises(IsInfError):
+            numeric.real_file(file, allow_nan=True)
+        with pytest.raises(IsNaNError, match="element 7"):
+            numeric.real_file(file, allow_inf=True)
+        assert numeric.real_file(file, allow_nan=True, allow_inf=True) == file
+
+    def test_index_in_file_order(self, np, tmp_path):
+        file = tmp_path / "data.npy"
+        data = np.asfortranarray(np.zeros((3, 4)))
+        data[1, 2] = np.inf
+        np.save(file, data)
+        with pytest.raises(IsInfError, match=r"element \(1, 2\)"):
+            numeric.real_file(file, chunk_size=2)
+
+    def test_bounds(self, np, tmp_path):
+        file = tmp_path / "data.npy"
+        np.save(file, np.array([1.0, np.nan, 5.0, -1.0]))
+        with pytest.raises(NotLessEqual, match="element 2 .* is 5.0"):
+            numeric.real_file(file, allow_nan=True, max=4)
+        with pytest.raises(NotGreaterEqual, match="element 3"):
+            numeric.real_file(file, allow_nan=True, min=0, chunk_size=1)
+
+    def test_invalid_files(self, np, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            numeric.real_file(tmp_path / "missing.npy")
+        np.save(tmp_path / "complex.npy", np.array([1j]))
+        with pytest.raises(NotRealError):
+            numeric.real_file(tmp_path / "complex.npy")
+        (tmp_path / "bad.npy").write_text("not an array")
+        with pytest.raises(CannotConvertToReal):
+            numeric.real_file(tmp_path / "bad.npy")
+
+    @pytest.mark.parametrize("chunk_size", [0, -1, 1.5, None])
+    def test_invalid_chunk_size(self, tmp_path, chunk_size):
+        with pytest.raises(ValueError, match="chunk_size must be a positive int"):
+            numeric.real_file(tmp_path / "data.npy", chunk_size=chunk_size)
+
+    def test_releases_the_mapping(self, np, tmp_path, monkeypatch):
+        file = tmp_path / "data.npy"
+        np.save(file, np.array([1.0, np.nan]))
+        arrays = []
+        open_file = numeric._open_file
+
+        def opened(*args):
+            array = open_file(*args)
+            arrays.append(weakref.ref(array))
+            return array
+
+        monkeypatch.setattr(numeric, "_open_file", opened)
+        assert numeric.real_file(file, allow_nan=True) == file
+        with pytest.raises(IsNaNError) as error:
+            numeric.real_file(file)
+        assert error.value is not None
+        assert [array() for array in arrays] == [None, None]
+
+
+class TestCompare:
+    @pytest.mark.parametrize(
+        "checker, valid, invalid, error",
+        [
+            (numeric.less, 0.5, 1, NotLess),
+            (numeric.less_equal, 1, 1.5, NotLessEqual),
+            (numeric.greater, 1.5, 1, NotGreater),
+            (numeric.greater_equal, 1, 0.5, NotGreaterEqual),
+        ],
+    )
+    def test_scalars(self, checker, valid, invalid, error):
+        assert checker(valid, 1) == valid
+        with pytest.raises(error):
+            checker(invalid, 1, "x")
+
+    def test_sign(self):
+        assert numeric.positive(1) == 1
+        assert numeric.positive(0, allow_zero=True) == 0
+        assert numeric.negative(-1) == -1
+        assert numeric.negative(0, allow_zero=True) == 0
+        with pytest.raises(NotPositive):
+            numeric.positive(0)
+        with pytest.raises(NotPositiveOrZero):
+            numeric.positive(-1, allow_zero=True)
+        with pytest.raises(NotNegative):
+            numeric.negative(0)
+        with pytest.raises(NotNegativeOrZero):
+            numeric.negative(1, allow_zero=True)
+
+    def test_in_range(self):
+        assert numeric.in_range(1, 0, 1) == 1
+        assert numeric.in_range(5, None, None) == 5
+        with pytest.raises(NotLess):
+            numeric.in_range(1, 0, 1, include_max=False)
+        with pytest.raises(NotGreater):
+            numeric.in_range(0, 0, 1, include_min=False)
+        with pytest.raises(NotGreaterEqual, match="x must be greater than or equal"):
+            numeric.in_range(float("nan"), 0, 1, "x")
+
+    @pytest.mark.parametrize("input", [[1, 2, 3], "a", None, 1j])
+    def test_not_real(self, input):
+        with pytest.raises(NotRealError, match="real-valued number or numpy array"):
+            numeric.in_range(input, 0, 5)
+        with pytest.raises(NotRealError):
+            numeric.greater(input, 1)
+
+    def test_arrays(self, np):
+        input = np.linspace(0, 1, 5)
+        assert numeric.in_range(input, 0, 1) is input
+        assert numeric.greater(input, -1) is input
+        assert numeric.less(np.array([]), 0).size == 0
+        with pytest.raises(NotLessEqual) as error:
+            numeric.less_equal(input, 0.5, "x")
+        assert str(error.value) == (
+            "x must be less than or equal to 0.5, but element 3 is 0.75"
+        )
+
+    def test_array_nan(self, np):
+        with pytest.raises(NotGreaterEqual, match="element 1 is nan"):
+            numeric.in_range(np.array([0.5, np.nan]), 0, 1)
+
+    def test_large_arrays(self, np, monkeypatch):
+        monkeypatch.setattr(numeric, "_EXTREMA_BLOCK", 4)
+        input = np.arange(10.0)
+        assert numeric.in_range(input, 0, 9) is input
+        with pytest.raises(NotGreater, match=r"element \(0, 0\)"):
+            numeric.in_range(input.reshape(2, 5), 0, 9, include_min=False)
+        with pytest.raises(NotLess, match="element 9"):
+            numeric.in_range(input, 0, 9, include_max=False)
+
+
+class TestParse:
+    @pytest.mark.parametrize(
+        "input, output",
+        [
+            ("12", 12),
+            (" -3 ", -3),
+            ("1e3", 1000),
+            ("2.5", 2.5),
+            ("12345678901234567890123", 12345678901234567890123),
+            ("1+2j", 1 + 2j),
+            ("2+0J", 2),
+            ("1.5+0j", 1.5),
+        ],
+    )
+    def test_numerals(self, input, output):
+        for checker in [numeric.numeric, numeric.try_numeric]:
+            value = checker(input)
+            assert value == output
+            assert type(value) is type(output)
+
+    @pytest.mark.parametrize("input", ["", "a", "1..2", "1+2i", "1+2jj"])
+    def test_invalid(self, input):
+        assert numeric._parse(input) is None
+        assert numeric.try_numeric(input) is None
+        with pytest.raises(CannotConvertToNumeric):
+            numeric.numeric(input)
+
+    def test_nan(self):
+        assert numeric.try_numeric("nan") != numeric.try_numeric("nan")
+        assert numeric.numeric("inf") == float("inf")
+
+
+class TestNumericArray:
+    def test_returns_numeric_arrays_unchanged(self, np):
+        for input in [np.arange(3), np.array([1j]), np.array([True])]:
+            assert numeric.numeric_array(input) is input
+            assert numeric.numeric_array(input, strict=True) is input
+
+    def test_converts_numbers(self, np):
+        output = numeric.numeric_array([1, 2.5])
+        assert output.dtype == float
+        assert output.tolist() == [1, 2.5]
+
+    @pytest.mark.parametrize(
+        "input, dtype",
+        [
+            (["1", "2"], "int64"),
+            (["1", "2.5"], "float64"),
+            (["1", "2j"], "complex128"),
+            (["1", str(2**70)], "float64"),
+        ],
+    )
+    def test_parses_numerals(self, np, input, dtype):
+        for values in [input, np.array(input), np.array(input, dtype=object)]:
+            assert numeric.numeric_array(values).dtype == dtype
+        assert numeric.numeric_array(np.array(input, dtype=bytes)).dtype == dtype
+
+    def test_strict(self, np):
+        for input in [[1], np.array(["1"])]:
+            with pytest.raises(NotNumericError):
+                numeric.numeric_array(input, strict=True)
+
+    def test_reports_first_invalid_element(self, np):
+        with pytest.raises(CannotConvertToNumeric) as error:
+            numeric.numeric_array(["1", "2", "x", "y"], "x")
+        assert "element 2" in str(error.value)
+        with pytest.raises(CannotConvertToNumeric, match=r"\(1, 0\)"):
+            numeric.numeric_array([["1", "2"], ["a", "3"]])
+        with pytest.raises(CannotConvertToNumeric, match="element 1"):
+            numeric.numeric_array(np.array([b"1", b"x"]))
+
+    def test_none_is_not_nan(self, np):
+        with pytest.raises(CannotConvertToNumeric, match="element 1"):
+            numeric.numeric_array(np.array([1.5, None], dtype=object))
+
+    def test_cannot_convert(self, np):
+        with pytest.raises(CannotConvertToNumeric):
+            numeric.numeric_array([[1, 2], [3]])
+
+    def test_casts_fail_for_numerals(self, np, monkeypatch):
+        monkeypatch.setattr(numeric, "_parse", lambda input: 0)
+        with pytest.raises(CannotConvertToNumeric, match="cannot be converted"):
+            numeric.numeric_array(["x"])
+
+
+class TestIntegerArray:
+    def test_returns_integer_arrays_unchanged(self, np):
+        for input in [np.arange(3), np.arange(3, dtype="int8"), np.array([True])]:
+            assert numeric.integer_array(input) is input
+            assert numeric.integer_array(input, strict=True) is input
+
+    def test_casts_integral_floats(self, np):
+        output = numeric.integer_array([1.0, -2.0])
+        assert output.dtype == "int64"
+        assert output.tolist() == [1, -2]
+        assert numeric.integer_array(np.array([], dtype=float)).dtype == "int64"
+
+    @pytest.mark.parametrize("value", [1.5, float("nan")])
+    def test_not_integer(self, np, value):
+        with pytest.raises(CannotConvertToInt, match="element 1"):
+            numeric.integer_array([1.0, value])
+
+    def test_floats_out_of_range(self, np):
+        with pytest.raises(CannotConvertToInt, match="element 1"):
+            numeric.integer_array([1.0, float("inf")])
+        with pytest.raises(CannotConvertToInt, match="element 0"):
+            numeric.integer_array([300.0], dtype="uint8")
+
+    def test_casts_to_dtype(self, np):
+        output = numeric.integer_array([1, 2], dtype="int8")
+        assert output.dtype == "int8"
+        assert output.tolist() == [1, 2]
+        for input in [np.array([True]), np.arange(3, dtype="int8"), np.array([])]:
+            assert numeric.integer_array(input, dtype="int16").dtype == "int16"
+        input = np.arange(3)
+        assert numeric.integer_array(input, dtype="int64") is input
+
+    def test_integers_out_of_range(self, np):
+        with pytest.raises(CannotConvertToInt, match="element 2"):
+            numeric.integer_array([1, 2, 300], dtype="int8")
+        with pytest.raises(CannotConvertToInt, match="element 1"):
+            numeric.integer_array([0, -1], dtype="uint64")
+        output = numeric.integer_array(np.array([0, 255], dtype="int64"), dtype="uint8")
+        assert output.tolist() == [0, 255]
+
+    def test_blocks(self, np, monkeypatch):
+        monkeypatch.setattr(numeric, "_EXTREMA_BLOCK", 4)
+        input = np.arange(10.0)
+        assert numeric.integer_array(input).tolist() == list(range(10))
+        input[9] = 0.5
+        with pytest.raises(CannotConvertToInt, match="element 9"):
+            numeric.integer_array(input)
+        with pytest.raises(CannotConvertToInt, match="element 2"):
+            numeric.integer_array(np.arange(10.0) * 100, dtype="int8")
+
+    def test_strict(self, np):
+        with pytest.raises(NotIntError):
+            numeric.integer_array([1.0], strict=True)
+
+    def test_invalid_dtype(self, np):
+        with pytest.raises(ValueError, match="integer dtype"):
+            numeric.integer_array([1], dtype="float64")
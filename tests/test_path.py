@@ -0,0 +1,374 @@
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from scicheck import path
+from scicheck.errors import (
+    CannotConvertToPath,
+    FileExistsError,
+    FileNotFoundError,
+    FolderExistsError,
+    FolderNotEmpty,
+    FolderNotFoundError,
+    MissingContentError,
+    NotFileError,
+    NotFolderError,
+    NotPathError,
+    TooFewFiles,
+)
+
+
+@pytest.fixture
+def tree(tmp_path) -> Path:
+    "A folder holding a file, an empty folder, and a folder with a file"
+    (tmp_path / "file.txt").touch()
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "full").mkdir()
+    (tmp_path / "full" / "child.txt").touch()
+    return tmp_path
+
+
+@pytest.fixture
+def stats(monkeypatch) -> list:
+    "Records the paths passed to os.stat"
+    calls = []
+    stat = os.stat
+
+    def counted(input, *args, **kwargs):
+        calls.append(input)
+        return stat(input, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counted)
+    return calls
+
+
+class TestPath:
+    def test_convert(self, tree):
+        assert path.path(str(tree / "file.txt")) == tree / "file.txt"
+        assert path.path("x", resolve=False) == Path("x")
+
+    def test_invalid(self):
+        with pytest.raises(NotPathError):
+            path.path("x", strict=True)
+        with pytest.raises(CannotConvertToPath):
+            path.path(5)
+
+
+class TestSingleStat:
+    @pytest.mark.parametrize(
+        "checker, item, options",
+        [
+            (path.existing_file, "file.txt", {}),
+            (path.existing_folder, "empty", {}),
+            (path.new_file, "missing", {}),
+            (path.new_folder, "missing", {}),
+            (path.new_file, "file.txt", {"exist_ok": True}),
+        ],
+    )
+    def test_unresolved_checks_stat_once(self, tree, stats, checker, item, options):
+        checker(tree / item, resolve=False, **options)
+        assert stats == [tree / item]
+
+    def test_errors_stat_once(self, tree, stats):
+        with pytest.raises(FileNotFoundError):
+            path.existing_file(tree / "missing", resolve=False)
+        with pytest.raises(NotFileError):
+            path.existing_file(tree / "empty", resolve=False)
+        assert len(stats) == 2
+
+
+class TestExisting:
+    def test_file(self, tree):
+        assert path.existing_file(str(tree / "file.txt")) == tree / "file.txt"
+
+    def test_folder(self, tree):
+        assert path.existing_folder(tree / "full", "data") == tree / "full"
+
+    def test_missing(self, tree):
+        with pytest.raises(FileNotFoundError) as error:
+            path.existing_file(tree / "missing", "data")
+        assert str(error.value) == f"data does not exist\nPath: {tree / 'missing'}"
+        with pytest.raises(FolderNotFoundError):
+            path.existing_folder(tree / "missing")
+
+    def test_wrong_type(self, tree):
+        with pytest.raises(NotFileError, match="does not point to a file"):
+            path.existing_file(tree / "empty")
+        with pytest.raises(NotFolderError, match="does not point to a folder"):
+            path.existing_folder(tree / "file.txt")
+
+    def test_missing_parent_is_missing(self, tree):
+        with pytest.raises(FileNotFoundError):
+            path.existing_file(tree / "file.txt" / "child")
+
+    def test_stat_errors_propagate(self, tree, monkeypatch):
+        def denied(input, *args, **kwargs):
+            raise PermissionError(13, "Permission denied")
+
+        monkeypatch.setattr(os, "stat", denied)
+        with pytest.raises(PermissionError):
+            path.existing_file(tree / "file.txt")
+
+
+class TestNew:
+    def test_missing(self, tree):
+        assert path.new_file(tree / "new.txt") == tree / "new.txt"
+        assert path.new_folder(tree / "new") == tree / "new"
+
+    def test_exists(self, tree):
+        with pytest.raises(FileExistsError, match="input already exists"):
+            path.new_file(tree / "file.txt")
+        with pytest.raises(FolderExistsError, match="folder already exists"):
+            path.new_folder(tree / "empty", "folder")
+
+    def test_exist_ok(self, tree):
+        assert path.new_file(tree / "file.txt", exist_ok=True) == tree / "file.txt"
+        assert path.new_folder(tree / "empty", exist_ok=True) == tree / "empty"
+        with pytest.raises(NotFileError):
+            path.new_file(tree / "empty", exist_ok=True)
+        with pytest.raises(NotFolderError):
+            path.new_folder(tree / "file.txt", exist_ok=True)
+
+    def test_require_empty(self, tree):
+        with pytest.raises(FolderNotEmpty, match="the folder is not empty"):
+            path.new_folder(tree / "full", exist_ok=True)
+        output = path.new_folder(tree / "full", exist_ok=True, require_empty=False)
+        assert output == tree / "full"
+
+
+class TestExistingBatch:
+    def test_files(self, tree):
+        inputs = [tree / "file.txt", tree / "full" / "child.txt", tree / "file.txt"]
+        assert path.existing_files(inputs) == inputs
+
+    def test_folders(self, tree):
+        inputs = [str(tree / "full"), str(tree / "empty")]
+        assert path.existing_folders(inputs) == [tree / "full", tree / "empty"]
+
+    def test_empty(self):
+        assert path.existing_files([]) == []
+        assert path.existing_files([], collect=True) == ([], {})
+
+    def test_lists_shared_folders(self, tree, stats):
+        inputs = [tree / "file.txt", tree / "empty"]
+        path.existing_files(inputs, resolve=False, collect=True)
+        assert stats == []
+
+    def test_unlisted_folders(self, tree):
+        inputs = [tree / "missing" / "a.txt", tree / "missing" / "b.txt"]
+        paths, errors = path.existing_files(inputs, collect=True)
+        assert paths == [None, None]
+        assert all(isinstance(error, FileNotFoundError) for error in errors.values())
+
+    def test_first_error(self, tree):
+        with pytest.raises(FileNotFoundError, match=r"data\[1\] does not exist"):
+            path.existing_files([tree / "file.txt", tree / "missing"], "data")
+        with pytest.raises(NotFolderError, match=r"input\[0\]"):
+            path.existing_folders([tree / "file.txt"])
+
+    def test_collect(self, tree):
+        inputs = [5, tree / "file.txt", tree / "missing", tree / "full" / "child.txt"]
+        paths, errors = path.existing_files(inputs, collect=True)
+        assert paths == [None, tree / "file.txt", None, tree / "full" / "child.txt"]
+        assert list(errors) == [0, 2]
+        assert isinstance(errors[0], CannotConvertToPath)
+        assert isinstance(errors[2], FileNotFoundError)
+
+    def test_strict(self, tree):
+        with pytest.raises(NotPathError):
+            path.existing_files([str(tree / "file.txt")], strict=True)
+
+    def test_resolves_symlinks(self, tree):
+        link = tree / "link"
+        link.symlink_to(tree / "full")
+        inputs = [link / "child.txt", tree / "link.txt"]
+        (tree / "link.txt").symlink_to(tree / "file.txt")
+        paths = path.existing_files(inputs + [tree / "file.txt"])
+        assert paths == [
+            tree / "full" / "child.txt",
+            tree / "file.txt",
+            tree / "file.txt",
+        ]
+        assert path.existing_files(inputs, resolve=False) == inputs
+
+
+class TestTryPath:
+    def test_valid(self, tree):
+        assert path.try_path(str(tree / "file.txt")) == tree / "file.txt"
+        assert path.try_path(Path("x"), resolve=False) == Path("x")
+        assert path.try_path("x", resolve=False) == Path("x")
+
+    def test_invalid(self):
+        assert path.try_path(5) is None
+        assert path.try_path(5, default="") == ""
+        assert path.try_path("x", strict=True) is None
+
+
+class TestAsync:
+    def test_single(self, tree):
+        file = asyncio.run(path.existing_file_async(str(tree / "file.txt")))
+        assert file == tree / "file.txt"
+        assert asyncio.run(path.existing_folder_async(tree / "empty")) == tree / "empty"
+        assert asyncio.run(path.new_folder_async(tree / "new")) == tree / "new"
+        with pytest.raises(NotFolderError):
+            asyncio.run(path.existing_folder_async(tree / "file.txt"))
+
+    def test_batch(self, tree):
+        inputs = [tree / "file.txt", tree / "full" / "child.txt"] * 10
+        assert asyncio.run(path.existing_files_async(inputs, limit=3)) == inputs
+        folders = [tree / "empty", tree / "full"]
+        assert asyncio.run(path.existing_folders_async(folders)) == folders
+
+    def test_first_error(self, tree):
+        inputs = [tree / "file.txt", tree / "missing", tree / "empty"]
+        with pytest.raises(FileNotFoundError, match=r"data\[1\]"):
+            asyncio.run(path.existing_files_async(inputs, "data", limit=1))
+
+    def test_collect(self, tree):
+        inputs = [tree / "missing", tree / "file.txt", tree / "empty"]
+        batch = path.existing_files_async(inputs, collect=True)
+        paths, errors = asyncio.run(batch)
+        assert paths == [None, tree / "file.txt", None]
+        assert list(errors) == [0, 2]
+        assert isinstance(errors[2], NotFileError)
+
+    def test_invalid_limit(self):
+        for limit in [0, 1.5]:
+            with pytest.raises(ValueError, match="limit"):
+                asyncio.run(path.existing_files_async([], limit=limit))
+
+    def test_other_errors_stop_the_batch(self, tree, monkeypatch):
+        checked = []
+        stat = os.stat
+
+        def slow(input, *args, **kwargs):
+            if Path(input).name == "denied":
+                raise PermissionError(13, "Permission denied")
+            checked.append(input)
+            time.sleep(0.01)
+            return stat(input, *args, **kwargs)
+
+        async def main():
+            inputs = [tree / "denied"] + [tree / "file.txt"] * 50
+            with pytest.raises(PermissionError):
+                await path.existing_files_async(inputs, resolve=False, limit=2)
+            await asyncio.sleep(0.1)
+
+        monkeypatch.setattr(os, "stat", slow)
+        asyncio.run(main())
+        assert len(checked) < 10
+
+
+@pytest.fixture
+def listings(monkeypatch) -> list:
+    "Records the folders passed to os.scandir"
+    calls = []
+    scandir = os.scandir
+
+    def counted(input):
+        calls.append(input)
+        return scandir(input)
+
+    monkeypatch.setattr(os, "scandir", counted)
+    return calls
+
+
+class TestContents:
+    def test_contains(self, tree):
+        contains = ["file.txt", "empty/", Path("full/child.txt"), "full/"]
+        assert path.existing_folder(tree, contains=contains) == tree
+
+    def test_str(self, tree):
+        assert path.existing_folder(tree, contains="file.txt") == tree
+        with pytest.raises(MissingContentError, match="'missing.txt'"):
+            path.existing_folder(tree, contains="missing.txt")
+        assert path.existing_folder(tree, patterns="*.txt") == tree
+
+    def test_contains_stats_without_listing(self, tree, listings):
+        path.existing_folder(tree, contains=["full/child.txt", "file.txt"])
+        assert listings == []
+
+    def test_missing(self, tree):
+        for contains in ["missing.txt", "full/missing.txt", "missing/child.txt"]:
+            with pytest.raises(MissingContentError) as error:
+                path.existing_folder(tree, "data", contains=[contains])
+            assert str(error.value).startswith(
+                f"data must contain {contains!r}, but it does not exist"
+            )
+            with pytest.raises(MissingContentError):
+                path.existing_folder(tree, contains=[contains], patterns=["*"])
+
+    def test_wrong_type(self, tree):
+        for patterns in [[], ["*"]]:
+            with pytest.raises(NotFolderError, match="as a folder"):
+                path.existing_folder(tree, contains=["file.txt/"], patterns=patterns)
+            with pytest.raises(NotFileError, match="as a file"):
+                path.existing_folder(tree, contains=["empty"], patterns=patterns)
+
+    def test_broken_symlinks_are_missing(self, tree):
+        (tree / "link.txt").symlink_to(tree / "missing.txt")
+        for patterns in [[], ["*"]]:
+            with pytest.raises(MissingContentError, match="'link.txt'"):
+                path.existing_folder(tree, contains=["link.txt"], patterns=patterns)
+
+    def test_symlinks(self, tree):
+        (tree / "link.txt").symlink_to(tree / "file.txt")
+        (tree / "link").symlink_to(tree / "full")
+        contains = ["link.txt", "link/", "link/child.txt"]
+        assert path.existing_folder(tree, contains=contains) == tree
+        assert path.existing_folder(tree, contains=contains, min_files=1) == tree
+
+    def test_patterns(self, tree):
+        assert path.existing_folder(tree, patterns=["*.txt", "e*"]) == tree
+        with pytest.raises(MissingContentError, match="matching '\\*.csv'"):
+            path.existing_folder(tree, patterns=["*.csv"])
+        with pytest.raises(MissingContentError):
+            path.existing_folder(tree, patterns=["full/*.txt"])
+        output = path.existing_folder(tree, patterns=["full/*.txt"], recursive=True)
+        assert output == tree
+
+    def test_min_files(self, tree):
+        assert path.existing_folder(tree, min_files=1) == tree
+        with pytest.raises(TooFewFiles, match="at least 2 files"):
+            path.existing_folder(tree, min_files=2)
+        assert path.existing_folder(tree, min_files=2, recursive=True) == tree
+
+    def test_stops_listing_when_met(self, tree, listings):
+        for k in range(3):
+            (tree / "full" / f"more{k}").mkdir()
+        path.existing_folder(tree, min_files=1, recursive=True)
+        assert len(listings) == 1
+
+    def test_lists_parents_of_required_entries(self, tree, listings):
+        contains = ["full/child.txt"]
+        path.existing_folder(tree, contains=contains, patterns=["*.txt"])
+        assert [Path(folder) for folder in listings] == [tree, tree / "full"]
+
+    def test_parents_of_required_entries_are_not_counted(self, tree):
+        for k in range(3):
+            (tree / "full" / f"more{k}.txt").touch()
+        with pytest.raises(TooFewFiles):
+            path.existing_folder(tree, contains=["full/child.txt"], min_files=2)
+
+    def test_removed_subfolders(self, tree, monkeypatch):
+        scandir = os.scandir
+
+        def removed(input):
+            if Path(input).name == "full":
+                raise OSError(2, "No such file or directory")
+            return scandir(input)
+
+        monkeypatch.setattr(os, "scandir", removed)
+        assert path.existing_folder(tree, min_files=1, recursive=True) == tree
+        with pytest.raises(TooFewFiles):
+            path.existing_folder(tree, min_files=2, recursive=True)
+        with pytest.raises(MissingContentError):
+            path.existing_folder(tree, contains=["full/child.txt"], min_files=1)
+
+    @pytest.mark.parametrize("item", ["", "/abs", "../x", "a/../../x"])
+    def test_invalid_contains(self, tree, item):
+        with pytest.raises(ValueError, match="within the folder"):
+            path.existing_folder(tree, contains=[item])
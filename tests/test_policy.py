@@ -0,0 +1,167 @@
+from pathlib import Path
+
+import pytest
+
+from scicheck import instrument, numeric, path, policy
+from scicheck.errors import ScicheckError
+
+# The original checkers, before any policy or instrumentation
+ORIGINALS = {
+    "numeric.real": numeric.real,
+    "numeric.try_real": numeric.try_real,
+    "path.path": path.path,
+    "path.existing_file": path.existing_file,
+    "path.existing_files": path.existing_files,
+}
+
+
+@pytest.fixture(autouse=True)
+def restore():
+    yield
+    instrument.disable()
+    instrument.reset()
+    policy.set_policy("full")
+
+
+@pytest.fixture
+def file(tmp_path) -> Path:
+    file = tmp_path / "data.txt"
+    file.touch()
+    return file
+
+
+def checker(name):
+    module, _, function = name.partition(".")
+    return getattr({"numeric": numeric, "path": path}[module], function)
+
+
+class TestInternalCalls:
+    @pytest.mark.parametrize("mode, every", [("off", None), ("sample", 2)])
+    def test_path_policy_does_not_change_callers(self, tmp_path, file, mode, every):
+        policy.set_policy(mode, "path.path", every=every)
+        for _ in range(4):
+            assert path.existing_file(str(file)) == file.resolve()
+            assert path.existing_folder(str(tmp_path)) == tmp_path.resolve()
+            assert path.new_file(str(tmp_path / "new.txt")) == tmp_path / "new.txt"
+            assert path.new_folder(str(tmp_path / "new")) == tmp_path / "new"
+
+    def test_sampled_module(self, file):
+        policy.set_policy("sample", "path", every=2)
+        for _ in range(5):
+            output = path.existing_file(str(file))
+            assert output in (file.resolve(), str(file))
+
+    def test_try_checkers_ignore_checker_policies(self):
+        policy.set_policy("off", "numeric.real")
+        assert numeric.real("abc") == "abc"
+        assert numeric.try_real("abc") is None
+        assert numeric.try_real("abc", default=0) == 0
+
+    def test_real_file_ignores_path_policies(self, tmp_path):
+        policy.set_policy("off", "path")
+        with pytest.raises(ScicheckError):
+            numeric.real_file(tmp_path / "missing.npy")
+
+
+class TestUnskippable:
+    @pytest.mark.parametrize(
+        "target",
+        [
+            "numeric.try_real",
+            "path.try_path",
+            "path.existing_files",
+            "numeric.real_file",
+            "numeric.real_array",
+            "numeric.numeric_array",
+        ],
+    )
+    def test_rejected_targets(self, target):
+        with pytest.raises(ValueError):
+            policy.set_policy("off", target)
+
+    def test_module_policies_skip_them(self, file, tmp_path):
+        policy.set_policy("off")
+        assert numeric.try_real("abc", default=0) == 0
+        assert numeric.try_real is ORIGINALS["numeric.try_real"]
+        assert path.existing_files is ORIGINALS["path.existing_files"]
+        paths, errors = path.existing_files(
+            [file, tmp_path / "missing"], collect=True
+        )
+        assert paths == [file.resolve(), None]
+        assert list(errors) == [1]
+
+    def test_array_checkers_convert(self):
+        np = pytest.importorskip("numpy")
+        policy.set_policy("off", "numeric")
+        for checker in ["real_array", "float_array", "integer_array", "numeric_array"]:
+            output = getattr(numeric, checker)([1, 2])
+            assert isinstance(output, np.ndarray)
+        assert numeric.real("abc") == "abc"
+
+
+class TestLayers:
+    def test_policy_then_instrument_disable(self):
+        instrument.enable()
+        policy.set_policy("sample", "numeric", every=2)
+        instrument.disable()
+        policy.set_policy("full")
+        assert numeric.real is ORIGINALS["numeric.real"]
+
+    def test_instrument_disable_then_enable_under_policy(self):
+        policy.set_policy("off", "numeric.real")
+        instrument.enable("numeric")
+        instrument.disable("numeric")
+        assert numeric.real("abc") == "abc"
+        policy.set_policy("full", "numeric.real")
+        assert numeric.real is ORIGINALS["numeric.real"]
+
+    def test_skipped_calls_are_not_recorded(self):
+        instrument.enable("numeric")
+        policy.set_policy("sample", "numeric.real", every=2)
+        for _ in range(4):
+            numeric.real(1, "x")
+        assert instrument.statistics()["numeric.real"]["x"]["calls"] == 2
+
+    def test_context_managers_restore_originals(self):
+        with instrument.instrumented():
+            with policy.policy("off"):
+                assert numeric.real("abc") == "abc"
+        for name, function in ORIGINALS.items():
+            assert checker(name) is function
+
+
+class TestModes:
+    def test_sample(self):
+        policy.set_policy("sample", "numeric.real", every=3)
+        outputs = []
+        for _ in range(6):
+            try:
+                outputs.append(numeric.real("abc"))
+            except ScicheckError:
+                outputs.append(None)
+        assert outputs == [None, "abc", "abc", None, "abc", "abc"]
+        assert policy.get_policy("numeric.real") == ("sample", 3)
+
+    def test_policy_context(self):
+        with policy.policy("off", "numeric"):
+            assert policy.get_policy("numeric.real") == ("off", None)
+        assert policy.get_policy("numeric.real") == ("full", None)
+        assert numeric.real is ORIGINALS["numeric.real"]
+
+    def test_get_module_policy(self):
+        with pytest.raises(ValueError, match="is a module"):
+            policy.get_policy("numeric")
+
+    @pytest.mark.parametrize(
+        "args, kwargs",
+        [
+            (("bad",), {}),
+            (("sample",), {}),
+            (("off", "other"), {}),
+            (("off", "numeric.missing"), {}),
+            (("off",), {"every": 2}),
+        ],
+    )
+    def test_invalid(self, args, kwargs):
+        with pytest.raises(ValueError):
+            policy.set_policy(*args, **kwargs)
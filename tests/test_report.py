@@ -0,0 +1,118 @@
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from scicheck import _message
+from scicheck.errors import CannotConvertToInt, NotTypeError, ScicheckError
+from scicheck.report import Failure, ValidationReport
+
+EQUAL = [1, 1.0, True, (1,), (1.0,), (True,)]
+
+
+@pytest.fixture
+def report() -> ValidationReport:
+    report = ValidationReport()
+    for index, value in enumerate(EQUAL):
+        error = ScicheckError(_message.not_type, "input", "str", value)
+        report.add(index, "input", error, value)
+    return report
+
+
+class TestInterning:
+    def test_values_keep_their_types(self, report):
+        values = [failure.value for failure in report]
+        assert [type(value) for value in values] == [type(value) for value in EQUAL]
+        assert [type(value[0]) for value in values[3:]] == [int, float, bool]
+
+    def test_arguments_keep_their_types(self, report):
+        arguments = [report.error(k).args[-1] for k in range(len(report))]
+        assert [type(value) for value in arguments] == [type(value) for value in EQUAL]
+
+    def test_repeated_values_are_shared(self):
+        report = ValidationReport()
+        for index in range(2):
+            report.add(index, "input", ScicheckError(None), Decimal("1.5"))
+        assert report[0].value is report[1].value
+
+    def test_pickled(self, report):
+        values = [failure.value for failure in pickle.loads(pickle.dumps(report))]
+        assert [type(value) for value in values] == [type(value) for value in EQUAL]
+
+
+class TestRecording:
+    def test_empty(self):
+        report = ValidationReport()
+        assert len(report) == 0
+        assert not report
+        assert repr(report) == "ValidationReport(0 failures)"
+        assert report.counts() == {}
+        report.raise_first()
+
+    def test_failures(self, report):
+        assert len(report) == len(EQUAL)
+        assert report
+        failure = report[0]
+        assert isinstance(failure, Failure)
+        assert failure == (0, "input", ScicheckError, 1)
+        assert failure.index == 0
+        assert failure.field == "input"
+
+    def test_truncates_values(self):
+        report = ValidationReport(max_length=3)
+        report.add(0, "input", ScicheckError("fixed"), "abcdef")
+        report.add(1, "input", ScicheckError("fixed"), [1, 2])
+        assert report[0].value == "abc..."
+        assert report[1].value == "[1,..."
+
+    def test_counts(self):
+        report = ValidationReport()
+        for index in range(3):
+            report.add(index, "input", NotTypeError("fixed"))
+        report.add(3, "input", CannotConvertToInt("fixed"))
+        assert report.counts() == {NotTypeError: 3, CannotConvertToInt: 1}
+
+    def test_extend(self, report):
+        combined = ValidationReport()
+        combined.extend(report, offset=10)
+        assert [failure.index for failure in combined] == list(range(10, 16))
+        assert str(combined.error(0)) == str(report.error(0))
+
+
+class TestErrors:
+    def test_field_names(self):
+        report = ValidationReport()
+        report.add(0, "dt", ScicheckError(_message.not_type, "dt", "a float"))
+        report.add(1, "row", ScicheckError(_message.not_type, "row[1]", "a float"))
+        report.add(2, "row", ScicheckError(_message.not_type, "row", "a float"))
+        report.add(3, "row", ScicheckError(_message.not_type, "x", "a float"))
+        report.add(
+            4, "row", ScicheckError(_message.not_type, "row", "a float"), indexed=True
+        )
+        names = [report.error(k).name for k in range(len(report))]
+        assert names == ["dt", "row[1]", "row", "x", "row[4]"]
+
+    def test_names_are_not_stored(self):
+        report = ValidationReport()
+        for index in range(3):
+            error = ScicheckError(_message.not_type, f"row[{index}]", "a float")
+            report.add(index, "row", error, indexed=True)
+        assert len(report._argument_table) == 1
+
+    def test_fixed_messages(self):
+        report = ValidationReport()
+        report.add(0, "input", NotTypeError("input must be a float"))
+        report.add(1, "input", NotTypeError())
+        error = report.error(0)
+        assert type(error) is NotTypeError
+        assert str(error) == "input must be a float"
+        assert str(report.error(1)) == ""
+
+    def test_errors(self, report):
+        errors = list(report.errors())
+        assert [index for index, _ in errors] == list(range(len(EQUAL)))
+        assert all(type(error) is ScicheckError for _, error in errors)
+
+    def test_raise_first(self, report):
+        with pytest.raises(ScicheckError, match="input must be"):
+            report.raise_first()
@@ -0,0 +1,108 @@
+import pickle
+
+import pytest
+
+from scicheck import Schema, numeric, path
+from scicheck.errors import (
+    CannotConvertToInt,
+    MissingFieldError,
+    NotRecordError,
+    NotTypeError,
+    UnknownFieldError,
+)
+
+
+@pytest.fixture
+def schema() -> Schema:
+    fields = {"count": numeric.integer, "scale": numeric.real, "grid": {"n": int}}
+    return Schema(fields, "config", optional=["scale"])
+
+
+class TestCall:
+    def test_valid(self, schema):
+        record = {"count": 2.0, "scale": 1, "grid": {"n": 3}, "extra": "x"}
+        output = schema(record)
+        assert output == {"count": 2, "scale": 1, "grid": {"n": 3}, "extra": "x"}
+        assert type(output["count"]) is int
+        assert record["count"] == 2.0
+
+    def test_optional(self, schema):
+        assert schema({"count": 1, "grid": {"n": 1}}) == {"count": 1, "grid": {"n": 1}}
+
+    def test_missing(self, schema):
+        with pytest.raises(MissingFieldError, match="count"):
+            schema({"grid": {"n": 1}})
+
+    def test_names_fields(self, schema):
+        with pytest.raises(CannotConvertToInt, match="count"):
+            schema({"count": 1.5, "grid": {"n": 1}})
+        with pytest.raises(NotTypeError, match=r"grid\.n"):
+            schema({"count": 1, "grid": {"n": 1.5}})
+
+    def test_not_record(self, schema):
+        with pytest.raises(NotRecordError, match="config"):
+            schema([1])
+        with pytest.raises(NotRecordError, match=r"grid"):
+            schema({"count": 1, "grid": 5})
+
+    def test_allow_extra(self):
+        schema = Schema({"a": int}, allow_extra=False)
+        assert schema({"a": 1}) == {"a": 1}
+        with pytest.raises(UnknownFieldError, match="b"):
+            schema({"a": 1, "b": 2})
+
+    def test_nested_schemas_keep_their_options(self):
+        inner = Schema({"a": int, "b": int}, optional=["b"], allow_extra=False)
+        schema = Schema({"inner": inner})
+        assert schema({"inner": {"a": 1}}) == {"inner": {"a": 1}}
+        with pytest.raises(UnknownFieldError):
+            schema({"inner": {"a": 1, "c": 1}})
+
+    def test_checkers(self, tmp_path):
+        fields = {"file": path.path, "kind": (int, str), "any": lambda x, name: x}
+        schema = Schema(fields)
+        record = {"file": str(tmp_path), "kind": "a", "any": None}
+        assert schema(record) == {"file": tmp_path, "kind": "a", "any": None}
+
+    def test_invalid_schema(self):
+        with pytest.raises(TypeError, match="not a checker"):
+            Schema({"a": 5})
+        with pytest.raises(TypeError, match="not in the schema"):
+            Schema({"a": int}, optional=["b"])
+
+
+class TestCollect:
+    def test_valid(self, schema):
+        record = {"count": 1, "grid": {"n": 1}}
+        assert schema.validate(record) == record
+        assert schema.validate(record, collect=True) == (record, {})
+
+    def test_errors(self, schema):
+        record = {"count": 1.5, "scale": 1, "grid": {"n": 1.5}}
+        output, errors = schema.validate(record, collect=True)
+        assert output == {"scale": 1, "grid": {}}
+        assert list(errors) == ["count", "grid.n"]
+        assert isinstance(errors["count"], CannotConvertToInt)
+
+    def test_record_errors(self, schema):
+        output, errors = schema.validate([1], collect=True)
+        assert output == {}
+        assert isinstance(errors["config"], NotRecordError)
+
+        output, errors = schema.validate({"grid": 5}, collect=True)
+        assert output == {}
+        assert isinstance(errors["count"], MissingFieldError)
+        assert isinstance(errors["grid"], NotRecordError)
+
+    def test_extra(self):
+        schema = Schema({"a": int}, "row", allow_extra=False)
+        output, errors = schema.validate({"a": 1, "b": 2}, collect=True)
+        assert output == {"a": 1}
+        assert isinstance(errors["row"], UnknownFieldError)
+
+
+class TestPickle:
+    def test_round_trip(self, schema):
+        copy = pickle.loads(pickle.dumps(schema))
+        assert repr(copy) == repr(schema)
+        assert copy({"count": 1.0, "grid": {"n": 1}})["count"] == 1
@@ -0,0 +1,209 @@
+from typing import Annotated
+
+import pytest
+
+from scicheck import numeric, type
+from scicheck.errors import (
+    CannotConvertToType,
+    IsNaNError,
+    NotFloatError,
+    NotStringError,
+    NotTypeError,
+    ScicheckError,
+)
+from scicheck.validator import compile, validate
+
+
+class TestCompileTypes:
+    def test_strict(self):
+        check = compile((int, str), "x")
+        assert check(1) == 1
+        assert check("a") == "a"
+        with pytest.raises(NotTypeError, match="x must be a int or str"):
+            check(1.5)
+
+    def test_unions(self):
+        check = compile(int | float | str, "x")
+        assert check(1.5) == 1.5
+        with pytest.raises(NotTypeError, match="x must be a int, float, or str"):
+            check(None)
+
+    def test_description(self):
+        check = compile(int, "x", "whole number")
+        with pytest.raises(NotTypeError, match="x must be a whole number"):
+            check(1.5)
+
+    def test_convert(self):
+        check = compile(int, "x", strict=False)
+        assert check("12") == 12
+        with pytest.raises(CannotConvertToType, match="x cannot be converted") as error:
+            check("abc")
+        assert isinstance(error.value.__cause__, ValueError)
+
+    def test_converter(self):
+        check = compile(float, strict=False, converter=lambda input: 2.0)
+        assert check(1.5) == 1.5
+        assert check("abc") == 2.0
+
+    def test_custom_errors(self):
+        class Error(NotTypeError):
+            pass
+
+        with pytest.raises(Error):
+            compile(int, NotTypeError=Error)("a")
+
+    def test_unexpected_options(self):
+        with pytest.raises(TypeError, match="allow_nan"):
+            compile(float, allow_nan=True)
+
+
+class TestCompileCheckers:
+    def test_options_and_name(self):
+        check = compile(numeric.float, "dt", numeric_only=False)
+        assert check("1.5") == 1.5
+        with pytest.raises(ScicheckError, match="dt"):
+            check("abc")
+
+    def test_strict(self):
+        check = compile(numeric.float, "dt", strict=True)
+        with pytest.raises(NotFloatError):
+            check(1)
+        assert compile(type.string, strict=False)(1) == "1"
+
+    @pytest.mark.parametrize(
+        "checker, options, types",
+        [
+            (numeric.numeric, {}, (int, float, complex)),
+            (numeric.complex, {}, (complex,)),
+            (numeric.float, {}, (float,)),
+            (numeric.integer, {}, (int,)),
+            (numeric.real, {}, (int,)),
+            (numeric.real, {"allow_nan": True, "allow_inf": True}, (int, float)),
+            (type.string, {}, (str,)),
+            (type.type, {"types": [int, str]}, (int, str)),
+            (numeric.positive, {}, ()),
+        ],
+    )
+    def test_passthrough_types(self, checker, options, types):
+        assert compile(checker, **options).types == types
+
+    def test_checks_other_inputs(self):
+        check = compile(numeric.real, "x")
+        assert check(1.5) == 1.5
+        with pytest.raises(IsNaNError, match="x"):
+            check(float("nan"))
+        with pytest.raises(NotStringError):
+            compile(type.string)(1)
+
+    @pytest.mark.parametrize("option", ["converter", "description"])
+    def test_unsupported_options(self, option):
+        with pytest.raises(ValueError):
+            compile(numeric.real, **{option: float})
+
+
+class Even:
+    "A checker that is not a function"
+
+    def __call__(self, input, name="input"):
+        if input % 2:
+            raise ScicheckError(f"{name} must be even")
+        return input
+
+
+class TestValidate:
+    def test_specs(self):
+        @validate(x=numeric.real, n=int, label=compile(str, "label"), k=Even())
+        def f(x, n, label, k):
+            return x, n, label, k
+
+        assert f(1.5, 2, "a", 4) == (1.5, 2, "a", 4)
+        with pytest.raises(IsNaNError, match="x"):
+            f(float("nan"), 2, "a", 4)
+        with pytest.raises(NotTypeError, match="n must be"):
+            f(1.5, 2.5, "a", 4)
+        with pytest.raises(NotTypeError, match="label must be"):
+            f(1.5, 2, 1, 4)
+        with pytest.raises(ScicheckError, match="k must be even"):
+            f(1.5, 2, "a", 3)
+
+    def test_defaults_are_not_validated(self):
+        @validate
+        def f(x: Annotated[float, numeric.real] = None):
+            return x
+
+        assert f() is None
+        assert f(1.5) == 1.5
+        with pytest.raises(IsNaNError):
+            f(float("nan"))
+
+    def test_parameter_kinds(self):
+        @validate
+        def f(a, /, *args, b: Annotated[float, numeric.real], **kwargs):
+            return a, args, b, kwargs
+
+        assert f(1, 2, b=3, c=4) == (1, (2,), 3, {"c": 4})
+        with pytest.raises(IsNaNError, match="b"):
+            f(1, b=float("nan"))
+
+    def test_unvalidated_functions(self):
+        def f(x: float):
+            "Has no checkers"
+
+        assert validate(f) is f
+
+    def test_variadic_parameters(self):
+        with pytest.raises(TypeError, match="variadic parameter args"):
+
+            @validate(args=numeric.real)
+            def f(*args):
+                "Never defined"
+
+    def test_unknown_parameters(self):
+        with pytest.raises(TypeError, match="no parameters named: y"):
+
+            @validate(y=numeric.real)
+            def f(x):
+                "Never defined"
+
+    def test_bad_spec(self):
+        with pytest.raises(TypeError, match="not a checker"):
+
+            @validate(x=5)
+            def f(x):
+                "Never defined"
+
+
+class TestUnresolvedAnnotations:
+    def test_other_parameters_are_validated(self):
+        @validate
+        def f(x: Annotated[float, numeric.real], y: "Undefined" = None):
+            return x
+
+        assert f(1.5) == 1.5
+        with pytest.raises(ScicheckError):
+            f("abc")
+
+    def test_unresolved_checker_raises(self):
+        with pytest.raises(TypeError, match="x"):
+
+            @validate
+            def f(x: "Annotated[float, Undefined]"):
+                "Never defined"
+
+    def test_spec_overrides_unresolved_checker(self):
+        @validate(x=numeric.real)
+        def f(x: "Annotated[float, Undefined]", y: "Undefined" = None):
+            return x
+
+        assert f(1.5) == 1.5
+        with pytest.raises(ScicheckError):
+            f("abc")
+
+    def test_string_annotations(self):
+        @validate
+        def f(x: "Annotated[float, numeric.real]", y: "Undefined" = None):
+            return x
+
+        assert f(1.5) == 1.5
+        with pytest.raises(ScicheckError):
+            f("abc")